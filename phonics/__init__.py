@@ -0,0 +1,8 @@
+"""Content toolchain for the Reading Phonics App word bank.
+
+Run ``python -m phonics --help`` to list the available commands. Modules in
+this package keep heavy imports (openpyxl and friends) inside the functions
+that need them so that quick commands start fast.
+"""
+
+__version__ = '2.0.0'
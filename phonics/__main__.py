@@ -0,0 +1,3 @@
+from phonics.cli import main
+
+raise SystemExit(main())
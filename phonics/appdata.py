@@ -0,0 +1,61 @@
+"""Read the app's own data modules (``src/data/*.ts``) from Python.
+
+Only the literal layouts those files use are supported: one object per pack
+with ``id``, ``category``, ``subPack``, ``words`` and ``description`` fields,
+and a flat ``key: ['syl', 'la', 'bles']`` syllable dictionary.
+"""
+
+import ast
+import re
+
+from phonics import config
+from phonics.model import WORDS, Pack
+from phonics.words import strip_pack_number
+
+STRING = r"'(?:[^'\\\n]|\\.)*'|\"(?:[^\"\\\n]|\\.)*\""
+PACK_BLOCK = re.compile(r'^  \{\n(.*?)^  \}', re.M | re.S)
+FIELD = re.compile(r'^    (\w+): (' + STRING + r'|\d+|\[(?:[^\]]|\n)*?\])', re.M)
+STRINGS = re.compile(STRING)
+SYLLABLE_ENTRY = re.compile(r'^  (\w+|' + STRING + r'): \[([^\]]*)\]', re.M)
+
+
+def _literal(token):
+    """Value of a TypeScript string or number literal."""
+    return ast.literal_eval(token)
+
+
+def _string_list(text):
+    return [_literal(s) for s in STRINGS.findall(text)]
+
+
+def read_word_packs(path=None, table=WORDS):
+    """Packs from ``src/data/wordPacks.ts``."""
+    with open(path or config.WORD_PACKS_TS, 'r', encoding='utf-8') as f:
+        source = f.read()
+
+    packs = []
+    for block in PACK_BLOCK.findall(source):
+        fields = dict(FIELD.findall(block))
+        title = _literal(fields['category'])
+        packs.append(Pack.from_words(
+            _literal(fields['id']),
+            title,
+            _literal(fields['description']) if 'description' in fields else None,
+            strip_pack_number(title),
+            _string_list(fields['words']),
+            table=table,
+            sub_pack=_literal(fields['subPack']) if 'subPack' in fields else None,
+        ))
+    return packs
+
+
+def read_syllable_dictionary(path=None):
+    """``{word: [syllables]}`` from ``src/data/syllableDictionary.ts``."""
+    with open(path or config.SYLLABLE_DICTIONARY_TS, 'r', encoding='utf-8') as f:
+        source = f.read()
+
+    entries = {}
+    for key, syllables in SYLLABLE_ENTRY.findall(source):
+        word = _literal(key) if key[0] in '\'"' else key
+        entries[word] = _string_list(syllables)
+    return entries
@@ -0,0 +1,117 @@
+"""Pre-render word audio for the app with an offline TTS engine.
+
+Every pack word in ``src/data/wordPacks.ts`` and every syllable in
+``src/data/syllableDictionary.ts`` is rendered once with espeak-ng. Clips are
+named by a hash of the engine settings and the text, so re-running only renders
+words that are new (or all of them, if the voice or speed changes). A
+``manifest.json`` next to the clips maps each text to its clip; the app plays
+the clip when there is one and falls back to live speech synthesis otherwise.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+
+from phonics import config
+from phonics.appdata import read_syllable_dictionary, read_word_packs
+from phonics.export import write_if_changed
+from phonics.trace import count, span
+
+ENGINE = 'espeak-ng'
+VOICE = 'en-gb'
+SPEED = 140  # words per minute; espeak-ng's default of 175 is quick for early readers
+MANIFEST = 'manifest.json'
+
+
+def clip_name(text, voice=VOICE, speed=SPEED):
+    """Content-addressed file name for ``text`` rendered with these settings."""
+    key = '\0'.join((ENGINE, voice, str(speed), text))
+    return hashlib.sha256(key.encode('utf-8')).hexdigest()[:20] + '.wav'
+
+
+def collect_texts(packs, syllables):
+    """Unique texts to render: pack words first, then dictionary syllables."""
+    texts = {}
+    for pack in packs:
+        for word in pack.words:
+            texts.setdefault(word, None)
+    for parts in syllables.values():
+        for part in parts:
+            texts.setdefault(part, None)
+    return list(texts)
+
+
+def render_clip(text, path, voice=VOICE, speed=SPEED):
+    """Render ``text`` to ``path`` via a temporary file so partial clips never land."""
+    tmp = path + '.tmp'
+    subprocess.run(
+        [ENGINE, '-v', voice, '-s', str(speed), '-w', tmp, '--', text],
+        check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+    )
+    os.replace(tmp, path)
+
+
+def render_all(texts, out_dir, voice=VOICE, speed=SPEED, jobs=None):
+    """Render any missing clips. Returns ``({text: clip}, rendered count)``."""
+    os.makedirs(out_dir, exist_ok=True)
+    clips = {text: clip_name(text, voice, speed) for text in texts}
+    missing = [text for text, name in clips.items()
+               if not os.path.exists(os.path.join(out_dir, name))]
+
+    # espeak-ng runs as a child process, so threads are enough to keep every core busy
+    with span('render clips'), ThreadPoolExecutor(jobs or os.cpu_count()) as pool:
+        list(pool.map(
+            lambda text: render_clip(text, os.path.join(out_dir, clips[text]), voice, speed),
+            missing,
+        ))
+    count('clips rendered', len(missing))
+    return clips, len(missing)
+
+
+def prune(out_dir, keep):
+    """Delete clips in ``out_dir`` that are no longer referenced. Returns the count removed."""
+    removed = 0
+    for name in os.listdir(out_dir):
+        if name.endswith('.wav') and name not in keep:
+            os.remove(os.path.join(out_dir, name))
+            removed += 1
+    return removed
+
+
+def render_manifest(clips, voice=VOICE, speed=SPEED):
+    return json.dumps({
+        'engine': ENGINE,
+        'voice': voice,
+        'speed': speed,
+        'clips': dict(sorted(clips.items())),
+    }, indent=2, ensure_ascii=False) + '\n'
+
+
+def run(args):
+    if shutil.which(ENGINE) is None:
+        print(f"{ENGINE} not found on PATH; install it to pre-render audio")
+        return 1
+
+    packs = read_word_packs()
+    syllables = read_syllable_dictionary()
+    texts = collect_texts(packs, syllables)
+    print(f"{len(texts)} texts from {len(packs)} packs and {len(syllables)} syllable entries")
+
+    out_dir = str(args.output or config.AUDIO_DIR)
+    try:
+        clips, rendered = render_all(texts, out_dir, args.voice, args.speed, args.jobs)
+    except subprocess.CalledProcessError as e:
+        print(f"{ENGINE} failed: {e.stderr.decode(errors='replace').strip()}")
+        return 1
+    print(f"Rendered {rendered} clips ({len(clips) - rendered} cached)")
+
+    if args.prune:
+        print(f"Removed {prune(out_dir, set(clips.values()))} unused clips")
+
+    manifest = os.path.join(out_dir, MANIFEST)
+    if write_if_changed(manifest, render_manifest(clips, args.voice, args.speed)):
+        print(f"Saved {manifest}")
+    return 0
@@ -0,0 +1,16 @@
+"""Hand-maintained word banks that can be written out as the workbook.
+
+Each bank module defines ``WORD_BANK`` as ``(category, description, words)``
+rows plus the sheet layout it was originally saved with.
+"""
+
+import importlib
+
+BANK_NAMES = ('comprehensive', 'phonics', 'segmented', 'split')
+
+
+def load_bank(name):
+    """Import a bank module by name."""
+    if name not in BANK_NAMES:
+        raise ValueError(f"Unknown word bank: {name!r} (choose from {', '.join(BANK_NAMES)})")
+    return importlib.import_module(f'{__name__}.{name}')
@@ -1,30 +1,15 @@
-from openpyxl import Workbook
-from openpyxl.styles import Font, PatternFill, Alignment
-
-wb = Workbook()
-ws = wb.active
-ws.title = "Complete Phonics Word Bank"
-
-# Headers
-ws['A1'] = "Category"
-ws['B1'] = "Pattern/Description"
-ws['C1'] = "Example Words"
-
-# Style headers
-header_fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
-header_font = Font(bold=True, color="FFFFFF", size=12)
-for cell in ['A1', 'B1', 'C1']:
-    ws[cell].fill = header_fill
-    ws[cell].font = header_font
-    ws[cell].alignment = Alignment(horizontal='center', vertical='center')
-
-# Set column widths
-ws.column_dimensions['A'].width = 30
-ws.column_dimensions['B'].width = 35
-ws.column_dimensions['C'].width = 100
+"""Comprehensive word bank: the original lists merged with the Jolly Phonics lists.
+
+Build it into the workbook with ``python -m phonics build comprehensive``.
+"""
+
+SHEET_TITLE = "Complete Phonics Word Bank"
+HEADERS = ("Category", "Pattern/Description", "Example Words")
+COLUMN_WIDTHS = (30, 35, 100)
+CATEGORY_FONT_SIZE = 11
 
 # COMPREHENSIVE Word bank data - merging original + Jolly Phonics
-word_bank = [
+WORD_BANK = [
     # HIGH FREQUENCY WORDS (100 words - Year 1)
     ("0A. YEAR 1 HIGH FREQUENCY", "100 words to know by end of Year 1", "the, that, not, look, put, and, with, then, don't, could, a, all, were, come, house, to, we, go, will, old, said, can, little, into, too, in, are, as, back, by, he, up, no, from, day, I, had, mum, children, made, of, my, one, him, time, it, her, them, Mr, I'm, was, what, do, get, if, you, there, me, just, help, they, out, down, now, Mrs, on, this, dad, came, called, she, have, big, oh, here, is, went, when, about, off, for, be, it's, got, asked, at, like, see, their, saw, his, some, looked, people, make, but, so, very, your, an"),
 
@@ -141,26 +126,4 @@ word_bank = [
     # ADVANCED VOCABULARY (expanded)
     ("13. ADVANCED WORDS", "complex real-world words", "photosynthesis, metamorphosis, democracy, geography, biography, autobiography, telescope, microscope, telephone, symphony, pharmacy, philosophy, catastrophe, apostrophe, atmosphere, hemisphere, thermometer, chronometer, architecture, agriculture, manufacture, literature, temperature, adventure, creature, feature, furniture, measure, treasure, pleasure, picture, nature, capture, experiment, hypothesis, laboratory, molecule, nucleus, chromosome, ecosystem, environment, biodiversity, respiration, evaporation, precipitation, constellation, dinosaur, archaeology, paleontology, geology, meteorology, astronomy, biology, chemistry, physics, mathematics, calculation, equation, fraction, multiplication, division"),
 
-]
-
-# Add data to sheet
-row = 2
-for category, pattern, words in word_bank:
-    ws[f'A{row}'] = category
-    ws[f'B{row}'] = pattern
-    ws[f'C{row}'] = words
-
-    # Style category cells
-    ws[f'A{row}'].font = Font(bold=True, size=11)
-    ws[f'A{row}'].fill = PatternFill(start_color="E7E6E6", end_color="E7E6E6", fill_type="solid")
-
-    # Wrap text for words column
-    ws[f'C{row}'].alignment = Alignment(wrap_text=True, vertical='top')
-
-    row += 1
-
-# Save the workbook
-wb.save("C:\\Users\\mqc20\\Downloads\\Projects\\Reading app\\Phonics_Word_Bank.xlsx")
-print("Complete Excel file created successfully!")
-print(f"Total categories: {len(word_bank)}")
-print(f"File: Phonics_Word_Bank.xlsx")
+]
\ No newline at end of file
@@ -1,30 +1,15 @@
-from openpyxl import Workbook
-from openpyxl.styles import Font, PatternFill, Alignment
-
-wb = Workbook()
-ws = wb.active
-ws.title = "Reading Word Bank"
-
-# Headers
-ws['A1'] = "Category"
-ws['B1'] = "Pattern/Description"
-ws['C1'] = "Words (10-30 per section)"
-
-# Style headers
-header_fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
-header_font = Font(bold=True, color="FFFFFF", size=12)
-for cell in ['A1', 'B1', 'C1']:
-    ws[cell].fill = header_fill
-    ws[cell].font = header_font
-    ws[cell].alignment = Alignment(horizontal='center', vertical='center')
-
-# Set column widths
-ws.column_dimensions['A'].width = 35
-ws.column_dimensions['B'].width = 40
-ws.column_dimensions['C'].width = 90
+"""Segmented word bank: smaller sections of 10-30 words, some with syllable hyphens.
+
+Build it into the workbook with ``python -m phonics build segmented``.
+"""
+
+SHEET_TITLE = "Reading Word Bank"
+HEADERS = ("Category", "Pattern/Description", "Words (10-30 per section)")
+COLUMN_WIDTHS = (35, 40, 90)
+CATEGORY_FONT_SIZE = 10
 
 # SEGMENTED Word bank - smaller, manageable chunks
-word_bank = [
+WORD_BANK = [
     # ========== HIGH FREQUENCY WORDS - BROKEN INTO CHUNKS ==========
     ("0A. YEAR 1 HF WORDS (1-25)", "First 25 high frequency words", "the, a, to, I, and, he, of, it, was, said, in, his, is, for, on, are, as, with, they, be, at, this, have, from, or"),
 
@@ -203,26 +188,4 @@ word_bank = [
 
     ("12B. Y as /ee/ - More", "More y endings", "ver-y, man-y, an-y, pret-ty, cit-y, emp-ty, dirt-y, dus-ty, wind-y, cloud-y, rain-y, snow-y, ear-ly"),
 
-]
-
-# Add data to sheet
-row = 2
-for category, pattern, words in word_bank:
-    ws[f'A{row}'] = category
-    ws[f'B{row}'] = pattern
-    ws[f'C{row}'] = words
-
-    # Style category cells
-    ws[f'A{row}'].font = Font(bold=True, size=10)
-    ws[f'A{row}'].fill = PatternFill(start_color="E7E6E6", end_color="E7E6E6", fill_type="solid")
-
-    # Wrap text for words column
-    ws[f'C{row}'].alignment = Alignment(wrap_text=True, vertical='top')
-
-    row += 1
-
-# Save the workbook
-wb.save("C:\\Users\\mqc20\\Downloads\\Projects\\Reading app\\Phonics_Word_Bank.xlsx")
-print("Segmented Excel file created successfully!")
-print(f"Total sections: {len(word_bank)}")
-print("Each section has 10-30 words max for easier progress tracking")
+]
\ No newline at end of file
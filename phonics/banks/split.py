@@ -1,39 +1,16 @@
-from openpyxl import Workbook
-from openpyxl.styles import Font, PatternFill, Alignment
+"""Split word bank: the original lists with large sections split into ~35 words.
 
-def split_words(word_string, max_words=30):
-    """Split a comma-separated word string into chunks of max_words"""
-    words = [w.strip() for w in word_string.split(',')]
-    chunks = []
-    for i in range(0, len(words), max_words):
-        chunk = words[i:i + max_words]
-        chunks.append(', '.join(chunk))
-    return chunks
+Build it into the workbook with ``python -m phonics build split``.
+"""
 
-wb = Workbook()
-ws = wb.active
-ws.title = "Complete Word Bank"
-
-# Headers
-ws['A1'] = "Category"
-ws['B1'] = "Pattern/Description"
-ws['C1'] = "Words"
-
-# Style headers
-header_fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
-header_font = Font(bold=True, color="FFFFFF", size=12)
-for cell in ['A1', 'B1', 'C1']:
-    ws[cell].fill = header_fill
-    ws[cell].font = header_font
-    ws[cell].alignment = Alignment(horizontal='center', vertical='center')
-
-# Set column widths
-ws.column_dimensions['A'].width = 35
-ws.column_dimensions['B'].width = 40
-ws.column_dimensions['C'].width = 90
+SHEET_TITLE = "Complete Word Bank"
+HEADERS = ("Category", "Pattern/Description", "Words")
+COLUMN_WIDTHS = (35, 40, 90)
+CATEGORY_FONT_SIZE = 10
+SPLIT_SIZE = 35
 
 # Original comprehensive word bank
-original_wordbank = [
+ORIGINAL_WORD_BANK = [
     ("0A. YEAR 1 HIGH FREQUENCY", "100 words to know by end of Year 1", "the, that, not, look, put, and, with, then, don't, could, a, all, were, come, house, to, we, go, will, old, said, can, little, into, too, in, are, as, back, by, he, up, no, from, day, I, had, mum, children, made, of, my, one, him, time, it, her, them, Mr, I'm, was, what, do, get, if, you, there, me, just, help, they, out, down, now, Mrs, on, this, dad, came, called, she, have, big, oh, here, is, went, when, about, off, for, be, it's, got, asked, at, like, see, their, saw, his, some, looked, people, make, but, so, very, your, an"),
     ("0B. YEAR 2 COMMON EXCEPTION", "64 statutory words for Year 2", "door, floor, poor, because, find, kind, mind, behind, child, children, wild, climb, most, only, both, old, cold, gold, hold, told, every, everybody, even, great, break, steak, pretty, beautiful, after, fast, last, past, father, class, grass, pass, plant, path, bath, hour, move, prove, improve, sure, sugar, eye, could, should, would, who, whole, any, many, clothes, busy, people, water, again, half, money, Mr, Mrs, parents, Christmas"),
     ("0C. YEAR 3/4 COMMON EXCEPTION", "100 statutory words for Years 3 & 4", "accident, accidentally, actual, actually, address, answer, appear, arrive, believe, bicycle, breath, breathe, build, busy, business, calendar, caught, centre, century, certain, circle, complete, consider, continue, decide, describe, different, difficult, disappear, early, earth, eight, eighth, enough, exercise, experience, experiment, extreme, famous, favourite, February, forward, forwards, fruit, grammar, group, guard, guide, heard, heart, height, history, imagine, increase, important, interest, island, knowledge, learn, length, library, material, medicine, mention, minute, natural, naughty, notice, occasion, occasionally, often, opposite, ordinary, particular, peculiar, perhaps, popular, position, possess, possession, possible, potatoes, pressure, probably, promise, purpose, quarter, question, recent, regular, reign, remember, sentence, separate, special, straight, strange, strength, suppose, surprise, therefore, though, although, thought, through, various, weight"),
@@ -47,29 +24,10 @@ original_wordbank = [
     ("2. R-BLENDS", "br, cr, dr, fr, gr, pr, tr", "brave, brick, bring, brown, brush, crab, crash, cry, crack, crown, drag, drip, drop, drum, dress, drab, drill, frog, free, fresh, from, frost, frill, frank, frantic, grab, grass, green, grin, grip, grim, gram, pray, press, print, prize, prod, prim, trap, tree, trip, track, truck, tram, trot, trim"),
     ("2. S-BLENDS", "sc, sk, sm, sn, sp, st, sw", "scale, scare, scan, scrap, skip, skate, skill, sky, skull, skid, small, smell, smile, smart, smoke, smack, snack, snap, snake, snail, snow, snag, snip, space, spin, spot, spell, spill, stack, star, stop, step, stick, stamp, stem, swim, swing, sweet, swept, swift, swell"),
     ("2. 3-LETTER BLENDS", "scr, spr, str, spl, thr", "scrap, scrub, screen, screw, scrape, spray, spring, spread, sprain, sprout, strap, street, string, strong, stream, strip, split, splash, splint, splendid, three, throw, through, throat, throne"),
-    # I'll continue building the rest below...
 ]
 
-# Now split large sections
-split_wordbank = []
-for category, pattern, words in original_wordbank:
-    word_chunks = split_words(words, max_words=35)  # 35 words per section
-
-    if len(word_chunks) == 1:
-        # Small enough, keep as is
-        split_wordbank.append((category, pattern, words))
-    else:
-        # Split into parts
-        for idx, chunk in enumerate(word_chunks, 1):
-            new_category = f"{category} (Part {idx}/{len(word_chunks)})"
-            new_pattern = f"{pattern} - Part {idx}"
-            split_wordbank.append((new_category, new_pattern, chunk))
-
-# Continue with rest of data - I need to copy ALL from comprehensive file
-# Adding remaining categories from the comprehensive version...
-
-# Add all the rest of the comprehensive wordbank data here
-additional_data = [
+# Remaining categories from the comprehensive version
+ADDITIONAL_DATA = [
     ("3. DIGRAPH CH", "ch makes /ch/ sound", "chin, chap, chips, rich, chop, chum, chat, much, punch, bench, bunch, lunch, chill, such, chick, munch, pinch, chimp, chest, check, champ, chug, chain, cheek, cheer, crunch, torch, coach, chimpanzee, ostrich, chopsticks, sandwich, children, chicken, chickenpox, cheese, catch, hatch, match, fetch, stretch, itch, ditch, witch, stitch, switch, hutch, choose, chuckle, scratch, kitchen, snatch, duchess, hunch, inch, chaffinch, chess, poach, porch, screech, speech, trench, drench, finch, chump, cockroach, twitch, hopscotch, ketchup, patch, pitch, attach, sketch, cheerful, chipmunk, titch, approach, grandchildren, chair, chalk, change, chest, child, church, chapter, chocolate, champion"),
     ("3. DIGRAPH SH", "sh makes /sh/ sound", "fish, shop, dish, wish, ship, hush, rush, shed, shut, rash, mash, cash, dash, shell, shot, shelf, shock, shook, brush, smash, crash, flash, flush, shoot, sheep, sheet, short, shall, shrimps, splash, finish, eggshell, paintbrush, punish, rubbish, shampoo, bookshop, mushroom, shopping, shocking, goldfish, ash, shin, shift, shrug, shrink, shrank, shrunk, flesh, polish, posh, publish, selfish, shellfish, sheriff, shred, shrill, slush, vanish, blush, crush, refresh, astonish, astonishing, shape, shake, share, shark, sharp, shine, shirt, shout, shrink"),
     ("3. DIGRAPH TH (voiced)", "th as in this/that", "this, that, then, with, them, than, within"),
@@ -78,37 +36,4 @@ additional_data = [
     ("3. DIGRAPH PH", "ph makes /f/ sound", "dolphin, phone, nephew, sphere, phonics, alphabet, elephant, orphan, photo, telephone, photograph, photographer, alphabetical, photocopy, trophy, autograph, prophet, phantom, phrase, paragraph, amphibian, physical, triumph, microphone, telegraph pole, hyphen, phase, graph, pharmacy, philosopher, physician, geography, biography"),
 ]
 
-# Split these too
-for category, pattern, words in additional_data:
-    word_chunks = split_words(words, max_words=35)
-
-    if len(word_chunks) == 1:
-        split_wordbank.append((category, pattern, words))
-    else:
-        for idx, chunk in enumerate(word_chunks, 1):
-            new_category = f"{category} (Part {idx}/{len(word_chunks)})"
-            new_pattern = f"{pattern} - Part {idx}"
-            split_wordbank.append((new_category, new_pattern, chunk))
-
-# Add data to sheet
-row = 2
-for category, pattern, words in split_wordbank:
-    ws[f'A{row}'] = category
-    ws[f'B{row}'] = pattern
-    ws[f'C{row}'] = words
-
-    # Style category cells
-    ws[f'A{row}'].font = Font(bold=True, size=10)
-    ws[f'A{row}'].fill = PatternFill(start_color="E7E6E6", end_color="E7E6E6", fill_type="solid")
-
-    # Wrap text for words column
-    ws[f'C{row}'].alignment = Alignment(wrap_text=True, vertical='top')
-
-    row += 1
-
-# Save the workbook
-wb.save("C:\\Users\\mqc20\\Downloads\\Projects\\Reading app\\Phonics_Word_Bank.xlsx")
-print(f"Split word bank created!")
-print(f"Total sections: {len(split_wordbank)}")
-print("Large sections split into ~35 words each")
-print("NO words deleted, NO hyphens added")
+WORD_BANK = ORIGINAL_WORD_BANK + ADDITIONAL_DATA
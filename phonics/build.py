@@ -0,0 +1,39 @@
+"""Write one of the hand-maintained word banks, or a variant of one, out as the workbook."""
+
+from phonics import config
+from phonics.banks import BANK_NAMES, load_bank
+from phonics.split import split_by_size
+from phonics.workbook import write_rows
+
+
+def build_rows(bank, rows=None):
+    """Rows for a bank module (or ``rows`` in its layout), applying its ``SPLIT_SIZE`` if it has one."""
+    rows = bank.WORD_BANK if rows is None else rows
+    split_size = getattr(bank, 'SPLIT_SIZE', None)
+    if split_size:
+        return split_by_size(rows, split_size)
+    return list(rows)
+
+
+def run(args):
+    if args.bank in BANK_NAMES:
+        bank = load_bank(args.bank)
+        rows = build_rows(bank)
+    else:
+        from phonics.variants import VariantError, Variants
+
+        try:
+            variant = Variants(args.variants_dir).get(args.bank)
+        except VariantError as e:
+            print(e)
+            return 1
+        bank = variant.module
+        rows = build_rows(bank, variant.rows())
+    output = args.output or config.WORKBOOK
+    write_rows(output, rows, bank.SHEET_TITLE, headers=bank.HEADERS,
+               widths=bank.COLUMN_WIDTHS, category_font_size=bank.CATEGORY_FONT_SIZE)
+
+    print(f"{args.bank} word bank written")
+    print(f"Total sections: {len(rows)}")
+    print(f"File: {output}")
+    return 0
@@ -0,0 +1,144 @@
+"""Calibrate word difficulty from pupils' marks in ``pack_progress``.
+
+Every ``mastered`` mark counts as a success and every ``tricky`` mark as a
+failure. A Rasch model, P(success) = sigmoid(ability - difficulty), is fitted
+over all of them at once with NumPy: each iteration is a batched Newton step
+for every pupil ability and then every word difficulty, built from
+``bincount`` sums over the attempt arrays, so millions of attempts fit in
+seconds. A small L2 penalty keeps pupils who mastered everything finite.
+
+The fitted difficulties (logits) are mapped linearly onto the heuristic's
+scale (same mean and spread as ``get_difficulty_score``), so the level
+boundaries used by ``split --strategy levels`` keep their meaning, and written
+to ``word_difficulty.json``. ``split --calibrated`` then scores words from the
+table and falls back to the heuristic for words with too few attempts.
+"""
+
+import json
+from array import array
+
+from phonics import config, db
+from phonics.difficulty import get_difficulty_score
+from phonics.features import load_features
+from phonics.trace import count, span
+
+OUTCOMES = {'tricky': 0, 'mastered': 1}
+MIN_ATTEMPTS = 20  # words with fewer marks keep the heuristic score
+ITERATIONS = 100
+TOLERANCE = 1e-4
+L2 = 0.1
+
+PROGRESS_QUERY = 'SELECT user_id, words FROM pack_progress'
+
+
+def read_attempts(rows):
+    """Index pupils and words. Returns ``(users, words, outcomes, n_users, word_list)``."""
+    user_index, word_index = {}, {}
+    users, words, outcomes = array('i'), array('i'), array('b')
+    for user_id, marks in rows:
+        u = user_index.setdefault(user_id, len(user_index))
+        for word, status in (marks or {}).items():
+            outcome = OUTCOMES.get(status)
+            if outcome is None:
+                continue
+            users.append(u)
+            words.append(word_index.setdefault(word.lower(), len(word_index)))
+            outcomes.append(outcome)
+    count('attempts read', len(outcomes))
+    return users, words, outcomes, len(user_index), list(word_index)
+
+
+def fit_rasch(users, words, outcomes, n_users, n_words, iterations=ITERATIONS, l2=L2):
+    """Fit pupil abilities and word difficulties. Returns ``(abilities, difficulties)``."""
+    import numpy as np
+
+    users = np.frombuffer(users, dtype=np.int32)
+    words = np.frombuffer(words, dtype=np.int32)
+    y = np.frombuffer(outcomes, dtype=np.int8).astype(np.float64)
+    ability = np.zeros(n_users)
+    difficulty = np.zeros(n_words)
+
+    for i in range(iterations):
+        p = 1.0 / (1.0 + np.exp(difficulty[words] - ability[users]))
+        gradient = np.bincount(users, y - p, n_users) - l2 * ability
+        ability += gradient / (np.bincount(users, p * (1 - p), n_users) + l2)
+
+        p = 1.0 / (1.0 + np.exp(difficulty[words] - ability[users]))
+        gradient = np.bincount(words, p - y, n_words) - l2 * difficulty
+        step = gradient / (np.bincount(words, p * (1 - p), n_words) + l2)
+        difficulty += step
+        if np.abs(step).max() < TOLERANCE:
+            break
+    count('fit iterations', i + 1)
+
+    # Anchor the scale so the average word sits at 0
+    shift = difficulty.mean()
+    return ability - shift, difficulty - shift
+
+
+def heuristic_scale(word_list, logits, mask, score=get_difficulty_score):
+    """``(intercept, slope)`` giving logits over ``mask`` the heuristic scores' mean and spread."""
+    import numpy as np
+
+    x = logits[mask]
+    scores = np.array([score(w) for w, keep in zip(word_list, mask) if keep], dtype=float)
+    if len(x) < 2 or x.std() == 0:
+        return float(scores.mean()) if len(scores) else 0.0, 0.0
+    slope = scores.std() / x.std()
+    return float(scores.mean() - slope * x.mean()), float(slope)
+
+
+def calibrate(rows, min_attempts=MIN_ATTEMPTS):
+    """Difficulty table (as written to ``word_difficulty.json``) from ``(user_id, words)`` rows."""
+    import numpy as np
+
+    with span('read attempts'):
+        users, words, outcomes, n_users, word_list = read_attempts(rows)
+    if not word_list:
+        return None
+    with span('fit'):
+        _, logits = fit_rasch(users, words, outcomes, n_users, len(word_list))
+
+    attempts = np.bincount(np.frombuffer(words, dtype=np.int32), minlength=len(word_list))
+    mask = attempts >= min_attempts
+    features = load_features(word_list)
+    intercept, slope = heuristic_scale(word_list, logits, mask, features.difficulty)
+    table = {
+        word_list[i]: {
+            'score': round(intercept + slope * float(logits[i]), 2),
+            'logit': round(float(logits[i]), 3),
+            'attempts': int(attempts[i]),
+        }
+        for i in np.flatnonzero(mask)
+    }
+    return {
+        'model': 'rasch',
+        'pupils': n_users,
+        'attempts': len(outcomes),
+        'scale': {'intercept': round(intercept, 4), 'slope': round(slope, 4)},
+        'words': dict(sorted(table.items())),
+    }
+
+
+def run(args):
+    url = db.database_url(args.database)
+    if not url:
+        print('No database: pass --database or set SUPABASE_DB_URL / DATABASE_URL')
+        return 1
+
+    conn = db.connect(url)
+    try:
+        with conn:
+            table = calibrate(db.stream(conn, PROGRESS_QUERY), args.min_attempts)
+    finally:
+        conn.close()
+    if table is None:
+        print('No tricky/mastered marks to calibrate from')
+        return 1
+
+    output = args.output or config.DIFFICULTY_JSON
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(table, f, indent=2, ensure_ascii=False)
+    print(f"Fitted {len(table['words'])} words from {table['attempts']:,} marks by {table['pupils']:,} pupils")
+    print(f"Saved to {output}")
+    return 0
@@ -0,0 +1,201 @@
+"""Printable flash cards and worksheets for the packs, as PDFs.
+
+Each pack becomes one A4 PDF: pages of cut-out cards (eight to a page, the
+word large with its syllable split from ``src/data/syllableDictionary.ts``
+underneath when the dictionary has one), then a worksheet page listing the
+words with a line to copy each one onto.
+
+Packs are rendered with reportlab across a process pool. Every rendered PDF
+is cached under ``config.CACHE_DIR`` by a hash of what is printed on it (the
+layout version, title, words and splits), so after editing one word only
+that pack is rendered again; the rest are copied from the cache. ``--combine``
+also joins the selected packs into one file with pypdf.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+
+from phonics import config
+from phonics.appdata import read_syllable_dictionary, read_word_packs
+from phonics.trace import count, span
+
+# Bump when the layout changes so cached PDFs are rendered again
+LAYOUT_VERSION = 1
+CARD_CACHE = 'cards'
+
+COLUMNS, ROWS = 2, 4
+MARGIN = 36  # points
+FOOTER = 24
+WORD_SIZE = 44
+MIN_WORD_SIZE = 18
+SYLLABLE_SIZE = 16
+WORKSHEET_ROWS = 14
+
+
+def pack_content(pack, syllables):
+    """Everything printed for ``pack``, as plain data for a worker process."""
+    splits = {}
+    for word in pack.words:
+        parts = syllables.get(word.lower())
+        if parts and len(parts) > 1:
+            splits[word] = parts
+    return {'id': pack.id, 'title': pack.title, 'words': pack.words, 'splits': splits}
+
+
+def content_hash(content):
+    key = json.dumps([LAYOUT_VERSION, content], ensure_ascii=False, sort_keys=True)
+    return hashlib.sha256(key.encode('utf-8')).hexdigest()[:20]
+
+
+def _fit(text, font, size, width):
+    """Largest font size up to ``size`` at which ``text`` fits in ``width``."""
+    from reportlab.pdfbase.pdfmetrics import stringWidth
+
+    while size > MIN_WORD_SIZE and stringWidth(text, font, size) > width:
+        size -= 2
+    return size
+
+
+def render_pack(content, path):
+    """Write the cards and worksheet for one pack to ``path``."""
+    from reportlab.lib.pagesizes import A4
+    from reportlab.pdfgen.canvas import Canvas
+
+    page_w, page_h = A4
+    card_w = (page_w - 2 * MARGIN) / COLUMNS
+    card_h = (page_h - 2 * MARGIN - FOOTER) / ROWS
+    words = content['words']
+    per_page = COLUMNS * ROWS
+    card_pages = max(1, -(-len(words) // per_page))
+    sheet_pages = max(1, -(-len(words) // WORKSHEET_ROWS))
+    total = card_pages + sheet_pages
+
+    # invariant: no timestamps or random ids, so the same content gives the same bytes
+    c = Canvas(path, pagesize=A4, invariant=1)
+    c.setTitle(content['title'])
+
+    def footer(page):
+        c.setFont('Helvetica', 9)
+        c.setFillGray(0.4)
+        c.drawString(MARGIN, MARGIN / 2, content['title'])
+        c.drawRightString(page_w - MARGIN, MARGIN / 2, f"{page} / {total}")
+        c.setFillGray(0)
+
+    for page in range(card_pages):
+        c.setDash(4, 4)
+        c.setStrokeGray(0.6)
+        for i, word in enumerate(words[page * per_page:(page + 1) * per_page]):
+            col, row = i % COLUMNS, i // COLUMNS
+            x = MARGIN + col * card_w
+            y = page_h - MARGIN - (row + 1) * card_h
+            c.rect(x, y, card_w, card_h)
+            size = _fit(word, 'Helvetica-Bold', WORD_SIZE, card_w - 24)
+            parts = content['splits'].get(word)
+            c.setFont('Helvetica-Bold', size)
+            c.drawCentredString(x + card_w / 2, y + card_h / 2 - size / 3 + (10 if parts else 0), word)
+            if parts:
+                c.setFont('Helvetica', SYLLABLE_SIZE)
+                c.setFillGray(0.35)
+                c.drawCentredString(x + card_w / 2, y + card_h / 2 - 30, ' · '.join(parts))
+                c.setFillGray(0)
+        c.setDash()
+        footer(page + 1)
+        c.showPage()
+
+    for sheet in range(sheet_pages):
+        c.setFont('Helvetica-Bold', 18)
+        c.drawString(MARGIN, page_h - MARGIN - 18, content['title'])
+        c.setFont('Helvetica', 12)
+        c.drawString(MARGIN, page_h - MARGIN - 40, 'Read each word, then write it on the line.')
+        top = page_h - MARGIN - 70
+        row_h = (top - MARGIN - FOOTER) / WORKSHEET_ROWS
+        c.setStrokeGray(0.5)
+        for i, word in enumerate(words[sheet * WORKSHEET_ROWS:(sheet + 1) * WORKSHEET_ROWS]):
+            y = top - (i + 1) * row_h + row_h / 3
+            c.setFont('Helvetica-Bold', 20)
+            c.drawString(MARGIN, y, word)
+            c.line(page_w / 2 - 20, y - 2, page_w - MARGIN, y - 2)
+        footer(card_pages + sheet + 1)
+        c.showPage()
+    c.save()
+
+
+def _render_job(job):
+    content, path = job
+    tmp = f'{path}.{os.getpid()}.tmp'
+    render_pack(content, tmp)
+    os.replace(tmp, path)
+    return content['id']
+
+
+def render_packs(contents, jobs=None):
+    """Render any packs missing from the cache. Returns ``({pack id: cached pdf}, rendered count)``."""
+    cache_dir = config.CACHE_DIR / CARD_CACHE
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    cached = {c['id']: str(cache_dir / f'{content_hash(c)}.pdf') for c in contents}
+    todo = [(c, cached[c['id']]) for c in contents if not os.path.exists(cached[c['id']])]
+
+    count('packs cached', len(contents) - len(todo))
+    count('packs rendered', len(todo))
+    if todo:
+        workers = min(jobs or os.cpu_count() or 1, len(todo))
+        with span('render packs'), ProcessPoolExecutor(workers) as pool:
+            list(pool.map(_render_job, todo))
+    return cached, len(todo)
+
+
+def combine(paths, output):
+    from pypdf import PdfWriter
+
+    writer = PdfWriter()
+    for path in paths:
+        writer.append(path)
+    with open(output, 'wb') as f:
+        writer.write(f)
+
+
+def select_packs(packs, pack_ids=None, sub_pack=None):
+    if pack_ids:
+        wanted = set(pack_ids)
+        return [p for p in packs if p.id in wanted]
+    if sub_pack:
+        return [p for p in packs if p.sub_pack.lower() == sub_pack.lower()]
+    return packs
+
+
+def run(args):
+    packs = select_packs(read_word_packs(), args.pack, args.subpack)
+    if not packs:
+        print('No packs match')
+        return 1
+    syllables = read_syllable_dictionary()
+    contents = [pack_content(pack, syllables) for pack in packs]
+
+    try:
+        cached, rendered = render_packs(contents, args.jobs)
+    except ImportError as e:
+        print(f"{e.name} is needed to render PDFs: pip install reportlab")
+        return 1
+    print(f"Rendered {rendered} packs ({len(contents) - rendered} cached)")
+
+    out_dir = args.output or config.CARDS_DIR
+    os.makedirs(out_dir, exist_ok=True)
+    files = []
+    for content in contents:
+        path = os.path.join(out_dir, f"pack-{content['id']:03}.pdf")
+        shutil.copyfile(cached[content['id']], path)
+        files.append(path)
+    print(f"Wrote {len(files)} PDFs to {out_dir}")
+
+    if args.combine:
+        try:
+            with span('combine'):
+                combine(files, args.combine)
+        except ImportError:
+            print('pypdf is needed for --combine: pip install pypdf')
+            return 1
+        print(f"Combined into {args.combine}")
+    return 0
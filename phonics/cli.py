@@ -0,0 +1,322 @@
+"""``python -m phonics`` - one entry point for the word bank toolchain.
+
+Only argparse is imported up front. Each subcommand names its handler as a
+``module:function`` string that is imported when the command runs, so
+``phonics count`` never pays for openpyxl when the rows cache is fresh.
+"""
+
+import argparse
+import importlib
+from pathlib import Path
+
+from phonics.banks import BANK_NAMES
+
+
+def _add_count(sub):
+    p = sub.add_parser('count', help='count word entries and unique words')
+    p.set_defaults(handler='phonics.reports:count')
+
+
+def _add_analyze(sub):
+    p = sub.add_parser('analyze', help='word count per section')
+    p.set_defaults(handler='phonics.reports:analyze')
+
+
+def _add_preview(sub):
+    p = sub.add_parser('preview', help='preview the first sections of the workbook')
+    p.add_argument('--rows', type=int, default=40, help='sections to show (default: 40)')
+    p.set_defaults(handler='phonics.reports:preview')
+
+
+def _add_extract(sub):
+    p = sub.add_parser('extract', help='extract packs from the workbook to JSON')
+    p.add_argument('--limit', type=int, help='only extract the first N packs')
+    p.add_argument('-o', '--output', type=Path, help='JSON file to write (.ndjson for one pack per line)')
+    p.set_defaults(handler='phonics.extract:run')
+
+
+def _add_split(sub):
+    p = sub.add_parser('split', help='re-split the workbook sections')
+    p.add_argument('--strategy', choices=('size', 'levels', 'packs'), default='size',
+                   help='size: cap section length; levels: difficulty levels; '
+                        'packs: regroup into ~30 word packs (default: size)')
+    p.add_argument('--max-words', type=int, default=40, help='section size for --strategy size')
+    p.add_argument('--frequency', action='store_true',
+                   help='levels: break difficulty ties by word frequency; packs: order words by frequency')
+    p.add_argument('--frequency-list', type=Path,
+                   help='word frequency list (default: $PHONICS_WORD_FREQUENCY or word_frequency.txt)')
+    p.add_argument('--calibrated', action='store_true',
+                   help='levels: score words from word_difficulty.json instead of the heuristic')
+    p.add_argument('-o', '--output', type=Path, help='workbook to write (default: in place)')
+    p.set_defaults(handler='phonics.split:run')
+
+
+def _add_reorganize(sub):
+    p = sub.add_parser('reorganize', help='order extracted packs into difficulty sub-packs')
+    p.add_argument('-i', '--input', type=Path, help='extracted packs JSON or NDJSON')
+    p.add_argument('-o', '--output', type=Path, help='JSON file to write (.ndjson for one pack per line)')
+    p.set_defaults(handler='phonics.reorganize:run')
+
+
+def _add_number(sub):
+    p = sub.add_parser('number', help='renumber sections P1, P2, ... in the workbook')
+    p.set_defaults(handler='phonics.numbering:run')
+
+
+def _add_sync(sub):
+    p = sub.add_parser('sync', help='mirror the wordPacks array from app.js into the workbook')
+    p.add_argument('--app-js', type=Path, help='path to app.js')
+    p.set_defaults(handler='phonics.sync:run')
+
+
+def _add_ingest(sub):
+    p = sub.add_parser('ingest', help='extract the word tables from the Jolly Phonics PDF')
+    p.add_argument('--pdf', type=Path, help='PDF to ingest')
+    p.add_argument('-j', '--jobs', type=int, help='worker processes (default: CPU count)')
+    p.add_argument('-o', '--output', type=Path, help='JSON file to write (.ndjson for one pack per line)')
+    p.set_defaults(handler='phonics.ingest:run')
+
+
+def _add_packs(sub):
+    p = sub.add_parser('packs', help='count, convert or look up packs in a JSON or NDJSON pack file')
+    p.add_argument('file', type=Path, help='pack file (.json array or .ndjson, one pack per line)')
+    p.add_argument('-o', '--output', type=Path, help='write the packs to this .ndjson file, with its offset index')
+    p.add_argument('--get', type=int, nargs='+', metavar='ID', help='print these packs (seeks via the index)')
+    p.set_defaults(handler='phonics.packfile:run')
+
+
+def _add_export(sub):
+    p = sub.add_parser('export', help='write reorganized packs to src/data/wordPacks.ts')
+    p.add_argument('-i', '--input', type=Path, help='reorganized packs JSON or NDJSON')
+    p.add_argument('-o', '--output', type=Path, help='TypeScript file to write')
+    p.add_argument('--release', action='store_true', help='also cut a numbered release if the packs changed')
+    p.set_defaults(handler='phonics.export:run')
+
+
+def _add_watch(sub):
+    p = sub.add_parser('watch', help='rebuild packs and a wordPacks.ts preview whenever the workbook is saved',
+                       epilog='The preview is what `npm run dev:watch` serves in place of src/data/wordPacks.ts; '
+                              'plain `npm run dev` keeps serving the curated packs.')
+    p.add_argument('--debounce', type=float, default=0.25,
+                   help='seconds a save must settle before rebuilding (default: 0.25)')
+    p.add_argument('-o', '--output', type=Path,
+                   help='TypeScript preview to write (default: wordPacks.watch.ts, or $PHONICS_WATCH_PACKS_TS, '
+                        'which is also the file `npm run dev:watch` serves)')
+    p.add_argument('--write-app-data', action='store_true',
+                   help='write src/data/wordPacks.ts itself; its pack ids are the ones stored in progress, '
+                        'releases, rollups and compacted bits')
+    p.set_defaults(handler='phonics.watch:run')
+
+
+def _add_build(sub):
+    p = sub.add_parser('build', help='write a hand-maintained word bank (or a variant of one) as the workbook')
+    p.add_argument('bank', help=f"{', '.join(BANK_NAMES)} or a variant in variants/")
+    p.add_argument('-o', '--output', type=Path, help='workbook to write')
+    p.add_argument('--variants-dir', type=Path, help='directory of variant overlays (default: variants/)')
+    p.set_defaults(handler='phonics.build:run')
+
+
+def _add_variants(sub):
+    p = sub.add_parser('variants', help='resolve word-bank variants and report what they share with their base')
+    p.add_argument('names', nargs='*', help='variants to check (default: every file in variants/)')
+    p.add_argument('--variants-dir', type=Path, help='directory of variant overlays (default: variants/)')
+    p.set_defaults(handler='phonics.variants:run')
+
+
+def _add_audio(sub):
+    p = sub.add_parser('audio', help='pre-render pack words and syllables to cached audio clips')
+    p.add_argument('--voice', default='en-gb', help='espeak-ng voice (default: en-gb)')
+    p.add_argument('--speed', type=int, default=140, help='words per minute (default: 140)')
+    p.add_argument('-j', '--jobs', type=int, help='concurrent renders (default: CPU count)')
+    p.add_argument('-o', '--output', type=Path, help='clip directory (default: public/audio)')
+    p.add_argument('--prune', action='store_true', help='delete clips no longer in the manifest')
+    p.set_defaults(handler='phonics.audio:run')
+
+
+def _add_cards(sub):
+    p = sub.add_parser('cards', help='render printable flash cards and worksheets as PDFs (needs reportlab)')
+    p.add_argument('--pack', type=int, nargs='+', metavar='ID', help='only these packs')
+    p.add_argument('--subpack', help='only the packs of this sub-pack')
+    p.add_argument('-o', '--output', type=Path, help='directory for the PDFs (default: cards/)')
+    p.add_argument('--combine', type=Path, metavar='FILE', help='also join the selected packs into one PDF')
+    p.add_argument('-j', '--jobs', type=int, help='render processes (default: one per CPU)')
+    p.set_defaults(handler='phonics.cards:run')
+
+
+def _add_schedule(sub):
+    p = sub.add_parser('schedule', help="write each pupil's spaced-repetition review queue")
+    p.add_argument('--database', help='Postgres URL (default: $SUPABASE_DB_URL or $DATABASE_URL)')
+    p.add_argument('--date', help='day to schedule for, YYYY-MM-DD (default: today in UTC, as the app reads it)')
+    p.add_argument('--limit', type=int, default=30, help='words per queue (default: 30)')
+    p.set_defaults(handler='phonics.schedule:run')
+
+
+def _add_rollup(sub):
+    p = sub.add_parser('rollup', help='precompute tricky words per pupil at global, sub-pack and pack level')
+    p.add_argument('--database', help='Postgres URL (default: $SUPABASE_DB_URL or $DATABASE_URL)')
+    p.set_defaults(handler='phonics.rollup:run')
+
+
+def _add_compact(sub):
+    p = sub.add_parser('compact', help='encode pack_progress word statuses as bits at the latest bank release')
+    p.add_argument('--database', help='Postgres URL (default: $SUPABASE_DB_URL or $DATABASE_URL)')
+    p.add_argument('--version', type=int, help='bank release to encode against (default: latest)')
+    p.add_argument('--releases', type=Path, help='release directory (default: public/releases)')
+    p.add_argument('--dry-run', action='store_true', help='report what would be encoded without writing')
+    p.add_argument('--benchmark', action='store_true',
+                   help='compare stored size and read latency of the JSONB and bit forms')
+    p.set_defaults(handler='phonics.compact:run')
+
+
+def _add_import_packs(sub):
+    p = sub.add_parser('import-packs', help='bulk-import custom packs from a CSV or XLSX file')
+    p.add_argument('file', type=Path, help='CSV or XLSX with user_id, name and words columns')
+    p.add_argument('--database', help='Postgres URL (default: $SUPABASE_DB_URL or $DATABASE_URL)')
+    p.add_argument('--bank-only', action='store_true', help='drop words that are not in the word bank')
+    p.add_argument('--dry-run', action='store_true', help='validate the file without touching the database')
+    p.set_defaults(handler='phonics.custom:run')
+
+
+def _add_merge_progress(sub):
+    p = sub.add_parser('merge-progress', help='merge exported progress backups into one file per pupil')
+    p.add_argument('dir', type=Path, help='directory of exportProgress() JSON files, by pupil')
+    p.add_argument('-o', '--output', type=Path, help='directory for the merged <pupil>.json files')
+    p.add_argument('--database', nargs='?', const='',
+                   help='also upsert into pack_progress (URL, default: $SUPABASE_DB_URL or $DATABASE_URL)')
+    p.set_defaults(handler='phonics.merge:run')
+
+
+def _add_calibrate(sub):
+    p = sub.add_parser('calibrate', help='fit word difficulty from pupils\' marks (needs numpy)')
+    p.add_argument('--database', help='Postgres URL (default: $SUPABASE_DB_URL or $DATABASE_URL)')
+    p.add_argument('--min-attempts', type=int, default=20,
+                   help='marks a word needs to be calibrated (default: 20)')
+    p.add_argument('-o', '--output', type=Path, help='difficulty table to write')
+    p.set_defaults(handler='phonics.calibrate:run')
+
+
+def _add_families(sub):
+    p = sub.add_parser('families', help='query word endings, or export rime word families')
+    p.add_argument('ending', nargs='?', help="list pack words with this ending (e.g. ump); "
+                                             "without it, export word_families.json")
+    p.add_argument('--min-pack', type=int, help='only packs with at least this id')
+    p.add_argument('--max-pack', type=int, help='only packs with at most this id')
+    p.add_argument('--min-size', type=int, default=4, help='smallest family to export (default: 4)')
+    p.add_argument('-o', '--output', type=Path, help='families JSON to write')
+    p.set_defaults(handler='phonics.families:run')
+
+
+def _add_spellcheck(sub):
+    p = sub.add_parser('spellcheck', help='flag pack words that are not in a local wordlist')
+    p.add_argument('-i', '--input', type=Path, help='pack file to check (default: src/data/wordPacks.ts)')
+    p.add_argument('--wordlist', type=Path, help='one word per line (default: wordlist.txt)')
+    p.set_defaults(handler='phonics.spelling:run')
+
+
+def _add_features(sub):
+    p = sub.add_parser('features', help='build the shared per-word feature table and show words from it')
+    p.add_argument('words', nargs='*', help='words to show')
+    p.add_argument('--frequency-list', type=Path, help='frequency list (default: word_frequency.txt)')
+    p.set_defaults(handler='phonics.features:run')
+
+
+def _add_coverage(sub):
+    p = sub.add_parser('coverage', help='first exposure and practice of each grapheme across the packs')
+    p.add_argument('graphemes', nargs='*', help='graphemes to report (default: all), e.g. igh a_e')
+    p.add_argument('--window', type=int, default=10, help='packs counted after first exposure (default: 10)')
+    p.add_argument('-o', '--output', type=Path, help='write the report as JSON instead of a table')
+    p.set_defaults(handler='phonics.coverage:run')
+
+
+def _add_search(sub):
+    p = sub.add_parser('search', help='find the packs a word is in, or export the search index')
+    p.add_argument('query', nargs='?', help='word prefix or fragment; without it, write public/search-index.json')
+    p.add_argument('--limit', type=int, default=20, help='results to show (default: 20)')
+    p.add_argument('-o', '--output', type=Path, help='search index JSON to write')
+    p.set_defaults(handler='phonics.search:run')
+
+
+def _add_serve(sub):
+    p = sub.add_parser('serve', help='serve packs, sub-pack shards and syllables over HTTP with ETags')
+    p.add_argument('--host', default='0.0.0.0', help='address to listen on (default: 0.0.0.0)')
+    p.add_argument('--port', type=int, default=8765, help='port (default: 8765)')
+    p.add_argument('--cache-size', type=int, default=256, help='encoded responses to keep (default: 256)')
+    p.set_defaults(handler='phonics.server:run')
+
+
+def _add_loadtest(sub):
+    p = sub.add_parser('loadtest', help='load-test a running `phonics serve` on localhost')
+    p.add_argument('--host', default='127.0.0.1', help='server address (default: 127.0.0.1)')
+    p.add_argument('--port', type=int, default=8765, help='server port (default: 8765)')
+    p.add_argument('-c', '--clients', type=int, default=50, help='concurrent connections (default: 50)')
+    p.add_argument('-n', '--requests', type=int, default=200, help='requests per connection (default: 200)')
+    p.add_argument('--revalidate', type=float, default=0.5,
+                   help='fraction of requests sent with If-None-Match (default: 0.5)')
+    p.set_defaults(handler='phonics.loadtest:run')
+
+
+def _add_release(sub):
+    p = sub.add_parser('release', help='cut a numbered bank release with a JSON Patch from the previous one')
+    p.add_argument('-i', '--input', type=Path, help='wordPacks.ts to release')
+    p.add_argument('-o', '--output', type=Path, help='release directory (default: public/releases)')
+    p.add_argument('--verify', action='store_true',
+                   help='replay every patch and compare with the stored bundles and a fresh export')
+    p.set_defaults(handler='phonics.releases:run')
+
+
+COMMANDS = [
+    _add_count,
+    _add_analyze,
+    _add_preview,
+    _add_extract,
+    _add_split,
+    _add_reorganize,
+    _add_export,
+    _add_packs,
+    _add_watch,
+    _add_number,
+    _add_sync,
+    _add_build,
+    _add_variants,
+    _add_ingest,
+    _add_audio,
+    _add_cards,
+    _add_schedule,
+    _add_rollup,
+    _add_import_packs,
+    _add_merge_progress,
+    _add_calibrate,
+    _add_families,
+    _add_features,
+    _add_coverage,
+    _add_spellcheck,
+    _add_search,
+    _add_serve,
+    _add_loadtest,
+    _add_release,
+    _add_compact,
+]
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='phonics', description=__doc__.splitlines()[0])
+    parser.add_argument('--workbook', type=Path, help='word bank xlsx (default: $PHONICS_WORKBOOK '
+                                                      'or Phonics_Word_Bank.xlsx)')
+    parser.add_argument('--profile', type=Path, metavar='DIR',
+                        help='write cProfile stats and a Chrome trace of the command to DIR')
+    sub = parser.add_subparsers(dest='command', metavar='command', required=True)
+    for add in COMMANDS:
+        add(sub)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    module_name, func_name = args.handler.split(':')
+    handler = getattr(importlib.import_module(module_name), func_name)
+    if args.profile is None:
+        return handler(args)
+
+    from phonics.trace import profile_run
+
+    return profile_run(handler, args, args.profile, args.command)
@@ -0,0 +1,271 @@
+"""Compact per-pack progress: word statuses as bits instead of a JSONB object.
+
+``pack_progress.words`` repeats the text of every marked word in every row.
+Here a row's statuses are stored by the word's position in its pack at a
+numbered bank release (``python -m phonics release``): two bits per word in
+``word_bits`` (0 unmarked, 1 tricky, 2 mastered, 3 starred) and one bit per
+word in ``starred_bits``, with ``bank_version`` naming the release the
+positions refer to. Trailing zero bytes are dropped, so a pack nobody has
+marked past word 8 costs two bytes. Older rows keep decoding against their
+own release after words are edited.
+
+The app only ever writes the JSONB; the migration's trigger clears a row's
+bits whenever its ``words`` or ``starred`` change, so bits are never read
+stale, and readers fall back to the JSONB for rows without them.
+
+``compact`` re-encodes every row from its JSONB in one streamed pass and one
+transaction. Rows with a word that is not in the pack at the latest release
+(or a status the encoding has no code for) keep only their JSONB, with the
+bit columns cleared, and are reported. ``--benchmark`` compares stored sizes
+and per-pupil read latency of the two forms over the same (encoded) rows.
+"""
+
+import json
+import random
+import time
+
+from phonics import db
+from phonics.releases import read_index, read_release
+from phonics.trace import count, span
+
+CODES = {'tricky': 1, 'mastered': 2, 'starred': 3}
+STATUSES = {code: status for status, code in CODES.items()}
+MAX_REPORTED = 20
+
+PROGRESS_QUERY = """
+    SELECT id, pack_id, words, starred, updated_at
+    FROM pack_progress
+"""
+# A row the app rewrote since it was read keeps its JSONB only (the
+# migration's trigger has cleared its bits); the next run encodes it
+UPDATE_BITS = """
+    UPDATE pack_progress AS p
+    SET bank_version = v.bank_version, word_bits = v.word_bits, starred_bits = v.starred_bits
+    FROM (VALUES %s) AS v (id, updated_at, bank_version, word_bits, starred_bits)
+    WHERE p.id = v.id AND p.updated_at IS NOT DISTINCT FROM v.updated_at
+"""
+UPDATE_TEMPLATE = '(%s::uuid, %s::timestamptz, %s::integer, %s::bytea, %s::bytea)'
+
+
+def _trim(data):
+    end = len(data)
+    while end and not data[end - 1]:
+        end -= 1
+    return bytes(data[:end])
+
+
+def encode(pack_words, statuses):
+    """Two bits per word of ``pack_words`` for a ``{word: status}`` object."""
+    data = bytearray((len(pack_words) + 3) // 4)
+    for i, word in enumerate(pack_words):
+        code = CODES.get(statuses.get(word))
+        if code:
+            data[i >> 2] |= code << ((i & 3) * 2)
+    return _trim(data)
+
+
+def decode(pack_words, data):
+    """The ``{word: status}`` object encoded by :func:`encode`."""
+    statuses = {}
+    for i, word in enumerate(pack_words[:len(data) * 4]):
+        code = (data[i >> 2] >> ((i & 3) * 2)) & 3
+        if code:
+            statuses[word] = STATUSES[code]
+    return statuses
+
+
+def encode_set(pack_words, words):
+    """One bit per word of ``pack_words`` set for the words in ``words``."""
+    data = bytearray((len(pack_words) + 7) // 8)
+    for i, word in enumerate(pack_words):
+        if word in words:
+            data[i >> 3] |= 1 << (i & 7)
+    return _trim(data)
+
+
+def decode_set(pack_words, data):
+    return [word for i, word in enumerate(pack_words[:len(data) * 8])
+            if data[i >> 3] & (1 << (i & 7))]
+
+
+def unencodable(pack_words, statuses):
+    """Entries of ``statuses`` the bits cannot hold."""
+    positions = set(pack_words)
+    return sorted(word for word, status in statuses.items()
+                  if word not in positions or status not in CODES)
+
+
+class BankVersions:
+    """Pack word lists of each release, loaded on first use."""
+
+    def __init__(self, out_dir=None):
+        self.out_dir = out_dir
+        self.bundles = {}
+
+    def words(self, version, pack_id):
+        """Words of pack ``pack_id`` at ``version``, or ``None`` if it has no such pack."""
+        if version not in self.bundles:
+            self.bundles[version] = read_release(version, self.out_dir)['packs']
+        pack = self.bundles[version].get(str(pack_id))
+        return pack['words'] if pack else None
+
+
+def _write(cur, batch, dry_run):
+    if batch and not dry_run:
+        with span('write bits'):
+            db.insert_values(cur, UPDATE_BITS, batch, template=UPDATE_TEMPLATE)
+
+
+def compact(conn, versions, version, dry_run=False):
+    """Encode every row at ``version``. Returns ``(encoded, skipped, problems)``."""
+    encoded = skipped = 0
+    problems = []
+    batch = []
+
+    with conn, conn.cursor() as cur:
+        for row_id, pack_id, words, starred, updated_at in db.stream(conn, PROGRESS_QUERY):
+            starred = starred or {}
+            pack_words = versions.words(version, pack_id)
+            if pack_words is None:
+                problem = 'pack is not in the release'
+            else:
+                bad = unencodable(pack_words, words) + unencodable(pack_words, starred)
+                problem = bad and 'not encodable: ' + ', '.join(bad[:5])
+            if problem:
+                skipped += 1
+                if len(problems) < MAX_REPORTED:
+                    problems.append(f"{row_id} (pack {pack_id}): {problem}")
+                # Clear bits left by an earlier run so they cannot go stale
+                batch.append((row_id, updated_at, None, None, None))
+            else:
+                batch.append((row_id, updated_at, version, encode(pack_words, words),
+                              encode_set(pack_words, starred)))
+                encoded += 1
+            if len(batch) >= db.PAGE_SIZE:
+                _write(cur, batch, dry_run)
+                batch = []
+        _write(cur, batch, dry_run)
+
+    count('rows encoded', encoded)
+    count('rows skipped', skipped)
+    return encoded, skipped, problems
+
+
+# ---------------------------------------------------------------------------
+# Benchmark
+
+SIZE_QUERY = """
+    SELECT count(*),
+           sum(pg_column_size(words)), sum(pg_column_size(starred)),
+           sum(pg_column_size(word_bits)), sum(pg_column_size(starred_bits))
+    FROM pack_progress
+    WHERE word_bits IS NOT NULL
+"""
+USERS_QUERY = 'SELECT DISTINCT user_id FROM pack_progress WHERE word_bits IS NOT NULL'
+# Both forms are read over the encoded rows only; JSONB-only rows have no bits to compare
+JSONB_QUERY = ('SELECT pack_id, words, starred '
+               'FROM pack_progress WHERE user_id = %s AND word_bits IS NOT NULL')
+BITS_QUERY = ('SELECT pack_id, bank_version, word_bits, starred_bits '
+              'FROM pack_progress WHERE user_id = %s AND word_bits IS NOT NULL')
+
+
+def _read_jsonb(cur, user_id, versions):
+    cur.execute(JSONB_QUERY, (user_id,))
+    rows = cur.fetchall()
+    size = sum(len(json.dumps(words)) + len(json.dumps(starred or {})) for _, words, starred in rows)
+    return {pack_id: (words, starred or {}) for pack_id, words, starred in rows}, size
+
+
+def _read_bits(cur, user_id, versions):
+    cur.execute(BITS_QUERY, (user_id,))
+    rows = cur.fetchall()
+    progress, size = {}, 0
+    for pack_id, version, word_bits, starred_bits in rows:
+        pack_words = versions.words(version, pack_id)
+        word_bits, starred_bits = bytes(word_bits), bytes(starred_bits)
+        size += len(word_bits) + len(starred_bits)
+        progress[pack_id] = (decode(pack_words, word_bits),
+                             dict.fromkeys(decode_set(pack_words, starred_bits), 'starred'))
+    return progress, size
+
+
+def _percentile(sorted_values, p):
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * p))]
+
+
+def benchmark(conn, versions, pupils=200, seed=0):
+    """Stored sizes and per-pupil read latency (query plus decode) of both forms."""
+    with conn.cursor() as cur:
+        cur.execute(SIZE_QUERY)
+        rows, words_size, starred_size, bits_size, starred_bits_size = cur.fetchone()
+        cur.execute(USERS_QUERY)
+        users = [user_id for user_id, in cur.fetchall()]
+        sample = random.Random(seed).sample(users, min(pupils, len(users)))
+
+        timings = {}
+        for name, read in (('jsonb', _read_jsonb), ('bits', _read_bits)):
+            latencies, payload = [], 0
+            for user_id in sample:
+                start = time.perf_counter()
+                _, size = read(cur, user_id, versions)
+                latencies.append(time.perf_counter() - start)
+                payload += size
+            timings[name] = sorted(latencies), payload
+
+        for user_id in sample:
+            jsonb, _ = _read_jsonb(cur, user_id, versions)
+            bits, _ = _read_bits(cur, user_id, versions)
+            if jsonb != bits:
+                raise AssertionError(f"decoded bits differ from JSONB for {user_id}")
+    conn.rollback()
+
+    return {
+        'rows': rows,
+        'stored': {'jsonb': (words_size or 0) + (starred_size or 0),
+                   'bits': (bits_size or 0) + (starred_bits_size or 0)},
+        'pupils': len(sample),
+        'timings': timings,
+    }
+
+
+def _print_benchmark(result):
+    stored = result['stored']
+    print(f"Stored size over {result['rows']:,} rows: JSONB {stored['jsonb']:,} bytes, "
+          f"bits {stored['bits']:,} bytes ({stored['jsonb'] / max(stored['bits'], 1):.1f}x smaller)")
+    for name, (latencies, payload) in result['timings'].items():
+        print(f"  {name:5}  read + decode per pupil: "
+              + ', '.join(f"p{int(p * 100)} {_percentile(latencies, p) * 1000:.2f} ms"
+                          for p in (0.5, 0.95))
+              + f"; payload {payload / max(result['pupils'], 1):,.0f} bytes per pupil")
+
+
+def run(args):
+    url = db.database_url(args.database)
+    if not url:
+        print('No database: pass --database or set SUPABASE_DB_URL / DATABASE_URL')
+        return 1
+    version = args.version or read_index(args.releases)['latest']
+    if not version:
+        print('No bank releases yet; run `python -m phonics release` first')
+        return 1
+
+    versions = BankVersions(args.releases)
+    conn = db.connect(url)
+    try:
+        with span('compact'):
+            encoded, skipped, problems = compact(conn, versions, version, args.dry_run)
+        if args.benchmark and not args.dry_run:
+            with span('benchmark'):
+                result = benchmark(conn, versions)
+    finally:
+        conn.close()
+
+    for problem in problems:
+        print(f"  {problem}")
+    if skipped > len(problems):
+        print(f"  ... and {skipped - len(problems)} more")
+    verb = 'Would encode' if args.dry_run else 'Encoded'
+    print(f"{verb} {encoded:,} rows at bank v{version}; {skipped:,} left as JSONB")
+    if args.benchmark and not args.dry_run:
+        _print_benchmark(result)
+    return 0
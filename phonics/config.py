@@ -0,0 +1,37 @@
+"""Paths used by the content toolchain.
+
+Defaults point at the files in the repository root. Each one can be overridden
+with a ``PHONICS_*`` environment variable or a command-line flag.
+"""
+
+import os
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+
+def _path(env_var, default):
+    value = os.environ.get(env_var)
+    return Path(value) if value else REPO_ROOT / default
+
+
+WORKBOOK = _path('PHONICS_WORKBOOK', 'Phonics_Word_Bank.xlsx')
+EXTRACTED_JSON = _path('PHONICS_EXTRACTED_JSON', 'all_packs_extracted.json')
+REORGANIZED_JSON = _path('PHONICS_REORGANIZED_JSON', 'packs_reorganized.json')
+DUPLICATE_REPORT = _path('PHONICS_DUPLICATE_REPORT', 'Duplicate_Report.txt')
+APP_JS = _path('PHONICS_APP_JS', 'app.js')
+CACHE_DIR = _path('PHONICS_CACHE_DIR', '.phonics-cache')
+JOLLY_PDF = _path('PHONICS_JOLLY_PDF', 'Jolly Phonics Word Bank.pdf')
+INGEST_JSON = _path('PHONICS_INGEST_JSON', 'jolly_phonics_ingest.json')
+WORD_PACKS_TS = _path('PHONICS_WORD_PACKS_TS', 'src/data/wordPacks.ts')
+WATCH_PACKS_TS = _path('PHONICS_WATCH_PACKS_TS', 'wordPacks.watch.ts')
+SYLLABLE_DICTIONARY_TS = _path('PHONICS_SYLLABLE_DICTIONARY_TS', 'src/data/syllableDictionary.ts')
+AUDIO_DIR = _path('PHONICS_AUDIO_DIR', 'public/audio')
+WORD_FREQUENCY = _path('PHONICS_WORD_FREQUENCY', 'word_frequency.txt')
+DIFFICULTY_JSON = _path('PHONICS_DIFFICULTY_JSON', 'word_difficulty.json')
+WORD_FAMILIES_JSON = _path('PHONICS_WORD_FAMILIES_JSON', 'word_families.json')
+SEARCH_INDEX_JSON = _path('PHONICS_SEARCH_INDEX_JSON', 'public/search-index.json')
+RELEASES_DIR = _path('PHONICS_RELEASES_DIR', 'public/releases')
+VARIANTS_DIR = _path('PHONICS_VARIANTS_DIR', 'variants')
+WORDLIST = _path('PHONICS_WORDLIST', 'wordlist.txt')
+CARDS_DIR = _path('PHONICS_CARDS_DIR', 'cards')
@@ -0,0 +1,154 @@
+"""Where each grapheme is met in the pack sequence, and how often after that.
+
+Every word in ``src/data/wordPacks.ts`` is split into graphemes by spelling
+(``graphemes``, kept per word in the shared feature table):
+greedy longest match against ``GRAPHEMES`` (so ``night`` is n-igh-t, not
+n-i-g-h-t), with a final vowel-consonant-e read as a split digraph (``make``
+is m-a_e-k). The counts go into a SciPy sparse grapheme x pack matrix, in
+app order, whose entry ``[g, p]`` is the number of words in pack ``p`` with
+grapheme ``g``.
+
+From the matrix, per grapheme:
+
+* first exposure  - the first pack with a word using it
+* packs, words    - how many packs and words use it
+* density         - words using it per pack from first exposure to the end
+* next N          - words using it in the ``--window`` packs from first exposure on,
+                    from a running sum over the grapheme's stored entries only
+* longest gap     - most consecutive packs without it after first exposure
+"""
+
+import json
+import re
+
+from phonics.appdata import read_word_packs
+from phonics.features import load_features
+from phonics.trace import count, span
+
+WINDOW = 10
+VOWELS = ('a', 'e', 'i', 'o', 'u')
+
+# Spellings taught as one unit, longest first within the greedy match
+GRAPHEMES = (
+    'ough', 'augh', 'eigh',
+    'tch', 'dge', 'igh', 'air', 'ear', 'ure',
+    'ch', 'sh', 'th', 'wh', 'ph', 'ng', 'nk', 'ck', 'qu', 'kn', 'wr', 'gn', 'mb',
+    'ai', 'ay', 'ee', 'ea', 'ie', 'oa', 'ow', 'ue', 'ew', 'oo', 'ar', 'or', 'er', 'ir', 'ur',
+    'au', 'aw', 'oi', 'oy', 'ou', 'll', 'ss', 'ff', 'zz',
+) + tuple('abcdefghijklmnopqrstuvwxyz')
+SPLIT_DIGRAPHS = tuple(f'{v}_e' for v in VOWELS)
+MAX_LENGTH = max(map(len, GRAPHEMES))
+_KNOWN = set(GRAPHEMES)
+
+
+def graphemes(word):
+    """The graphemes of ``word`` in order, by greedy longest match."""
+    parts = []
+    for chunk in re.findall(r'[a-z]+', word.lower()):
+        tokens = []
+        i = 0
+        while i < len(chunk):
+            for size in range(min(MAX_LENGTH, len(chunk) - i), 0, -1):
+                if chunk[i:i + size] in _KNOWN:
+                    tokens.append(chunk[i:i + size])
+                    i += size
+                    break
+        # Vowel-consonant-e at the end of a word is a split digraph (a_e, i_e, ...)
+        if (len(tokens) >= 3 and tokens[-1] == 'e' and tokens[-3] in VOWELS
+                and len(tokens[-2]) == 1 and tokens[-2] not in VOWELS
+                and (len(tokens) == 3 or tokens[-4] not in VOWELS)):
+            tokens[-3:] = [f'{tokens[-3]}_e', tokens[-2]]
+        parts.extend(tokens)
+    return parts
+
+
+def coverage_matrix(packs, features):
+    """``(matrix, grapheme names)``: CSR of words per grapheme (rows) and pack (columns)."""
+    with span('import scipy'):
+        from scipy.sparse import coo_matrix
+
+    names = list(GRAPHEMES) + list(SPLIT_DIGRAPHS)
+    row_of = {g: i for i, g in enumerate(names)}
+    rows, cols = [], []
+    seen = {}
+    for p, pack in enumerate(packs):
+        for word in pack.words:
+            found = seen.get(word)
+            if found is None:
+                found = seen[word] = {row_of[g] for g in features.graphemes(word)}
+            rows.extend(found)
+            cols.extend([p] * len(found))
+    count('grapheme occurrences', len(rows))
+    # Duplicate (row, col) pairs are summed on conversion
+    matrix = coo_matrix(([1] * len(rows), (rows, cols)), shape=(len(names), len(packs)), dtype='int32')
+    return matrix.tocsr(), names
+
+
+def progression(matrix, names, packs, window=WINDOW):
+    """One report entry per grapheme used in the bank, in order of first exposure."""
+    import numpy as np
+
+    matrix.sort_indices()
+    n_packs = matrix.shape[1]
+    pack_counts = np.diff(matrix.indptr)
+
+    report = []
+    for g in np.flatnonzero(pack_counts):
+        start, end = matrix.indptr[g], matrix.indptr[g + 1]
+        columns = matrix.indices[start:end]
+        # Words so far at each pack that uses the grapheme; nothing comes before the first
+        running = np.cumsum(matrix.data[start:end])
+        first = int(columns[0])
+        total = int(running[-1])
+        last_in_window = min(first + window, n_packs) - 1
+        in_window = np.searchsorted(columns, last_in_window, side='right')
+        gaps = np.diff(np.append(columns, n_packs)) - 1
+        report.append({
+            'grapheme': names[g],
+            'firstPack': packs[first].id,
+            'packs': int(pack_counts[g]),
+            'words': total,
+            'density': round(total / (n_packs - first), 3),
+            'nextWindow': int(running[in_window - 1]),
+            'longestGap': int(gaps.max()),
+        })
+    report.sort(key=lambda entry: (entry['firstPack'], entry['grapheme']))
+    return report
+
+
+def render_report(report, window=WINDOW):
+    lines = [f"{'Grapheme':<9} {'First':>6} {'Packs':>6} {'Words':>6} {'Density':>8} "
+             f"{f'Next {window}':>8} {'Gap':>5}"]
+    for e in report:
+        lines.append(f"{e['grapheme']:<9} {'P' + str(e['firstPack']):>6} {e['packs']:>6} {e['words']:>6} "
+                     f"{e['density']:>8.2f} {e['nextWindow']:>8} {e['longestGap']:>5}")
+    return '\n'.join(lines)
+
+
+def run(args):
+    packs = read_word_packs()
+    with span('load features'):
+        features = load_features(word for pack in packs for word in pack.words)
+    with span('coverage matrix'):
+        matrix, names = coverage_matrix(packs, features)
+    with span('progression'):
+        report = progression(matrix, names, packs, args.window)
+
+    if args.graphemes:
+        wanted = {g.lower() for g in args.graphemes}
+        unknown = wanted - set(names)
+        if unknown:
+            print(f"Not graphemes this report knows: {', '.join(sorted(unknown))}")
+            return 1
+        report = [e for e in report if e['grapheme'] in wanted]
+        missing = wanted - {e['grapheme'] for e in report}
+        for grapheme in sorted(missing):
+            print(f"{grapheme}: not used in any pack")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({'window': args.window, 'packs': len(packs), 'graphemes': report}, f, indent=2)
+        print(f"Wrote coverage of {len(report)} graphemes over {len(packs)} packs to {args.output}")
+    elif report:
+        print(render_report(report, args.window))
+    return 0
@@ -0,0 +1,235 @@
+"""Bulk-import teacher-defined custom packs from CSV or XLSX.
+
+The file needs ``user_id``, ``name`` and ``words`` columns (``local_id`` is
+optional). ``words`` holds comma-separated words, and a pack may continue over
+several consecutive rows with the same user and name, so a school can list
+one word per row. The file is streamed: only the pack being read and one
+page of pending inserts are held in memory.
+
+Words are normalised (Unicode, quotes, spacing) and spelled as in the
+canonical bank (``src/data/wordPacks.ts``) when they match it ignoring case.
+Tokens that are not words are dropped; words outside the bank are kept and
+reported, or dropped with ``--bank-only``. Packs are upserted into
+``custom_packs`` with multi-row inserts inside one transaction, so a failed
+import leaves the table untouched. Packs without a ``local_id`` reuse the id
+of the user's existing pack with the same name, or get the next free ``C#``.
+"""
+
+import csv
+import uuid
+from pathlib import Path
+
+from phonics import db
+from phonics.appdata import read_word_packs
+from phonics.trace import count, span
+from phonics.words import normalise_word, split_words
+
+COLUMNS = ('user_id', 'name', 'words')
+MAX_PROBLEMS_SHOWN = 20
+
+EXISTING_QUERY = 'SELECT local_id, name FROM custom_packs WHERE user_id = %s'
+UPSERT_PACKS = """
+    INSERT INTO custom_packs (user_id, local_id, name, words)
+    VALUES %s
+    ON CONFLICT (user_id, local_id) DO UPDATE SET
+      name = EXCLUDED.name,
+      words = EXCLUDED.words,
+      updated_at = NOW(),
+      synced_at = NOW()
+"""
+
+
+def read_records(path):
+    """Yield ``(line, {column: text})`` for each data row of a CSV or XLSX file."""
+    if Path(path).suffix.lower() in ('.xlsx', '.xlsm'):
+        from openpyxl import load_workbook
+
+        wb = load_workbook(path, read_only=True)
+        try:
+            rows = wb.active.iter_rows(values_only=True)
+            yield from _records(rows)
+        finally:
+            wb.close()
+    else:
+        with open(path, 'r', encoding='utf-8-sig', newline='') as f:
+            yield from _records(csv.reader(f))
+
+
+def _records(rows):
+    header = [str(h or '').strip().lower() for h in next(rows, ())]
+    missing = [c for c in COLUMNS if c not in header]
+    if missing:
+        raise ValueError(f"missing column(s): {', '.join(missing)}")
+    for line, row in enumerate(rows, start=2):
+        values = ['' if v is None else str(v).strip() for v in row]
+        if any(values):
+            yield line, dict(zip(header, values))
+
+
+def canonical_spellings(packs):
+    """``{lowercase word: bank spelling}`` for every word in the bank."""
+    spellings = {}
+    for pack in packs:
+        for word in pack.words:
+            spellings.setdefault(word.lower(), word)
+    return spellings
+
+
+class PackReader:
+    """Group streamed records into validated packs."""
+
+    def __init__(self, spellings, bank_only=False):
+        self.spellings = spellings
+        self.bank_only = bank_only
+        self.problems = []  # first MAX_PROBLEMS_SHOWN (line, message) pairs
+        self.problem_count = 0
+        self.unknown_words = 0
+
+    def report(self, line, message):
+        self.problem_count += 1
+        if len(self.problems) < MAX_PROBLEMS_SHOWN:
+            self.problems.append((line, message))
+
+    def packs(self, records):
+        """Yield ``(line, user_id, local_id, name, words)`` per pack, in file order."""
+        pack = None
+        for line, record in records:
+            user_id, local_id, name = (record.get(c, '') for c in ('user_id', 'local_id', 'name'))
+            # A blank local_id continues the pack; a different one starts a new pack
+            renumbered = local_id and pack and pack[2] and local_id != pack[2]
+            if pack is None or (user_id, name) != (pack[1], pack[3]) or renumbered:
+                if pack is not None:
+                    yield from self._finish(pack)
+                pack = [line, user_id, local_id, name, {}]
+            elif local_id and not pack[2]:
+                pack[2] = local_id
+            self._add_words(line, record.get('words', ''), pack[4])
+        if pack is not None:
+            yield from self._finish(pack)
+
+    def _add_words(self, line, cell, words):
+        for token in split_words(cell):
+            word = normalise_word(token)
+            if word is None:
+                self.report(line, f"not a word: {token!r}")
+                continue
+            bank_word = self.spellings.get(word.lower())
+            if bank_word is None:
+                self.unknown_words += 1
+                if self.bank_only:
+                    self.report(line, f"not in the word bank: {word!r}")
+                    continue
+            words.setdefault(bank_word or word, None)
+
+    def _finish(self, pack):
+        line, user_id, local_id, name, words = pack
+        try:
+            user_id = str(uuid.UUID(user_id))
+        except ValueError:
+            self.report(line, f"bad user_id: {user_id!r}")
+            return
+        if not name:
+            self.report(line, 'pack has no name')
+            return
+        if not words:
+            self.report(line, f"pack {name!r} has no words")
+            return
+        count('packs read')
+        yield line, user_id, local_id, name, list(words)
+
+
+class LocalIds:
+    """Assign ``C#`` ids per user, looking each user up once while their rows last."""
+
+    def __init__(self, lookup):
+        self.lookup = lookup  # user_id -> [(local_id, name)]
+        self.user_id = None
+
+    def assign(self, user_id, local_id, name):
+        """``local_id`` for the pack, or ``None`` if the pack was already imported this run."""
+        if user_id != self.user_id:
+            self.user_id = user_id
+            existing = self.lookup(user_id)
+            self.by_name = {n: i for i, n in existing}
+            self.next_number = max((_number(i) for i, _ in existing), default=0) + 1
+            self.done = set()
+        if not local_id:
+            local_id = self.by_name.get(name)
+        if not local_id:
+            local_id = f"C{self.next_number}"
+            self.next_number += 1
+        if local_id in self.done:
+            return None
+        self.done.add(local_id)
+        self.by_name[name] = local_id
+        self.next_number = max(self.next_number, _number(local_id) + 1)
+        return local_id
+
+
+def _number(local_id):
+    return int(local_id[1:]) if local_id[1:].isdigit() else 0
+
+
+def import_packs(conn, packs, report):
+    """Upsert ``packs`` into ``custom_packs`` in one transaction. Returns the number imported."""
+    imported, batch = 0, []
+
+    with conn, conn.cursor() as cur:
+        def lookup(user_id):
+            # Rows for this user earlier in the file may still be pending
+            if any(row[0] == user_id for row in batch):
+                flush()
+            cur.execute(EXISTING_QUERY, (user_id,))
+            return cur.fetchall()
+
+        def flush():
+            if batch:
+                with span('insert packs'):
+                    db.insert_values(cur, UPSERT_PACKS, batch)
+                count('packs written', len(batch))
+                batch.clear()
+
+        ids = LocalIds(lookup)
+        for line, user_id, local_id, name, words in packs:
+            local_id = ids.assign(user_id, local_id, name)
+            if local_id is None:
+                report(line, 'pack repeats one imported earlier in the file')
+                continue
+            batch.append((user_id, local_id, name, words))
+            imported += 1
+            if len(batch) >= db.PAGE_SIZE:
+                flush()
+        flush()
+    return imported
+
+
+def run(args):
+    url = db.database_url(args.database)
+    if not url and not args.dry_run:
+        print('No database: pass --database or set SUPABASE_DB_URL / DATABASE_URL, or use --dry-run')
+        return 1
+
+    reader = PackReader(canonical_spellings(read_word_packs()), args.bank_only)
+    try:
+        packs = reader.packs(read_records(args.file))
+        if args.dry_run:
+            imported = sum(1 for _ in packs)
+        else:
+            conn = db.connect(url)
+            try:
+                imported = import_packs(conn, packs, reader.report)
+            finally:
+                conn.close()
+    except ValueError as e:
+        print(f"{args.file}: {e}")
+        return 1
+
+    for line, message in reader.problems:
+        print(f"  line {line}: {message}")
+    if reader.problem_count > len(reader.problems):
+        print(f"  ... and {reader.problem_count - len(reader.problems)} more")
+
+    verb = 'Checked' if args.dry_run else 'Imported'
+    print(f"{verb} {imported} packs ({reader.unknown_words} words not in the word bank, "
+          f"{reader.problem_count} problems)")
+    return 0
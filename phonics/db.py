@@ -0,0 +1,38 @@
+"""Postgres access for the batch jobs that read and write app progress.
+
+Uses psycopg2, imported on first connect so the workbook commands never need
+it. The connection string comes from ``--database``, ``$SUPABASE_DB_URL`` or
+``$DATABASE_URL`` (the same variables as ``scripts/enable-rls-direct.ts``);
+a local Postgres loaded with ``supabase-schema.sql`` and the migrations works
+for testing.
+"""
+
+import os
+
+FETCH_SIZE = 5000  # rows per round trip when streaming a query
+PAGE_SIZE = 1000  # rows per multi-row INSERT
+
+
+def database_url(url=None):
+    return url or os.environ.get('SUPABASE_DB_URL') or os.environ.get('DATABASE_URL')
+
+
+def connect(url):
+    import psycopg2
+
+    return psycopg2.connect(url)
+
+
+def stream(conn, query, params=None, name='phonics_stream'):
+    """Yield the rows of ``query`` through a server-side cursor, ``FETCH_SIZE`` at a time."""
+    with conn.cursor(name=name) as cur:
+        cur.itersize = FETCH_SIZE
+        cur.execute(query, params)
+        yield from cur
+
+
+def insert_values(cur, statement, rows, template=None):
+    """Run ``statement`` (with one ``VALUES %s``) as multi-row inserts of ``PAGE_SIZE`` rows."""
+    from psycopg2.extras import execute_values
+
+    execute_values(cur, statement, rows, template=template, page_size=PAGE_SIZE)
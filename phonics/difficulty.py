@@ -0,0 +1,67 @@
+"""Word difficulty used to split categories into levels.
+
+``get_difficulty_score`` is the hand-tuned heuristic. ``python -m phonics
+calibrate`` fits scores on the same scale from pupils' marks; load them with
+``load_difficulty_table`` and score with ``calibrated_scorer``.
+"""
+
+import json
+
+from phonics import config
+
+
+def count_syllables(word):
+    """Rough syllable counter"""
+    word = word.lower().strip()
+    vowels = "aeiouy"
+    syllable_count = 0
+    previous_was_vowel = False
+
+    for char in word:
+        is_vowel = char in vowels
+        if is_vowel and not previous_was_vowel:
+            syllable_count += 1
+        previous_was_vowel = is_vowel
+
+    # Adjust for silent e
+    if word.endswith('e') and syllable_count > 1:
+        syllable_count -= 1
+
+    return max(1, syllable_count)
+
+
+def get_difficulty_score(word):
+    """Calculate difficulty: syllables, length, complexity"""
+    syllables = count_syllables(word)
+    length = len(word)
+
+    # Base score on syllables (most important)
+    score = syllables * 10
+
+    # Add points for length
+    if length > 10:
+        score += 5
+    elif length > 7:
+        score += 3
+    elif length > 5:
+        score += 1
+
+    return score
+
+
+def load_difficulty_table(path=None):
+    """``{word: score}`` from ``word_difficulty.json``; ``None`` if it does not exist."""
+    try:
+        with open(path or config.DIFFICULTY_JSON, 'r', encoding='utf-8') as f:
+            table = json.load(f)
+    except FileNotFoundError:
+        return None
+    return {word: entry['score'] for word, entry in table['words'].items()}
+
+
+def calibrated_scorer(scores, fallback=get_difficulty_score):
+    """Score words from a calibrated table, falling back to ``fallback`` (the heuristic)."""
+    def score(word):
+        calibrated = scores.get(word.lower())
+        return fallback(word) if calibrated is None else calibrated
+    return score
@@ -0,0 +1,112 @@
+"""Write reorganized packs out as ``src/data/wordPacks.ts``."""
+
+import filecmp
+import os
+
+from phonics import config
+from phonics.packfile import iter_packs
+from phonics.trace import span
+
+WORDS_PER_LINE = 10
+
+HEADER = """/**
+ * Word packs data - {count} packs organized by phonics patterns
+ * Generated from the word bank workbook by `python -m phonics export`.
+ * Total: {words:,} words across all patterns
+ */
+
+import type {{ WordPack }} from '@/types';
+
+export const wordPacks: WordPack[] = [
+"""
+
+
+def ts_string(value):
+    """Single-quoted TypeScript string literal."""
+    return "'" + value.replace('\\', '\\\\').replace("'", "\\'") + "'"
+
+
+def render_pack(pack):
+    """One pack's entry in the layout used by ``src/data/wordPacks.ts``."""
+    word_lines = []
+    words = pack.words
+    for i in range(0, len(words), WORDS_PER_LINE):
+        word_lines.append('      ' + ', '.join(ts_string(w) for w in words[i:i + WORDS_PER_LINE]))
+    lines = [
+        '  {',
+        f"    id: {pack.id},",
+        f"    category: {ts_string(pack.title)},",
+        f"    subPack: {ts_string(pack.sub_pack)},",
+        '    words: [',
+        ',\n'.join(word_lines),
+        '    ],',
+        f"    description: {ts_string(pack.description)}",
+        '  }',
+    ]
+    return '\n'.join(lines)
+
+
+def render_word_packs(packs):
+    """Render packs in the layout used by ``src/data/wordPacks.ts``."""
+    header = HEADER.format(count=len(packs), words=sum(len(p) for p in packs))
+    return header + ',\n'.join(render_pack(pack) for pack in packs) + '\n];\n'
+
+
+def write_word_packs(path, read_packs):
+    """Write ``wordPacks.ts`` a pack at a time from ``read_packs()``, unless it is unchanged.
+
+    ``read_packs`` is called twice, once to count packs and words for the
+    header and once to write them. Returns ``(packs, written)``.
+    """
+    packs = words = 0
+    for pack in read_packs():
+        packs += 1
+        words += len(pack)
+
+    tmp = f'{path}.{os.getpid()}.tmp'
+    with open(tmp, 'w', encoding='utf-8') as f:
+        f.write(HEADER.format(count=packs, words=words))
+        for i, pack in enumerate(read_packs()):
+            f.write((',\n' if i else '') + render_pack(pack))
+        f.write('\n];\n')
+    if os.path.exists(path) and filecmp.cmp(tmp, path, shallow=False):
+        os.remove(tmp)
+        return packs, False
+    os.replace(tmp, path)
+    return packs, True
+
+
+def write_if_changed(path, text):
+    """Write ``text`` to ``path`` unless it already has that content. Returns True if written."""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            if f.read() == text:
+                return False
+    except FileNotFoundError:
+        pass
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(text)
+    return True
+
+
+def run(args):
+    source = args.input or config.REORGANIZED_JSON
+
+    output = args.output or config.WORD_PACKS_TS
+    with span('render wordPacks.ts'):
+        packs, written = write_word_packs(output, lambda: iter_packs(source))
+    if written:
+        print(f"Exported {packs} packs to {output}")
+    else:
+        print(f"{output} is already up to date")
+
+    if args.release:
+        from phonics.releases import release
+
+        # A release is one JSON document diffed against the last, so it holds the whole bank
+        entry = release(list(iter_packs(source)))
+        if entry is None:
+            print('No changes since the latest release')
+        else:
+            print(f"Released v{entry['version']}")
+    return 0
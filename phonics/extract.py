@@ -0,0 +1,63 @@
+"""Extract packs from the workbook into JSON."""
+
+import json
+
+from phonics import config
+from phonics.model import WORDS, Pack
+from phonics.packfile import is_ndjson, write_packs as write_ndjson
+from phonics.trace import count, span
+from phonics.words import split_words, strip_pack_number
+from phonics.workbook import read_rows
+
+
+def extract_packs(rows, limit=None, table=WORDS):
+    """Turn workbook rows into packs numbered from 1 in sheet order."""
+    all_packs = []
+    for category, description, words in rows:
+        if not category or not words:
+            continue
+
+        word_list = split_words(words)
+        clean_category = strip_pack_number(category)
+        pack_number = len(all_packs) + 1
+
+        all_packs.append(Pack.from_words(
+            pack_number,
+            f"P{pack_number}: {clean_category}",
+            description if description else f"{len(word_list)} words",
+            clean_category,
+            word_list,
+            table=table,
+        ))
+        if limit and len(all_packs) >= limit:
+            break
+    return all_packs
+
+
+def write_packs(path, packs):
+    """Write packs as a JSON array, or one per line if ``path`` ends in ``.ndjson``."""
+    if is_ndjson(path):
+        write_ndjson(path, packs)
+        return
+    data = [pack.to_dict() for pack in packs]
+    with span('write json'), open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+    count('packs written', len(data))
+
+
+def run(args):
+    rows = read_rows(args.workbook)
+    print(f"Reading Excel file with {len(rows)} packs...")
+
+    with span('extract packs'):
+        all_packs = extract_packs(rows, args.limit)
+    for pack in all_packs[:4]:
+        print(f"  P{pack.id}: {pack.category} ({len(pack)} words)")
+
+    print(f"\nExtracted {len(all_packs)} packs")
+    print(f"Total words: {sum(len(p) for p in all_packs)}")
+
+    output = args.output or config.EXTRACTED_JSON
+    write_packs(output, all_packs)
+    print(f"\nSaved to {output}")
+    return 0
@@ -0,0 +1,160 @@
+"""Word families: a suffix index over every pack word.
+
+Words are inserted reversed into a trie, so every word ending in ``-ump`` sits
+under the path ``p -> m -> u``. Each node keeps the ``(pack id, word)``
+entries of its whole subtree sorted by pack id, so "words ending in -ump in
+packs up to 20" is a walk of the ending plus a bisect, and the rest of the
+work is proportional to the answer. Postings are ``array('I')`` columns of
+pack ids and ``WordTable`` ids.
+
+``families`` also exports every rime (the last vowel sound and what follows:
+c-*at*, j-*ump*, c-*ake*, n-*ight*) shared by enough one-syllable words as
+``word_families.json``, ready to be cut into word-family packs.
+"""
+
+import json
+from array import array
+from bisect import bisect_left, bisect_right
+
+from phonics import config
+from phonics.appdata import read_word_packs
+from phonics.features import load_features
+from phonics.model import WORDS
+from phonics.trace import count, span
+
+VOWELS = 'aeiou'
+MIN_FAMILY = 4
+
+
+class SuffixIndex:
+    """Reversed-word trie with pack-sorted postings at every node."""
+
+    def __init__(self, packs, table=WORDS):
+        self.table = table
+        self.children = [{}]
+        pack_ids = [array('I')]
+        word_ids = [array('I')]
+        # Packs in id order keep every node's postings sorted by pack id
+        for pack in sorted(packs, key=lambda p: p.id):
+            for word_id, word in zip(pack.word_ids, pack.words):
+                node = 0
+                pack_ids[0].append(pack.id)
+                word_ids[0].append(word_id)
+                for ch in reversed(word.lower()):
+                    child = self.children[node].get(ch)
+                    if child is None:
+                        child = len(self.children)
+                        self.children[node][ch] = child
+                        self.children.append({})
+                        pack_ids.append(array('I'))
+                        word_ids.append(array('I'))
+                    node = child
+                    pack_ids[node].append(pack.id)
+                    word_ids[node].append(word_id)
+        self.pack_ids = pack_ids
+        self.word_ids = word_ids
+        count('suffix index nodes', len(self.children))
+
+    def _node(self, ending):
+        node = 0
+        for ch in reversed(ending.lower().lstrip('-')):
+            node = self.children[node].get(ch)
+            if node is None:
+                return None
+        return node
+
+    def ending(self, ending, min_pack=None, max_pack=None):
+        """``[(pack id, word)]`` for words ending in ``ending``, optionally within a pack range."""
+        node = self._node(ending)
+        if node is None:
+            return []
+        ids = self.pack_ids[node]
+        lo = 0 if min_pack is None else bisect_left(ids, min_pack)
+        hi = len(ids) if max_pack is None else bisect_right(ids, max_pack)
+        words = self.word_ids[node]
+        return [(ids[i], self.table[words[i]]) for i in range(lo, hi)]
+
+
+def _is_vowel(word, i):
+    # y is a vowel after the first letter (my, gym, play)
+    return word[i] in VOWELS or (word[i] == 'y' and i > 0)
+
+
+def rime(word):
+    """The rime of a one-syllable word (``jump`` -> ``ump``, ``cake`` -> ``ake``); ``None`` if no vowel."""
+    word = word.lower()
+    core = word
+    # Split digraph: the final e belongs to the rime but is not its vowel
+    if len(word) > 2 and word.endswith('e') and not _is_vowel(word, len(word) - 2):
+        core = word[:-1]
+    end = len(core)
+    while end and not _is_vowel(core, end - 1):
+        end -= 1
+    if not end:
+        if core is word:
+            return None
+        core, end = word, len(word)
+    start = end - 1
+    while start > 0 and _is_vowel(core, start - 1):
+        start -= 1
+    if core[start - 1:start + 1] == 'qu':
+        start += 1
+    return word[start:]
+
+
+def word_families(index, packs, features, min_size=MIN_FAMILY):
+    """``{rime: [(pack id, word)]}`` for rimes shared by at least ``min_size`` one-syllable words.
+
+    Syllable counts and rimes come from ``features`` (a ``FeatureTable``).
+    """
+    rimes = {}
+    for pack in packs:
+        for word in pack.words:
+            if ' ' in word or features.syllables(word) != 1:
+                continue
+            r = features.rime(word)
+            if r:
+                rimes.setdefault(r, set()).add(word.lower())
+    families = {}
+    for r, words in rimes.items():
+        if len(words) >= min_size:
+            # The ending query also finds longer words (thumping); keep the one-syllable
+            # family, each word from the first pack it appears in
+            entries = {}
+            for pack_id, word in index.ending(r):
+                if word.lower() in words:
+                    entries.setdefault(word.lower(), (pack_id, word))
+            families[r] = list(entries.values())
+    return dict(sorted(families.items(), key=lambda item: (-len(item[1]), item[0])))
+
+
+def render_families(families):
+    return json.dumps({
+        f"-{r}": [{'pack': p, 'word': w} for p, w in entries]
+        for r, entries in families.items()
+    }, indent=2, ensure_ascii=False) + '\n'
+
+
+def run(args):
+    packs = read_word_packs()
+    with span('build suffix index'):
+        index = SuffixIndex(packs)
+
+    if args.ending:
+        results = index.ending(args.ending, args.min_pack, args.max_pack)
+        for pack_id, word in results:
+            print(f"  P{pack_id:<4} {word}")
+        print(f"{len(results)} words ending in -{args.ending.lstrip('-')}")
+        return 0
+
+    with span('load features'):
+        features = load_features(word for pack in packs for word in pack.words)
+    with span('find families'):
+        families = word_families(index, packs, features, args.min_size)
+    for r, entries in list(families.items())[:20]:
+        print(f"  -{r:<6} {len(entries):>3} words")
+    output = args.output or config.WORD_FAMILIES_JSON
+    with open(output, 'w', encoding='utf-8') as f:
+        f.write(render_families(families))
+    print(f"{len(families)} word families saved to {output}")
+    return 0
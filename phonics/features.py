@@ -0,0 +1,204 @@
+"""Per-word features, computed once and shared by every command.
+
+For each word, keyed by its lower-case form, the table holds:
+
+* ``syllables``  - ``difficulty.count_syllables``
+* ``length``     - letters and other characters
+* ``difficulty`` - ``difficulty.get_difficulty_score``
+* ``graphemes``  - ``coverage.graphemes``, space-separated (``n igh t``)
+* ``rime``       - ``families.rime`` (empty if the word has no vowel)
+* ``frequency``  - rank in the frequency list (``config.WORD_FREQUENCY``), when there is one
+
+The table is stored column by column in one marshal file under
+``config.CACHE_DIR``: the sorted words, one packed array per number column and
+one list per text column. Loading it for a set of words computes features
+only for words it has never seen, so words repeated across levels, packs,
+banks and variants are computed once. The frequency column is re-ranked only
+when the frequency list changes, and ``FEATURES_VERSION`` is bumped when a
+feature's definition changes.
+
+``split``, ``reorganize``, ``coverage``, ``families`` and ``calibrate`` read
+their word features from here.
+"""
+
+import marshal
+import os
+from array import array
+
+from phonics import config
+from phonics.trace import count, span
+
+FEATURES_VERSION = 1
+CACHE_FILE = 'features.bin'
+
+NUMBER_COLUMNS = {'syllables': 'B', 'length': 'H', 'difficulty': 'H', 'frequency': 'I'}
+TEXT_COLUMNS = ('graphemes', 'rime')
+
+
+def word_key(word):
+    return word.lower()
+
+
+def compute_features(words):
+    """Every feature but ``frequency`` for ``words`` (already keys), as columns."""
+    from phonics.coverage import graphemes
+    from phonics.difficulty import count_syllables, get_difficulty_score
+    from phonics.families import rime
+
+    columns = {name: array(code) for name, code in NUMBER_COLUMNS.items() if name != 'frequency'}
+    columns.update({name: [] for name in TEXT_COLUMNS})
+    for word in words:
+        columns['syllables'].append(min(count_syllables(word), 255))
+        columns['length'].append(len(word))
+        columns['difficulty'].append(get_difficulty_score(word))
+        columns['graphemes'].append(' '.join(graphemes(word)))
+        columns['rime'].append(rime(word) or '')
+    count('features computed', len(words))
+    return columns
+
+
+def _frequency_signature(path):
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (str(path), st.st_size, st.st_mtime_ns)
+
+
+class FeatureTable:
+    """Columns of features over ``words`` (sorted keys)."""
+
+    def __init__(self, words, columns, frequency_signature=None):
+        self.words = words
+        self.columns = columns
+        self.frequency_signature = frequency_signature
+        self._rows = {word: i for i, word in enumerate(words)}
+
+    @property
+    def ranked(self):
+        """Whether the table has frequency ranks."""
+        return self.frequency_signature is not None
+
+    def __len__(self):
+        return len(self.words)
+
+    def __contains__(self, word):
+        return word_key(word) in self._rows
+
+    def value(self, feature, word):
+        return self.columns[feature][self._rows[word_key(word)]]
+
+    def syllables(self, word):
+        return self.value('syllables', word)
+
+    def difficulty(self, word):
+        return self.value('difficulty', word)
+
+    def graphemes(self, word):
+        return self.value('graphemes', word).split()
+
+    def rime(self, word):
+        return self.value('rime', word) or None
+
+    def frequency(self, word):
+        return self.value('frequency', word)
+
+    def row(self, word):
+        i = self._rows[word_key(word)]
+        return {name: column[i] for name, column in self.columns.items()}
+
+    def merged(self, words, columns):
+        """A new table with ``words`` (keys not in this one) and their computed ``columns`` added."""
+        order = sorted(range(len(self.words) + len(words)),
+                       key=lambda i: self.words[i] if i < len(self.words) else words[i - len(self.words)])
+        merged = {}
+        for name, column in columns.items():
+            old = self.columns[name]
+            joined = old + column
+            merged[name] = (array(old.typecode, (joined[i] for i in order)) if isinstance(old, array)
+                            else [joined[i] for i in order])
+        all_words = self.words + words
+        return FeatureTable([all_words[i] for i in order], merged)
+
+    def with_frequency(self, path):
+        """This table with the frequency column ranked against the list at ``path`` (dropped if none)."""
+        from phonics.frequency import load_frequency
+
+        signature = _frequency_signature(path)
+        columns = {name: column for name, column in self.columns.items() if name != 'frequency'}
+        if signature is not None:
+            with span('rank words'):
+                ranks = load_frequency(path).rank_words(self.words)
+            columns['frequency'] = array('I', (ranks[word] for word in self.words))
+        return FeatureTable(self.words, columns, signature)
+
+    def dump(self):
+        return {
+            'version': FEATURES_VERSION,
+            'frequency': self.frequency_signature,
+            'words': self.words,
+            'columns': {name: column.tobytes() if isinstance(column, array) else column
+                        for name, column in self.columns.items()},
+        }
+
+    @classmethod
+    def load(cls, data):
+        columns = {name: array(NUMBER_COLUMNS[name], column) if name in NUMBER_COLUMNS else column
+                   for name, column in data['columns'].items()}
+        return cls(data['words'], columns, data['frequency'])
+
+
+def _empty():
+    columns = {name: array(code) for name, code in NUMBER_COLUMNS.items() if name != 'frequency'}
+    columns.update({name: [] for name in TEXT_COLUMNS})
+    return FeatureTable([], columns)
+
+
+def load_features(words=(), frequency_list=None, cache_dir=None):
+    """The feature table, extended with any of ``words`` it does not have yet."""
+    cache_file = (cache_dir or config.CACHE_DIR) / CACHE_FILE
+    frequency_path = frequency_list or config.WORD_FREQUENCY
+    table = None
+    try:
+        with span('read features'), open(cache_file, 'rb') as f:
+            data = marshal.load(f)
+        if data['version'] == FEATURES_VERSION:
+            table = FeatureTable.load(data)
+    except (OSError, EOFError, ValueError, TypeError, KeyError):
+        pass
+    changed = table is None
+    if table is None:
+        table = _empty()
+
+    missing = sorted({word_key(w) for w in words} - table._rows.keys())
+    if missing:
+        with span('compute features'):
+            table = table.merged(missing, compute_features(missing))
+        changed = True
+    if changed or table.frequency_signature != _frequency_signature(frequency_path):
+        table = table.with_frequency(frequency_path)
+        changed = True
+
+    if changed:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp = cache_file.with_name(f'{cache_file.name}.{os.getpid()}.tmp')
+        with open(tmp, 'wb') as f:
+            marshal.dump(table.dump(), f)
+        os.replace(tmp, cache_file)
+    return table
+
+
+def run(args):
+    from phonics.appdata import read_word_packs
+
+    words = [word for pack in read_word_packs() for word in pack.words]
+    table = load_features(words, args.frequency_list)
+    for word in args.words:
+        if word not in table:
+            table = load_features([word], args.frequency_list)
+        row = table.row(word)
+        print(f"{word}: " + ', '.join(f"{name} {row[name]!r}" if name in TEXT_COLUMNS else f"{name} {row[name]}"
+                                      for name in sorted(row)))
+    print(f"{len(table)} words in the feature table "
+          f"({'with' if table.ranked else 'no'} frequency ranks)")
+    return 0
@@ -0,0 +1,74 @@
+"""Word frequency ranks from a local frequency list.
+
+The list is a text file with one word per line, optionally followed by a count
+(``the 23135851162`` or ``the<TAB>23135851162``, as in most published lists).
+With counts, rank 1 is the most frequent word; without, words are ranked in
+file order. The table keeps the words in one sorted list with a parallel
+``array('I')`` of ranks, so a lookup is a bisect and the whole table costs
+little more than the strings themselves.
+"""
+
+from array import array
+from bisect import bisect_left
+
+from phonics import config
+from phonics.trace import count, span
+
+
+class FrequencyTable:
+    """Sorted ``words`` with a parallel array of ``ranks``."""
+
+    def __init__(self, words, ranks):
+        self.words = words
+        self.ranks = ranks
+        # Words missing from the list sort after every listed word
+        self.unranked = len(words) + 1
+
+    @classmethod
+    def from_counts(cls, counts):
+        """Build from ``{word: count}``; ties are ranked alphabetically."""
+        by_count = sorted(counts.items(), key=lambda item: (-item[1], item[0]))
+        ranked = sorted((word, rank) for rank, (word, _) in enumerate(by_count, 1))
+        return cls([w for w, _ in ranked], array('I', (r for _, r in ranked)))
+
+    def rank(self, word):
+        """Rank of ``word`` (case-insensitive), or ``unranked``."""
+        word = word.lower()
+        i = bisect_left(self.words, word)
+        if i < len(self.words) and self.words[i] == word:
+            return self.ranks[i]
+        return self.unranked
+
+    def rank_words(self, words):
+        """``{word: rank}`` for many words in one merge pass over the sorted table."""
+        ranks = {}
+        i, n = 0, len(self.words)
+        for word in sorted(set(words), key=str.lower):
+            key = word.lower()
+            i = bisect_left(self.words, key, i)
+            ranks[word] = self.ranks[i] if i < n and self.words[i] == key else self.unranked
+        count('words ranked', len(ranks))
+        return ranks
+
+    def __len__(self):
+        return len(self.words)
+
+
+def load_frequency(path=None):
+    """Read a frequency list; ``None`` if the file does not exist."""
+    counts = {}
+    try:
+        with span('load frequency list'), open(path or config.WORD_FREQUENCY, 'r', encoding='utf-8') as f:
+            for line_no, line in enumerate(f):
+                parts = line.split()
+                if not parts:
+                    continue
+                word = parts[0].lower()
+                if len(parts) > 1 and parts[1].isdigit():
+                    counts[word] = counts.get(word, 0) + int(parts[1])
+                else:
+                    # No count: earlier lines are more frequent
+                    counts.setdefault(word, -line_no)
+    except FileNotFoundError:
+        return None
+    return FrequencyTable.from_counts(counts)
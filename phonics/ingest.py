@@ -0,0 +1,260 @@
+"""Ingest the word tables from ``Jolly Phonics Word Bank.pdf``.
+
+Each page is parsed in a process pool into ``(sound label, words)`` sections.
+Parsed pages are cached under ``config.CACHE_DIR`` by a hash of the page's
+content stream, so re-ingesting a revised PDF only parses the pages that
+changed. Sections are then stitched together in page order (a table row can
+run over a page break), normalised, and mapped onto the workbook categories.
+Tokens with an internal space are only ingested when the workbook already
+has that phrase; the rest are reported as problems.
+"""
+
+import hashlib
+import json
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+
+from phonics import config
+from phonics.trace import count, span
+from phonics.words import base_category, normalise_word, split_words, strip_pack_number, unknown_phrase
+from phonics.workbook import read_rows
+
+# Bump when the page parser changes so cached pages are re-parsed
+PARSER_VERSION = 1
+PAGE_CACHE = 'pdf_pages'
+MAX_PROBLEMS_SHOWN = 20
+
+# Sound labels used in the left-hand column of the PDF tables
+SOUND_LABELS = {
+    's', 'a', 't', 'i', 'p', 'n', 'c,k', 'ck', 'e', 'h', 'r', 'm', 'd', 'g', 'o', 'u',
+    'l', 'f', 'b', 'ai', 'j', 'oa', 'ie', 'ee', 'or', 'z', 'w', 'ng', 'v', 'oo', 'y',
+    'x', 'ch', 'sh', 'th', 'qu', 'ou', 'oi', 'ue', 'er', 'ar', 'a-e', 'e-e', 'i-e',
+    'o-e', 'u-e', 'ay', 'oy', 'ea', 'igh', 'ow', 'ir', 'ur', 'ew', 'au', 'aw', 'al',
+    'ph', 'wh', 'softc', 'softg', 'y/ee/', 'y/ie/', 'y/i/', 'ow/oa/', 'ow/ou/',
+}
+LABEL_LINE = re.compile(
+    r'^\s*([Ss]oft\s*[cg]|y\s*/\s*\w+\s*/|ow\s*/\s*\w+\s*/|[a-z]-e|c,k|[a-z]{1,3})'
+    r'(?:[\t\r\xa0 ]+(.*))?$'
+)
+
+# Sound label -> workbook category; labels not listed here fall back to
+# whichever category already contains the word
+LABEL_CATEGORIES = {
+    'a': '1. SHORT VOWEL A',
+    'e': '1. SHORT VOWEL E',
+    'i': '1. SHORT VOWEL I',
+    'o': '1. SHORT VOWEL O',
+    'u': '1. SHORT VOWEL U',
+    'ch': '3. DIGRAPH CH',
+    'sh': '3. DIGRAPH SH',
+    'th': '3. DIGRAPH TH (unvoiced)',
+    'wh': '3. DIGRAPH WH',
+    'ph': '3. DIGRAPH PH',
+    'ai': '4. AI/AY (long A)',
+    'ay': '4. AI/AY (long A)',
+    'ee': '4. EE/EA (long E)',
+    'ea': '4. EE/EA (long E)',
+    'ie': '4. IGH/IE/Y (long I)',
+    'igh': '4. IGH/IE/Y (long I)',
+    'y/ie/': '4. IGH/IE/Y (long I)',
+    'oa': '4. OA/OW (long O)',
+    'ow/oa/': '4. OA/OW (long O)',
+    'ue': '4. UE/EW (long U)',
+    'ew': '4. UE/EW (long U)',
+    'au': '5. AU/AW',
+    'aw': '5. AU/AW',
+    'oi': '5. OI/OY',
+    'oy': '5. OI/OY',
+    'ou': '5. OU/OW (cow sound)',
+    'ow/ou/': '5. OU/OW (cow sound)',
+    'ar': '6. AR',
+    'or': '6. OR',
+    'er': '6. ER/IR/UR',
+    'ir': '6. ER/IR/UR',
+    'ur': '6. ER/IR/UR',
+    'ng': '6A. NG/NK ENDINGS',
+    'y/ee/': '6B. Y as /ee/ ENDING',
+    'al': '6D. AL PATTERN',
+    'a-e': '7. MAGIC E / SPLIT DIGRAPHS',
+    'e-e': '7. MAGIC E / SPLIT DIGRAPHS',
+    'i-e': '7. MAGIC E / SPLIT DIGRAPHS',
+    'o-e': '7. MAGIC E / SPLIT DIGRAPHS',
+    'u-e': '7. MAGIC E / SPLIT DIGRAPHS',
+    'oo': '8. OO (two sounds)',
+    'softc': '8. SOFT C/G',
+    'softg': '8. SOFT C/G',
+}
+
+_reader = None
+
+
+def parse_page_text(text):
+    """Split one page of text into ``[label, words]`` sections.
+
+    Words before the first label on the page get a ``None`` label; they belong
+    to the last section of the previous page.
+    """
+    sections = [[None, []]]
+    for line in text.split('\n'):
+        if line.strip() == 'sound':  # second line of the "y /ee/ sound" label
+            continue
+        match = LABEL_LINE.match(line)
+        label = re.sub(r'\s+', '', match.group(1)).lower() if match else None
+        if label in SOUND_LABELS:
+            sections.append([label, []])
+            line = match.group(2) or ''
+        for token in line.split(','):
+            word = normalise_word(token)
+            if word:
+                sections[-1][1].append(word)
+    return [s for s in sections if s[0] is not None or s[1]]
+
+
+def page_hash(page):
+    """Hash of a pypdf page's content stream plus the parser version."""
+    contents = page.get_contents()
+    data = contents.get_data() if contents is not None else b''
+    return hashlib.sha256(b'%d:' % PARSER_VERSION + data).hexdigest()
+
+
+def _init_worker(path):
+    global _reader
+    from pypdf import PdfReader
+
+    _reader = PdfReader(path)
+
+
+def _parse_page(index):
+    return index, parse_page_text(_reader.pages[index].extract_text())
+
+
+def parse_pdf(path, jobs=None):
+    """Parse every page of the PDF, reusing cached pages. Returns sections per page."""
+    from pypdf import PdfReader
+
+    cache_dir = config.CACHE_DIR / PAGE_CACHE
+    cache_dir.mkdir(parents=True, exist_ok=True)
+
+    with span('hash pages'):
+        hashes = [page_hash(page) for page in PdfReader(path).pages]
+    pages = [None] * len(hashes)
+    todo = []
+    for index, digest in enumerate(hashes):
+        cache_file = cache_dir / f'{digest}.json'
+        if cache_file.exists():
+            pages[index] = json.loads(cache_file.read_text(encoding='utf-8'))
+        else:
+            todo.append(index)
+
+    count('pages cached', len(hashes) - len(todo))
+    count('pages parsed', len(todo))
+    if todo:
+        workers = min(jobs or os.cpu_count() or 1, len(todo))
+        with span('parse pages'), \
+                ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(str(path),)) as pool:
+            for index, sections in pool.map(_parse_page, todo):
+                pages[index] = sections
+                (cache_dir / f'{hashes[index]}.json').write_text(json.dumps(sections), encoding='utf-8')
+
+    return pages, len(todo)
+
+
+def merge_pages(pages):
+    """Join page sections into one ``[(label, words)]`` list in document order."""
+    merged = []
+    for sections in pages:
+        for label, words in sections:
+            if label is None:
+                # Continuation of the previous page's last table row; text
+                # before the first table (the introduction) is dropped
+                if merged:
+                    merged[-1][1].extend(words)
+                continue
+            merged.append((label, list(words)))
+
+    for label, words in merged:
+        seen = set()
+        words[:] = [w for w in words if not (w.lower() in seen or seen.add(w.lower()))]
+    return merged
+
+
+def drop_unknown_phrases(sections, phrases):
+    """Remove words with an internal space that are not in ``phrases``. Returns the problems."""
+    problems = []
+    for label, words in sections:
+        kept = []
+        for word in words:
+            if unknown_phrase(word, phrases):
+                problems.append(f"{label}: not a word or known phrase: {word!r}")
+            else:
+                kept.append(word)
+        words[:] = kept
+    return problems
+
+
+def category_index(rows):
+    """Map each workbook word (lowercased) to the first base category it appears in."""
+    index = {}
+    for category, _, words in rows:
+        if not category or not words:
+            continue
+        base = base_category(strip_pack_number(category))
+        for word in split_words(words):
+            index.setdefault(word.lower(), base)
+    return index
+
+
+def map_to_categories(sections, index):
+    """Assign every ingested word to a workbook category."""
+    categories = {}
+    unmapped = []
+    for label, words in sections:
+        for word in words:
+            key = word.lower()
+            category = LABEL_CATEGORIES.get(label) or index.get(key)
+            if category is None:
+                unmapped.append(word)
+                continue
+            entry = categories.setdefault(category, {'words': [], 'new': []})
+            if word not in entry['words']:
+                entry['words'].append(word)
+                if index.get(key) != category:
+                    entry['new'].append(word)
+    return categories, unmapped
+
+
+def run(args):
+    pdf = args.pdf or config.JOLLY_PDF
+    pages, parsed = parse_pdf(pdf, args.jobs)
+    print(f"Read {len(pages)} pages ({parsed} parsed, {len(pages) - parsed} from cache)")
+
+    with span('merge pages'):
+        sections = merge_pages(pages)
+    index = category_index(read_rows(args.workbook))
+    problems = drop_unknown_phrases(sections, index)
+    with span('map categories'):
+        categories, unmapped = map_to_categories(sections, index)
+
+    for category, entry in sorted(categories.items()):
+        print(f"  {category:<40} {len(entry['words']):>4} words ({len(entry['new'])} new)")
+    print(f"\nSound sections: {len(sections)}")
+    print(f"Words: {sum(len(w) for _, w in sections)}")
+    print(f"Unmapped words: {len(unmapped)}")
+    print(f"Problems: {len(problems)}")
+    for problem in problems[:MAX_PROBLEMS_SHOWN]:
+        print(f"  {problem}")
+    if len(problems) > MAX_PROBLEMS_SHOWN:
+        print(f"  ... and {len(problems) - MAX_PROBLEMS_SHOWN} more")
+
+    output = args.output or config.INGEST_JSON
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump({
+            'source': os.path.basename(pdf),
+            'sections': [{'label': label, 'words': words} for label, words in sections],
+            'categories': categories,
+            'unmapped': unmapped,
+            'problems': problems,
+        }, f, indent=2, ensure_ascii=False)
+    print(f"\nSaved to {output}")
+    return 0
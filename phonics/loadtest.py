@@ -0,0 +1,96 @@
+"""Load-test ``python -m phonics serve`` on localhost.
+
+Opens ``--clients`` keep-alive connections and sends ``--requests`` GETs on
+each, spread over every path in the server's manifest. A ``--revalidate``
+fraction of requests repeat a path the client has already fetched with its
+ETag in ``If-None-Match``, as a browser revalidating its cache would, and
+should come back as 304s. Reports throughput, latency percentiles, status
+counts and bytes received.
+"""
+
+import asyncio
+import json
+import random
+import time
+
+
+async def fetch(reader, writer, host, path, etag=None, gzip=True):
+    """Send one GET on an open connection. Returns ``(status, etag, body bytes)``."""
+    lines = [f'GET {path} HTTP/1.1', f'Host: {host}']
+    if gzip:
+        lines.append('Accept-Encoding: gzip')
+    if etag:
+        lines.append(f'If-None-Match: {etag}')
+    writer.write(('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1'))
+    await writer.drain()
+
+    head = (await reader.readuntil(b'\r\n\r\n')).decode('latin-1').split('\r\n')
+    status = int(head[0].split()[1])
+    headers = {}
+    for line in head[1:]:
+        name, _, value = line.partition(':')
+        if name:
+            headers[name.strip().lower()] = value.strip()
+    body = await reader.readexactly(int(headers.get('content-length', 0)))
+    return status, headers.get('etag'), body
+
+
+async def client(host, port, paths, requests, revalidate, results, rng):
+    reader, writer = await asyncio.open_connection(host, port)
+    etags = {}
+    try:
+        for _ in range(requests):
+            if etags and rng.random() < revalidate:
+                path = rng.choice(list(etags))
+            else:
+                path = rng.choice(paths)
+            start = time.perf_counter()
+            status, etag, body = await fetch(reader, writer, host, path, etags.get(path))
+            results.append((time.perf_counter() - start, status, len(body)))
+            if etag:
+                etags[path] = etag
+    finally:
+        writer.close()
+
+
+async def load_test(host, port, clients, requests, revalidate, seed=0):
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        _, _, body = await fetch(reader, writer, host, '/manifest.json', gzip=False)
+    finally:
+        writer.close()
+    paths = list(json.loads(body))
+
+    results = []
+    rng = random.Random(seed)
+    start = time.perf_counter()
+    await asyncio.gather(*(
+        client(host, port, paths, requests, revalidate, results, random.Random(rng.random()))
+        for _ in range(clients)
+    ))
+    return time.perf_counter() - start, results
+
+
+def _percentile(sorted_values, p):
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * p))]
+
+
+def run(args):
+    try:
+        elapsed, results = asyncio.run(load_test(args.host, args.port, args.clients,
+                                                 args.requests, args.revalidate))
+    except ConnectionRefusedError:
+        print(f"Nothing listening on {args.host}:{args.port}; start `python -m phonics serve` first")
+        return 1
+
+    latencies = sorted(r[0] for r in results)
+    statuses = {}
+    for _, status, _ in results:
+        statuses[status] = statuses.get(status, 0) + 1
+    print(f"{len(results):,} requests from {args.clients} clients in {elapsed:.2f}s "
+          f"({len(results) / elapsed:,.0f} req/s)")
+    print('Latency: ' + ', '.join(f"p{int(p * 100)} {_percentile(latencies, p) * 1000:.2f} ms"
+                                  for p in (0.5, 0.95, 0.99)))
+    print('Status:  ' + ', '.join(f"{status} x {n:,}" for status, n in sorted(statuses.items())))
+    print(f"Body bytes received: {sum(r[2] for r in results):,}")
+    return 0
@@ -0,0 +1,262 @@
+"""Merge pupils' exported progress backups into one progress file each.
+
+``storageService.exportProgress()`` writes a pupil's whole ``UserProgress``
+(``{packId: {words, starred, completed, completionCount, lastReviewed}}``)
+as JSON. Given a directory of these exports, files are grouped by pupil:
+
+* a file in a subdirectory belongs to the pupil named by that directory
+  (``backups/amelia/ipad-3.json``), and
+* a file directly in the directory to the part of its name before the first
+  ``_`` (``backups/amelia_ipad-3.json``).
+
+Each pupil's files are streamed with ijson, one pack at a time, and merged
+last-writer-wins: every word and starred mark takes its value from the export
+whose ``lastReviewed`` for that pack is latest (ties go to the newer file),
+``completed`` follows the latest export of the pack, ``completionCount`` is
+the highest seen and ``lastReviewed`` the latest. An export records no time
+for removing a mark, so a word marked on any device stays marked.
+
+Only one pupil's merged progress is in memory at a time. The result is
+written as ``<pupil>.json`` in the format ``importProgress`` reads, or
+upserted into ``pack_progress`` with ``--database`` (pupil names must then be
+user ids). A merged pack never replaces a database row reviewed more recently.
+"""
+
+import json
+import os
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+
+from phonics import db
+from phonics.trace import count, span
+
+EPOCH = datetime.min.replace(tzinfo=timezone.utc)
+MAX_PROBLEMS_SHOWN = 20
+
+UPSERT_PROGRESS = """
+    INSERT INTO pack_progress
+      (user_id, pack_id, words, starred, completed, completion_count, last_reviewed, synced_at)
+    VALUES %s
+    ON CONFLICT (user_id, pack_id) DO UPDATE SET
+      words = EXCLUDED.words,
+      starred = EXCLUDED.starred,
+      completed = EXCLUDED.completed,
+      completion_count = GREATEST(pack_progress.completion_count, EXCLUDED.completion_count),
+      last_reviewed = EXCLUDED.last_reviewed,
+      synced_at = EXCLUDED.synced_at,
+      updated_at = NOW()
+    WHERE pack_progress.last_reviewed IS NULL
+       OR EXCLUDED.last_reviewed >= pack_progress.last_reviewed
+"""
+USER_QUERY = 'SELECT 1 FROM auth.users WHERE id = %s'
+UPSERT_TEMPLATE = '(%s, %s, %s::jsonb, %s::jsonb, %s, %s, %s, %s)'
+
+
+def pupil_of(path, root):
+    relative = path.relative_to(root)
+    if len(relative.parts) > 1:
+        return relative.parts[0]
+    return path.stem.split('_', 1)[0]
+
+
+def group_exports(root):
+    """``{pupil: [export paths]}`` for the ``.json`` files under ``root``."""
+    root = Path(root)
+    pupils = {}
+    for path in sorted(root.rglob('*.json')):
+        pupils.setdefault(pupil_of(path, root), []).append(path)
+    return pupils
+
+
+def parse_time(value):
+    if not isinstance(value, str):
+        return None
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def read_export(path):
+    """Yield ``(pack id, pack progress)`` from one export, a pack at a time."""
+    import ijson
+
+    with open(path, 'rb') as f:
+        yield from ijson.kvitems(f, '', use_float=True)
+
+
+class PupilProgress:
+    """One pupil's packs, merged last-writer-wins across exports."""
+
+    def __init__(self):
+        self.packs = {}
+
+    def add(self, pack_id, progress, file_time):
+        if not isinstance(progress, dict) or not isinstance(progress.get('words'), dict):
+            return False
+        reviewed = parse_time(progress.get('lastReviewed'))
+        stamp = (reviewed or EPOCH, file_time)
+        pack = self.packs.get(pack_id)
+        if pack is None:
+            pack = self.packs[pack_id] = {'words': {}, 'starred': {}, 'stamp': None,
+                                          'completed': False, 'completionCount': 0,
+                                          'lastReviewed': None, 'reviewed': EPOCH}
+
+        for key in ('words', 'starred'):
+            marks = pack[key]
+            for word, status in (progress.get(key) or {}).items():
+                held = marks.get(word)
+                if held is None or stamp >= held[0]:
+                    marks[word] = (stamp, status)
+
+        if pack['stamp'] is None or stamp >= pack['stamp']:
+            pack['stamp'] = stamp
+            pack['completed'] = bool(progress.get('completed'))
+        pack['completionCount'] = max(pack['completionCount'], int(progress.get('completionCount') or 0))
+        if reviewed is not None and reviewed >= pack['reviewed']:
+            pack['reviewed'] = reviewed
+            pack['lastReviewed'] = progress['lastReviewed']
+        return True
+
+    def progress(self):
+        """The merged ``UserProgress``, packs in id order."""
+        def order(pack_id):
+            return (0, int(pack_id), '') if pack_id.isdigit() else (1, 0, pack_id)
+
+        merged = {}
+        for pack_id in sorted(self.packs, key=order):
+            pack = self.packs[pack_id]
+            merged[pack_id] = {
+                'words': {w: status for w, (_, status) in pack['words'].items()},
+                'starred': {w: status for w, (_, status) in pack['starred'].items()},
+                'completed': pack['completed'],
+                'completionCount': pack['completionCount'],
+                'lastReviewed': pack['lastReviewed'],
+            }
+        return merged
+
+
+def merge_pupil(paths, report):
+    """Merge one pupil's exports. Calls ``report(path, message)`` for files or packs it skips."""
+    from ijson import JSONError
+
+    pupil = PupilProgress()
+    for path in paths:
+        file_time = os.stat(path).st_mtime
+        try:
+            for pack_id, progress in read_export(path):
+                if not pupil.add(pack_id, progress, file_time):
+                    report(path, f"pack {pack_id} is not pack progress")
+        except JSONError as e:
+            report(path, f"not a progress export ({str(e).splitlines()[0]})")
+            continue
+        count('exports read')
+    count('packs merged', len(pupil.packs))
+    return pupil.progress()
+
+
+def write_pupil(out_dir, pupil, progress):
+    path = out_dir / f'{pupil}.json'
+    tmp = path.with_name(f'{path.name}.tmp')
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(progress, f, indent=2, ensure_ascii=False)
+    os.replace(tmp, path)
+
+
+def merged(pupils, report, out_dir=None):
+    """Yield ``(pupil, progress)`` for each pupil, writing ``<pupil>.json`` to ``out_dir`` if given."""
+    for pupil, paths in pupils.items():
+        with span('merge pupil'):
+            progress = merge_pupil(paths, report)
+        if out_dir:
+            write_pupil(out_dir, pupil, progress)
+        yield pupil, progress
+
+
+def load_progress(conn, pupils, report):
+    """Upsert merged ``(pupil, progress)`` pairs into ``pack_progress`` in one transaction."""
+    loaded, batch = 0, []
+    synced_at = datetime.now(timezone.utc)
+
+    with conn, conn.cursor() as cur:
+        def flush():
+            if batch:
+                with span('upsert progress'):
+                    db.insert_values(cur, UPSERT_PROGRESS, batch, template=UPSERT_TEMPLATE)
+                count('rows written', len(batch))
+                batch.clear()
+
+        for pupil, progress in pupils:
+            try:
+                user_id = str(uuid.UUID(pupil))
+            except ValueError:
+                report(pupil, 'not a user id, so not loaded')
+                continue
+            cur.execute(USER_QUERY, (user_id,))
+            if cur.fetchone() is None:
+                report(pupil, 'no such user, so not loaded')
+                continue
+            for pack_id, pack in progress.items():
+                if not pack_id.isdigit():
+                    report(pupil, f"custom pack {pack_id} is not stored in pack_progress")
+                    continue
+                batch.append((user_id, int(pack_id), json.dumps(pack['words'], ensure_ascii=False),
+                              json.dumps(pack['starred'], ensure_ascii=False), pack['completed'],
+                              pack['completionCount'], pack['lastReviewed'], synced_at))
+                loaded += 1
+                if len(batch) >= db.PAGE_SIZE:
+                    flush()
+        flush()
+    return loaded
+
+
+def run(args):
+    url = None
+    if args.database is not None or not args.output:
+        url = db.database_url(args.database)
+        if not url:
+            print('Pass -o DIR, or --database (or set SUPABASE_DB_URL / DATABASE_URL) to load pack_progress')
+            return 1
+    try:
+        import ijson  # noqa: F401
+    except ImportError:
+        print('ijson is needed to stream exports: pip install ijson')
+        return 1
+
+    pupils = group_exports(args.dir)
+    if not pupils:
+        print(f"No .json exports under {args.dir}")
+        return 1
+
+    problems = []
+
+    def report(where, message):
+        problems.append(f"{where}: {message}")
+
+    if args.output:
+        args.output.mkdir(parents=True, exist_ok=True)
+    results = merged(pupils, report, args.output)
+    loaded = None
+    if url:
+        conn = db.connect(url)
+        try:
+            loaded = load_progress(conn, results, report)
+        finally:
+            conn.close()
+    else:
+        for _ in results:
+            pass
+
+    for problem in problems[:MAX_PROBLEMS_SHOWN]:
+        print(f"  {problem}")
+    if len(problems) > MAX_PROBLEMS_SHOWN:
+        print(f"  ... and {len(problems) - MAX_PROBLEMS_SHOWN} more")
+    files = sum(len(paths) for paths in pupils.values())
+    print(f"Merged {files} exports for {len(pupils)} pupils ({len(problems)} problems)")
+    if args.output:
+        print(f"Wrote {len(pupils)} progress files to {args.output}")
+    if loaded is not None:
+        print(f"Upserted {loaded} packs into pack_progress (rows reviewed more recently are kept)")
+    return 0
@@ -0,0 +1,129 @@
+"""Compact in-memory pack model.
+
+Every word is stored once in a shared ``WordTable`` and packs hold their
+words as an ``array('I')`` of indices into it, so a word that appears in
+several packs, variants or levels costs 4 bytes per occurrence instead of a
+separate string and list slot. ``Pack`` uses ``__slots__``; copies share the
+same word array, so renumbering or reordering packs never copies words.
+Treat ``word_ids`` as immutable and assign a new array to change a pack.
+"""
+
+import json
+from array import array
+
+
+class WordTable:
+    """Interned words addressed by a stable integer id."""
+
+    __slots__ = ('_words', '_ids')
+
+    def __init__(self, words=()):
+        self._words = []
+        self._ids = {}
+        for word in words:
+            self.intern(word)
+
+    def intern(self, word):
+        """Return the id for ``word``, adding it to the table if needed."""
+        word_id = self._ids.get(word)
+        if word_id is None:
+            word_id = len(self._words)
+            self._words.append(word)
+            self._ids[word] = word_id
+        return word_id
+
+    def encode(self, words):
+        """``array('I')`` of ids for a sequence of words."""
+        return array('I', [self.intern(w) for w in words])
+
+    def decode(self, word_ids):
+        return [self._words[i] for i in word_ids]
+
+    def get(self, word):
+        """Id of ``word`` or ``None`` if it has never been interned."""
+        return self._ids.get(word)
+
+    def __getitem__(self, word_id):
+        return self._words[word_id]
+
+    def __len__(self):
+        return len(self._words)
+
+    def __iter__(self):
+        return iter(self._words)
+
+
+WORDS = WordTable()
+
+
+class Pack:
+    """One word pack; the JSON form is produced by ``to_dict``."""
+
+    __slots__ = ('id', 'title', 'description', 'category', 'word_ids',
+                 'sub_pack', 'sub_pack_description', 'table')
+
+    def __init__(self, id, title, description, category, word_ids,
+                 sub_pack=None, sub_pack_description=None, table=WORDS):
+        self.id = id
+        self.title = title
+        self.description = description
+        self.category = category
+        self.word_ids = word_ids
+        self.sub_pack = sub_pack
+        self.sub_pack_description = sub_pack_description
+        self.table = table
+
+    @classmethod
+    def from_words(cls, id, title, description, category, words, table=WORDS, **kwargs):
+        return cls(id, title, description, category, table.encode(words), table=table, **kwargs)
+
+    @classmethod
+    def from_dict(cls, data, table=WORDS):
+        """Build a pack from the dict layout used in the JSON files."""
+        return cls.from_words(
+            data['id'], data.get('title', data.get('category')), data.get('description'),
+            data.get('category'), data['words'], table=table,
+            sub_pack=data.get('subPack'), sub_pack_description=data.get('subPackDescription'),
+        )
+
+    @property
+    def words(self):
+        return self.table.decode(self.word_ids)
+
+    def __len__(self):
+        return len(self.word_ids)
+
+    def replace(self, **changes):
+        """Shallow copy with some fields changed; the word array is shared."""
+        fields = {name: getattr(self, name) for name in self.__slots__}
+        fields.update(changes)
+        return Pack(**fields)
+
+    def to_dict(self):
+        data = {
+            'id': self.id,
+            'title': self.title,
+            'description': self.description,
+            'category': self.category,
+            'words': self.words,
+        }
+        if self.sub_pack is not None:
+            data['subPack'] = self.sub_pack
+            data['subPackDescription'] = self.sub_pack_description
+        return data
+
+    def __eq__(self, other):
+        if not isinstance(other, Pack):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"Pack(id={self.id!r}, category={self.category!r}, words={len(self)})"
+
+
+def load_packs(path, table=WORDS):
+    """Read a packs JSON file into ``Pack`` objects."""
+    with open(path, 'r', encoding='utf-8') as f:
+        return [Pack.from_dict(data, table) for data in json.load(f)]
@@ -0,0 +1,26 @@
+"""Renumber the workbook's sections as ``P1:``, ``P2:``, ... in sheet order."""
+
+from phonics import config
+from phonics.words import strip_pack_number
+from phonics.workbook import read_rows, update_cells
+
+
+def renumber(rows):
+    """Map sheet cell references to their new ``P#: name`` category values."""
+    cells = {}
+    pack_number = 1
+    for index, (category, _, _) in enumerate(rows):
+        if category:
+            cells[f'A{index + 2}'] = f"P{pack_number}: {strip_pack_number(category)}"
+            pack_number += 1
+    return cells
+
+
+def run(args):
+    workbook = args.workbook or config.WORKBOOK
+    cells = renumber(read_rows(workbook))
+    update_cells(workbook, cells)
+
+    print(f"Fixed pack numbers P1 through P{len(cells)}")
+    print(f"Total packs numbered: {len(cells)}")
+    return 0
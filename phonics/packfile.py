@@ -0,0 +1,194 @@
+"""Line-delimited pack files: one pack per line, read one pack at a time.
+
+A ``.ndjson`` (or ``.jsonl``) pack file starts with a header line::
+
+    {"format": "phonics-packs", "version": 1, "fields": ["id", "title", ...]}
+
+followed by one ``Pack.to_dict()`` object per line. ``iter_packs`` yields
+packs as it reads them, so a bank never has to be parsed whole before the
+first pack is used; plain JSON array files (``all_packs_extracted.json``,
+``packs_compact.txt``) are still accepted, parsed in one go.
+
+Next to each pack file ``write_packs`` leaves ``<file>.idx``: the file's
+size and mtime followed by pack ids in order and the byte offset of each
+pack's line, as 64-bit integers. ``read_pack`` binary-searches it and seeks
+straight to one line. A missing or stale index is rebuilt with one scan.
+
+``extract``, ``packs``, ``reorganize`` (which re-reads packs by offset) and
+``export`` stream NDJSON banks; ``export --release`` loads the whole bank,
+as a release is a single JSON document.
+"""
+
+import bisect
+import json
+import os
+from array import array
+
+from phonics.model import WORDS, Pack
+from phonics.trace import count, span
+
+FORMAT = 'phonics-packs'
+VERSION = 1
+FIELDS = ['id', 'title', 'description', 'category', 'words', 'subPack', 'subPackDescription']
+SUFFIXES = ('.ndjson', '.jsonl')
+INDEX_SUFFIX = '.idx'
+
+
+class PackFileError(ValueError):
+    pass
+
+
+def is_ndjson(path):
+    return os.path.splitext(str(path))[1] in SUFFIXES
+
+
+def _header():
+    return json.dumps({'format': FORMAT, 'version': VERSION, 'fields': FIELDS}) + '\n'
+
+
+def _read_header(f, path):
+    try:
+        header = json.loads(f.readline())
+    except ValueError:
+        header = None
+    if not isinstance(header, dict) or header.get('format') != FORMAT:
+        raise PackFileError(f"{path} is not a pack file (no header line)")
+    if header.get('version', 0) > VERSION:
+        raise PackFileError(f"{path} is pack file version {header['version']}; "
+                            f"this toolchain reads up to {VERSION}")
+    return header
+
+
+def write_packs(path, packs):
+    """Write ``packs`` (any iterable) one per line, and its offset index. Returns the pack count."""
+    path = str(path)
+    ids, offsets = array('q'), array('q')
+    n = 0
+    with span('write ndjson'), open(path + '.tmp', 'wb') as f:
+        f.write(_header().encode('utf-8'))
+        for pack in packs:
+            ids.append(pack.id)
+            offsets.append(f.tell())
+            line = json.dumps(pack.to_dict(), ensure_ascii=False, separators=(',', ':'))
+            f.write(line.encode('utf-8') + b'\n')
+            n += 1
+    os.replace(path + '.tmp', path)
+    _write_index(path, ids, offsets)
+    count('packs written', n)
+    return n
+
+
+def iter_packs(path, table=WORDS):
+    """Yield the packs of an NDJSON pack file, or of a JSON array file."""
+    if not is_ndjson(path):
+        with span('read json'), open(path, 'r', encoding='utf-8') as f:
+            try:
+                data = json.load(f)
+            except ValueError as e:
+                raise PackFileError(f"{path} is neither a pack file nor a JSON array: {e}") from None
+        for item in data:
+            yield Pack.from_dict(item, table)
+        return
+
+    with open(path, 'rb') as f:
+        _read_header(f, path)
+        for line in f:
+            if line.strip():
+                yield Pack.from_dict(json.loads(line), table)
+
+
+# ---------------------------------------------------------------------------
+# Offset index
+
+def _signature(path):
+    st = os.stat(path)
+    return [st.st_size, st.st_mtime_ns]
+
+
+def _write_index(path, ids, offsets):
+    order = sorted(range(len(ids)), key=ids.__getitem__)
+    index = array('q', _signature(path))
+    index.extend(ids[i] for i in order)
+    index.extend(offsets[i] for i in order)
+    with open(path + INDEX_SUFFIX, 'wb') as f:
+        index.tofile(f)
+
+
+def build_index(path):
+    """Scan a pack file for line offsets and write its index."""
+    path = str(path)
+    ids, offsets = array('q'), array('q')
+    with span('index ndjson'), open(path, 'rb') as f:
+        _read_header(f, path)
+        while True:
+            offset = f.tell()
+            line = f.readline()
+            if not line:
+                break
+            if line.strip():
+                ids.append(json.loads(line)['id'])
+                offsets.append(offset)
+    _write_index(path, ids, offsets)
+    count('packs indexed', len(ids))
+
+
+def read_index(path):
+    """The index of ``path``, rebuilding it if it is missing or out of date."""
+    path = str(path)
+    index = array('q')
+    try:
+        with open(path + INDEX_SUFFIX, 'rb') as f:
+            index.frombytes(f.read())
+    except OSError:
+        pass
+    if list(index[:2]) != _signature(path):
+        build_index(path)
+        index = array('q')
+        with open(path + INDEX_SUFFIX, 'rb') as f:
+            index.frombytes(f.read())
+    return index
+
+
+def read_pack(path, pack_id, table=WORDS, index=None):
+    """The pack with ``pack_id``, read by seeking to its line; ``None`` if absent."""
+    if index is None:
+        index = read_index(path)
+    n = (len(index) - 2) // 2
+    i = bisect.bisect_left(index, pack_id, 2, 2 + n)
+    if i == 2 + n or index[i] != pack_id:
+        return None
+    with open(path, 'rb') as f:
+        f.seek(index[i + n])
+        return Pack.from_dict(json.loads(f.readline()), table)
+
+
+def run(args):
+    source = str(args.file)
+    try:
+        if args.get:
+            index = read_index(source) if is_ndjson(source) else None
+            for pack_id in args.get:
+                if index is not None:
+                    pack = read_pack(source, pack_id, index=index)
+                else:
+                    pack = next((p for p in iter_packs(source) if p.id == pack_id), None)
+                if pack is None:
+                    print(f"No pack {pack_id} in {source}")
+                    return 1
+                print(json.dumps(pack.to_dict(), ensure_ascii=False))
+            return 0
+
+        if args.output:
+            n = write_packs(args.output, iter_packs(source))
+            print(f"Wrote {n} packs to {args.output} (index {args.output}{INDEX_SUFFIX})")
+            return 0
+
+        packs = words = 0
+        for pack in iter_packs(source):
+            packs += 1
+            words += len(pack)
+        print(f"{source}: {packs} packs, {words} words")
+        return 0
+    except PackFileError as e:
+        print(e)
+        return 1
@@ -0,0 +1,182 @@
+"""Order categories and sub-packs by the graphemes their words need.
+
+Each phonics category teaches a few graphemes (``TEACHES``: ``4. AI/AY``
+teaches ``ai`` and ``ay``). The graphemes of a category's words come from
+the shared feature table (``phonics.features``), and category A is a
+prerequisite of category B when at least ``USE_SHARE`` of B's words use a
+grapheme that A teaches and B does not. Sight-word lists (``SIGHT_WORDS``)
+are learned whole, so they have no prerequisites of their own.
+
+Sub-packs inherit the edges between their categories. Both levels are then
+topologically sorted with Kahn's algorithm: of the categories (or sub-packs)
+whose prerequisites are all placed, the easiest by mean difficulty score
+goes next. The graph is small, so the heap used for that choice adds a log
+factor to an otherwise linear sort. If the words ever make a cycle, the
+easiest node of a cycle that waits on nothing outside itself is placed
+anyway and the cycle is reported; nodes that merely come after a cycle keep
+waiting for it.
+"""
+
+import heapq
+from collections import Counter
+
+# A quarter of the words: at 0.2 the three WH words with a split digraph
+# (white, while, whine) put all the digraphs after Magic E, and at 0.3 the
+# short vowels stop being a prerequisite of Magic E and the R-controlled vowels
+USE_SHARE = 0.25
+
+# The graphemes each phonics category introduces
+TEACHES = {
+    '1. SHORT VOWEL A': ('a',),
+    '1. SHORT VOWEL E': ('e',),
+    '1. SHORT VOWEL I': ('i',),
+    '1. SHORT VOWEL O': ('o',),
+    '1. SHORT VOWEL U': ('u',),
+    '3. DIGRAPH CH': ('ch',),
+    '3. DIGRAPH SH': ('sh',),
+    '3. DIGRAPH TH (unvoiced)': ('th',),
+    '3. DIGRAPH WH': ('wh',),
+    '3. DIGRAPH PH': ('ph',),
+    '4. AI/AY (long A)': ('ai', 'ay'),
+    '4. EE/EA (long E)': ('ee', 'ea'),
+    '4. IGH/IE/Y (long I)': ('igh', 'ie'),
+    '4. OA/OW (long O)': ('oa', 'ow'),
+    '4. UE/EW (long U)': ('ue', 'ew'),
+    '5. AU/AW': ('au', 'aw'),
+    '5. OI/OY': ('oi', 'oy'),
+    '5. OU/OW (cow sound)': ('ou', 'ow'),
+    '6. AR': ('ar',),
+    '6. OR': ('or',),
+    '6. ER/IR/UR': ('er', 'ir', 'ur'),
+    '6A. NG/NK ENDINGS': ('ng', 'nk'),
+    '7. CK/TCH/DGE': ('ck', 'tch', 'dge'),
+    '7. MAGIC E / SPLIT DIGRAPHS': ('a_e', 'e_e', 'i_e', 'o_e', 'u_e'),
+    '7. SILENT LETTERS': ('kn', 'wr', 'gn', 'mb'),
+    '8. OO (two sounds)': ('oo',),
+    '8. OUGH/AUGH': ('ough', 'augh'),
+}
+
+SIGHT_WORDS = {
+    '0A. YEAR 1 HIGH FREQUENCY',
+    '0B. YEAR 2 COMMON EXCEPTION',
+    '0C. YEAR 3/4 COMMON EXCEPTION',
+    '0D. YEAR 5/6 STATUTORY SPELLING',
+}
+
+
+class CategoryProfile:
+    """Distinct words of one category, the graphemes they use and their difficulty."""
+
+    def __init__(self):
+        self.words = set()
+
+    def add(self, words):
+        self.words.update(words)
+
+    def summarise(self, features):
+        self.uses = Counter()
+        for word in self.words:
+            self.uses.update(set(features.graphemes(word)))
+        self.difficulty = sum(map(features.difficulty, self.words)) / len(self.words) if self.words else 0.0
+        return self
+
+
+def prerequisites(profiles, teaches=TEACHES, use_share=USE_SHARE):
+    """``{category: {categories it needs first}}`` from the profiles' grapheme use."""
+    teachers = {}
+    for category, taught in teaches.items():
+        if category in profiles:
+            for grapheme in taught:
+                teachers.setdefault(grapheme, []).append(category)
+
+    needs = {category: set() for category in profiles}
+    for category, profile in profiles.items():
+        if category in SIGHT_WORDS or not profile.words:
+            continue
+        own = set(teaches.get(category, ()))
+        for grapheme, n in profile.uses.items():
+            if grapheme in own or n < use_share * len(profile.words):
+                continue
+            needs[category].update(t for t in teachers.get(grapheme, ()) if t != category)
+    return needs
+
+
+def topological_order(needs, difficulty):
+    """``(order, cycles)``: ``needs`` sorted prerequisites first, easiest first among ready nodes.
+
+    ``cycles`` lists ``(node, [unplaced prerequisites])`` for each node placed
+    to break a cycle.
+    """
+    waiting = {node: len(before) for node, before in needs.items()}
+    unlocks = {node: [] for node in needs}
+    for node, before in needs.items():
+        for prerequisite in before:
+            unlocks[prerequisite].append(node)
+
+    ready = [(difficulty[node], node) for node, n in waiting.items() if not n]
+    heapq.heapify(ready)
+    order, cycles, placed = [], [], set()
+    while len(order) < len(needs):
+        if not ready:
+            node = min(_cycle_heads(needs, placed), key=lambda n: (difficulty[n], n))
+            cycles.append((node, sorted(p for p in needs[node] if p not in placed)))
+            waiting[node] = 0
+            ready.append((difficulty[node], node))
+        _, node = heapq.heappop(ready)
+        if node in placed:
+            continue
+        placed.add(node)
+        order.append(node)
+        for after in unlocks[node]:
+            waiting[after] -= 1
+            if not waiting[after] and after not in placed:
+                heapq.heappush(ready, (difficulty[after], after))
+    return order, cycles
+
+
+def _cycle_heads(needs, placed):
+    """Unplaced nodes on a cycle that has no unplaced prerequisites outside it."""
+    reach = {}
+    for node in needs:
+        if node in placed:
+            continue
+        seen, stack = set(), [p for p in needs[node] if p not in placed]
+        while stack:
+            prerequisite = stack.pop()
+            if prerequisite not in seen:
+                seen.add(prerequisite)
+                stack.extend(p for p in needs[prerequisite] if p not in placed)
+        reach[node] = seen
+    return [node for node, before in reach.items() if node in before and all(node in reach[p] for p in before)]
+
+
+def plan(profiles, sub_packs):
+    """Order ``sub_packs`` and the categories within each.
+
+    Returns ``(ordered, needs, cycles)``: ``ordered`` is ``[(sub_pack,
+    [categories])]`` in teaching order, ``needs`` the sub-pack prerequisites
+    by name.
+    """
+    category_needs = prerequisites(profiles)
+    sub_pack_of = {c: s['name'] for s in sub_packs for c in s['categories'] if c in profiles}
+
+    needs = {s['name']: set() for s in sub_packs}
+    difficulty = {}
+    for s in sub_packs:
+        members = [profiles[c] for c in s['categories'] if c in profiles]
+        words = sum(len(p.words) for p in members)
+        difficulty[s['name']] = sum(p.difficulty * len(p.words) for p in members) / words if words else 0.0
+        for category in s['categories']:
+            needs[s['name']].update(sub_pack_of[p] for p in category_needs.get(category, ()))
+        needs[s['name']].discard(s['name'])
+
+    by_name = {s['name']: s for s in sub_packs}
+    order, cycles = topological_order(needs, difficulty)
+    ordered = []
+    for name in order:
+        members = [c for c in by_name[name]['categories'] if c in profiles]
+        inner = {c: category_needs[c].intersection(members) for c in members}
+        categories, inner_cycles = topological_order(inner, {c: profiles[c].difficulty for c in members})
+        cycles += inner_cycles
+        ordered.append((by_name[name], categories))
+    return ordered, needs, cycles
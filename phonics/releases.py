@@ -0,0 +1,308 @@
+"""Numbered bank releases with JSON Patch deltas between them.
+
+Each release is a bundle, ``{"version": N, "packs": {"<id>": pack}}``, written
+to ``public/releases/v<N>.json`` along with ``v<N-1>-v<N>.patch.json``: an
+RFC 6902 JSON Patch that turns the previous bundle into this one. Words are
+patched individually - ``remove`` and ``add`` within a pack, ``move`` when a
+word leaves one pack for another - so fixing one word costs a few bytes
+instead of the whole bank. ``index.json`` lists every release with its
+size, hash and patch, so a client on version N fetches only the patches
+after N.
+
+``release --verify`` replays every patch from v1 and checks each result
+against the stored bundle and the last one against a fresh export.
+"""
+
+import copy
+import hashlib
+import json
+import os
+from difflib import SequenceMatcher
+
+from phonics import config
+from phonics.appdata import read_word_packs
+from phonics.export import write_if_changed
+from phonics.trace import count, span
+
+INDEX = 'index.json'
+
+
+class PatchError(ValueError):
+    pass
+
+
+def bundle(packs, version):
+    return {
+        'version': version,
+        'packs': {
+            str(p.id): {'category': p.title, 'subPack': p.sub_pack,
+                        'description': p.description, 'words': list(p.words)}
+            for p in sorted(packs, key=lambda p: p.id)
+        },
+    }
+
+
+def encode(document):
+    return json.dumps(document, ensure_ascii=False, separators=(',', ':')) + '\n'
+
+
+# ---------------------------------------------------------------------------
+# RFC 6902 apply (the subset of operations make_patch emits, plus test)
+
+def _parse(path):
+    if not path.startswith('/'):
+        raise PatchError(f"bad path {path!r}")
+    return [part.replace('~1', '/').replace('~0', '~') for part in path[1:].split('/')]
+
+
+def _parent(document, path):
+    parts = _parse(path)
+    target = document
+    for part in parts[:-1]:
+        target = target[int(part)] if isinstance(target, list) else target[part]
+    return target, parts[-1]
+
+
+def _get(document, path):
+    parent, key = _parent(document, path)
+    return parent[int(key)] if isinstance(parent, list) else parent[key]
+
+
+def _remove(document, path):
+    parent, key = _parent(document, path)
+    return parent.pop(int(key) if isinstance(parent, list) else key)
+
+
+def _add(document, path, value):
+    parent, key = _parent(document, path)
+    if isinstance(parent, list):
+        index = len(parent) if key == '-' else int(key)
+        if not 0 <= index <= len(parent):
+            raise PatchError(f"index out of range: {path}")
+        parent.insert(index, value)
+    else:
+        parent[key] = value
+
+
+def apply_op(document, op):
+    """Apply one operation to ``document`` in place."""
+    try:
+        kind = op['op']
+        if kind == 'add':
+            _add(document, op['path'], copy.deepcopy(op['value']))
+        elif kind == 'remove':
+            _remove(document, op['path'])
+        elif kind == 'replace':
+            _remove(document, op['path'])
+            _add(document, op['path'], copy.deepcopy(op['value']))
+        elif kind == 'move':
+            _add(document, op['path'], _remove(document, op['from']))
+        elif kind == 'test':
+            if _get(document, op['path']) != op['value']:
+                raise PatchError(f"test failed at {op['path']}")
+        else:
+            raise PatchError(f"unsupported op {kind!r}")
+    except (KeyError, IndexError, ValueError, TypeError) as e:
+        if isinstance(e, PatchError):
+            raise
+        raise PatchError(f"cannot apply {op}: {e}") from e
+
+
+def apply_patch(document, patch):
+    """A patched copy of ``document``."""
+    document = copy.deepcopy(document)
+    for op in patch:
+        apply_op(document, op)
+    return document
+
+
+# ---------------------------------------------------------------------------
+# Diff
+
+def make_patch(old, new):
+    """JSON Patch from bundle ``old`` to bundle ``new``.
+
+    Each operation is applied to a working copy as it is emitted, so every
+    index refers to the document as it stands at that point in the patch.
+    """
+    try:
+        return _make_patch(old, new, detect_moves=True)
+    except (PatchError, ValueError):
+        # Tangled moves (a pack both giving and receiving) fall back to remove + add
+        return _make_patch(old, new, detect_moves=False)
+
+
+def _make_patch(old, new, detect_moves):
+    work = copy.deepcopy(old)
+    patch = []
+
+    def emit(op):
+        apply_op(work, op)
+        patch.append(op)
+
+    emit({'op': 'test', 'path': '/version', 'value': old['version']})
+    emit({'op': 'replace', 'path': '/version', 'value': new['version']})
+
+    old_packs, new_packs = old['packs'], new['packs']
+    for pack_id in sorted(old_packs.keys() - new_packs.keys(), key=int):
+        emit({'op': 'remove', 'path': f'/packs/{pack_id}'})
+
+    edits = {}
+    removed, added = {}, {}
+    for pack_id in sorted(new_packs.keys() & old_packs.keys(), key=int):
+        a, b = old_packs[pack_id]['words'], new_packs[pack_id]['words']
+        opcodes = [op for op in SequenceMatcher(None, a, b, autojunk=False).get_opcodes()
+                   if op[0] != 'equal']
+        edits[pack_id] = opcodes
+        for _, i1, i2, j1, j2 in opcodes:
+            for word in a[i1:i2]:
+                removed.setdefault(word, pack_id)
+            for word in b[j1:j2]:
+                added.setdefault(word, pack_id)
+    # A word removed from one pack and added to another becomes one move
+    moves = {}
+    if detect_moves:
+        moves = {word: (src, added[word]) for word, src in removed.items()
+                 if word in added and added[word] != src}
+    keep, defer = set(moves), set(moves)
+
+    for pack_id, opcodes in edits.items():
+        for field in ('category', 'subPack', 'description'):
+            if old_packs[pack_id][field] != new_packs[pack_id][field]:
+                emit({'op': 'replace', 'path': f'/packs/{pack_id}/{field}',
+                      'value': new_packs[pack_id][field]})
+        a, b = old_packs[pack_id]['words'], new_packs[pack_id]['words']
+        # From the end, so earlier indexes still match the old list
+        for tag, i1, i2, j1, j2 in reversed(opcodes):
+            count('words changed', (i2 - i1) + (j2 - j1))
+            if tag == 'replace' and i2 - i1 == j2 - j1 and not moves.keys() & {*a[i1:i2], *b[j1:j2]}:
+                # Corrected spellings: one replace per word
+                for i, word in zip(range(i1, i2), b[j1:j2]):
+                    emit({'op': 'replace', 'path': f'/packs/{pack_id}/words/{i}', 'value': word})
+                continue
+            for i in range(i2 - 1, i1 - 1, -1):
+                if a[i] in keep and moves[a[i]][0] == pack_id:
+                    keep.discard(a[i])
+                else:
+                    emit({'op': 'remove', 'path': f'/packs/{pack_id}/words/{i}'})
+            at = i1
+            for word in b[j1:j2]:
+                if word in defer and moves[word][1] == pack_id:
+                    defer.discard(word)
+                else:
+                    emit({'op': 'add', 'path': f'/packs/{pack_id}/words/{at}', 'value': word})
+                    at += 1
+
+    # Moved words go in at their final index, in order, once the rest is in place
+    deferred = set(moves) - defer
+    for pack_id in edits:
+        for j, word in enumerate(new_packs[pack_id]['words']):
+            if word in deferred and moves[word][1] == pack_id:
+                deferred.discard(word)
+                src = moves[word][0]
+                i = work['packs'][src]['words'].index(word)
+                emit({'op': 'move', 'from': f'/packs/{src}/words/{i}',
+                      'path': f'/packs/{pack_id}/words/{j}'})
+
+    for pack_id in sorted(new_packs.keys() - old_packs.keys(), key=int):
+        emit({'op': 'add', 'path': f'/packs/{pack_id}', 'value': new_packs[pack_id]})
+
+    if work != new:
+        raise PatchError('generated patch does not reproduce the new bundle')
+    return patch
+
+
+# ---------------------------------------------------------------------------
+# Release store
+
+def _read_json(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def read_index(out_dir=None):
+    try:
+        return _read_json(os.path.join(str(out_dir or config.RELEASES_DIR), INDEX))
+    except FileNotFoundError:
+        return {'latest': 0, 'releases': []}
+
+
+def read_release(version, out_dir=None):
+    """The stored bundle of release ``version``."""
+    return _read_json(os.path.join(str(out_dir or config.RELEASES_DIR), f'v{version}.json'))
+
+
+def release(packs, out_dir=None):
+    """Write a new release if ``packs`` differ from the latest. Returns its index entry or ``None``."""
+    out_dir = str(out_dir or config.RELEASES_DIR)
+    os.makedirs(out_dir, exist_ok=True)
+    index = read_index(out_dir)
+    latest = index['latest']
+    new = bundle(packs, latest + 1)
+
+    entry = {'version': latest + 1}
+    if latest:
+        old = _read_json(os.path.join(out_dir, f'v{latest}.json'))
+        if old['packs'] == new['packs']:
+            return None
+        with span('diff release'):
+            patch = make_patch(old, new)
+        patch_name = f'v{latest}-v{latest + 1}.patch.json'
+        patch_text = encode(patch)
+        write_if_changed(os.path.join(out_dir, patch_name), patch_text)
+        entry['patch'] = {'file': patch_name, 'ops': len(patch), 'size': len(patch_text.encode('utf-8'))}
+
+    text = encode(new)
+    write_if_changed(os.path.join(out_dir, f'v{new["version"]}.json'), text)
+    entry.update(file=f'v{new["version"]}.json', size=len(text.encode('utf-8')),
+                 sha256=hashlib.sha256(text.encode('utf-8')).hexdigest())
+    index['latest'] = new['version']
+    index['releases'].append(entry)
+    write_if_changed(os.path.join(out_dir, INDEX), json.dumps(index, indent=2) + '\n')
+    return entry
+
+
+def verify(packs, out_dir=None):
+    """Replay every patch from v1. Returns a list of problems (empty if all good)."""
+    out_dir = str(out_dir or config.RELEASES_DIR)
+    index = read_index(out_dir)
+    problems = []
+    current = None
+    for entry in index['releases']:
+        stored = _read_json(os.path.join(out_dir, entry['file']))
+        if current is None:
+            current = stored
+            continue
+        try:
+            current = apply_patch(current, _read_json(os.path.join(out_dir, entry['patch']['file'])))
+        except PatchError as e:
+            problems.append(f"v{entry['version']}: {e}")
+            current = stored
+            continue
+        if current != stored:
+            problems.append(f"v{entry['version']}: patched bundle differs from {entry['file']}")
+    if current is not None and current['packs'] != bundle(packs, 0)['packs']:
+        problems.append(f"v{index['latest']} differs from a fresh export; run `python -m phonics release`")
+    return problems
+
+
+def run(args):
+    packs = read_word_packs(args.input)
+    out_dir = args.output or config.RELEASES_DIR
+
+    if args.verify:
+        problems = verify(packs, out_dir)
+        for problem in problems:
+            print(f"  {problem}")
+        latest = read_index(str(out_dir))['latest']
+        print(f"{'FAILED' if problems else 'OK'}: {latest} releases checked")
+        return 1 if problems else 0
+
+    entry = release(packs, out_dir)
+    if entry is None:
+        print('No changes since the latest release')
+        return 0
+    print(f"Released v{entry['version']} ({entry['size']:,} bytes)")
+    if 'patch' in entry:
+        print(f"Patch {entry['patch']['file']}: {entry['patch']['ops']} ops, {entry['patch']['size']:,} bytes")
+    return 0
@@ -0,0 +1,200 @@
+"""Reorder extracted packs into sub-packs in teaching order.
+
+Reads the JSON written by ``phonics extract`` and renumbers every pack. The
+sub-packs below only group categories and name them; the order of the
+sub-packs, and of the categories within each, is computed from the graphemes
+their words use (see ``phonics.prerequisites``).
+"""
+
+from collections import Counter
+from functools import partial
+
+from phonics import config
+from phonics.extract import write_packs
+from phonics.features import load_features
+from phonics.packfile import is_ndjson, iter_packs, read_index, read_pack
+from phonics.prerequisites import CategoryProfile, plan
+from phonics.trace import span
+from phonics.words import base_category
+
+# Sub-pack groupings; their order is computed, so this list is in no particular order
+SUB_PACKS = [
+    {
+        'name': 'Year 1 High Frequency Words',
+        'description': 'Most common words - great starting point!',
+        'categories': ['0A. YEAR 1 HIGH FREQUENCY']
+    },
+    {
+        'name': 'Short Vowels',
+        'description': 'Basic phonics - short a, e, i, o, u sounds',
+        'categories': ['1. SHORT VOWEL A', '1. SHORT VOWEL E', '1. SHORT VOWEL I', '1. SHORT VOWEL O', '1. SHORT VOWEL U']
+    },
+    {
+        'name': 'Consonant Blends',
+        'description': 'Two or more consonants together',
+        'categories': ['2. L-BLENDS', '2. R-BLENDS', '2. S-BLENDS', '2. 3-LETTER BLENDS']
+    },
+    {
+        'name': 'Digraphs',
+        'description': 'Two letters making one sound',
+        'categories': ['3. DIGRAPH CH', '3. DIGRAPH SH', '3. DIGRAPH TH (unvoiced)', '3. DIGRAPH WH', '3. DIGRAPH PH']
+    },
+    {
+        'name': 'Special Endings',
+        'description': 'NG, NK, CK, TCH, DGE endings',
+        'categories': ['6A. NG/NK ENDINGS', '7. CK/TCH/DGE']
+    },
+    {
+        'name': 'Magic E & Long Vowels',
+        'description': 'Long vowel sounds with magic e',
+        'categories': ['7. MAGIC E / SPLIT DIGRAPHS']
+    },
+    {
+        'name': 'Long Vowel Teams',
+        'description': 'Two vowels making long sounds',
+        'categories': ['4. AI/AY (long A)', '4. EE/EA (long E)', '4. IGH/IE/Y (long I)', '4. OA/OW (long O)', '4. UE/EW (long U)']
+    },
+    {
+        'name': 'R-Controlled Vowels',
+        'description': 'Vowels changed by the letter R',
+        'categories': ['6. AR', '6. OR', '6. ER/IR/UR']
+    },
+    {
+        'name': 'Special Vowel Patterns',
+        'description': 'Unique vowel combinations',
+        'categories': ['5. AU/AW', '5. OI/OY', '5. OU/OW (cow sound)', '8. OO (two sounds)', '8. OUGH/AUGH']
+    },
+    {
+        'name': 'Word Endings',
+        'description': 'Common suffixes and endings',
+        'categories': ['9. -S/-ES ENDINGS', '9. -ING ENDINGS', '9. -ED ENDINGS', '9. -LE ENDINGS', '6B. Y as /ee/ ENDING']
+    },
+    {
+        'name': 'Advanced Patterns',
+        'description': 'Soft C/G, silent letters, AL pattern',
+        'categories': ['8. SOFT C/G', '7. SILENT LETTERS', '6D. AL PATTERN']
+    },
+    {
+        'name': 'Multi-Syllable Words',
+        'description': 'Building longer words',
+        'categories': ['10. TWO SYLLABLES', '11. THREE SYLLABLES', '12. FOUR+ SYLLABLES']
+    },
+    {
+        'name': 'Year 2 Exception Words',
+        'description': 'Tricky words for Year 2',
+        'categories': ['0B. YEAR 2 COMMON EXCEPTION']
+    },
+    {
+        'name': 'Year 3/4 Exception Words',
+        'description': 'Challenging words for Years 3-4',
+        'categories': ['0C. YEAR 3/4 COMMON EXCEPTION']
+    },
+    {
+        'name': 'Advanced Vocabulary',
+        'description': 'Complex and academic words',
+        'categories': ['13. ADVANCED WORDS']
+    },
+    {
+        'name': 'Year 5/6 Spelling Words',
+        'description': 'Most challenging statutory spellings',
+        'categories': ['0D. YEAR 5/6 STATUTORY SPELLING']
+    }
+]
+
+
+def reorganize(all_packs, sub_packs=SUB_PACKS, load=None):
+    """Return ``(packs, plan)``: renumbered copies of ``all_packs`` in teaching order.
+
+    ``all_packs`` is read once, so it can be a generator. Copies share their
+    word arrays with the input packs. ``plan`` is ``prerequisites.plan``'s
+    ``(ordered, needs, cycles)``.
+
+    With ``load`` (pack id -> pack, e.g. ``packfile.read_pack``) only pack ids
+    and each category's distinct words are kept from that pass, and ``packs``
+    is a generator that reads each pack back as it is renumbered.
+    """
+    sub_pack_categories = {category for sub_pack in sub_packs for category in sub_pack['categories']}
+    buckets = {}
+    profiles = {}
+    for pack in all_packs:
+        category = base_category(pack.category)
+        if category in sub_pack_categories:
+            buckets.setdefault(category, []).append(pack if load is None else pack.id)
+            profiles.setdefault(category, CategoryProfile()).add(pack.words)
+
+    with span('load features'):
+        features = load_features(word for profile in profiles.values() for word in profile.words)
+    with span('order categories'):
+        for profile in profiles.values():
+            profile.summarise(features)
+        order = plan(profiles, sub_packs)
+
+    reorganized = _renumber(order[0], buckets, load)
+    return (reorganized if load else list(reorganized)), order
+
+
+def _renumber(ordered, buckets, load):
+    pack_id = 0
+    for sub_pack, categories in ordered:
+        for category in categories:
+            for pack in buckets[category]:
+                if load is not None:
+                    pack = load(pack)
+                pack_id += 1
+                yield pack.replace(
+                    id=pack_id,
+                    title=f"P{pack_id}: {pack.category}",
+                    sub_pack=sub_pack['name'],
+                    sub_pack_description=sub_pack['description'],
+                )
+
+
+def run(args):
+    source = str(args.input or config.EXTRACTED_JSON)
+    loaded = [0, 0]  # packs, words
+    written = Counter()  # packs per sub-pack
+    words = [0]
+
+    def counted(packs):
+        for pack in packs:
+            loaded[0] += 1
+            loaded[1] += len(pack)
+            yield pack
+
+    def tallied(packs):
+        for pack in packs:
+            written[pack.sub_pack] += 1
+            words[0] += len(pack)
+            yield pack
+
+    # An NDJSON bank is read twice, by line and then by offset, and never held whole
+    load = None
+    if is_ndjson(source):
+        index = read_index(source)
+        load = partial(read_pack, source, index=index)
+
+    output = args.output or config.REORGANIZED_JSON
+    with span('reorganize'):
+        reorganized, (ordered, needs, cycles) = reorganize(counted(iter_packs(source)), load=load)
+        write_packs(output, tallied(reorganized))
+    print(f"Loaded {loaded[0]} packs with {loaded[1]} total words")
+
+    for sub_pack, _ in ordered:
+        name = sub_pack['name']
+        after = f" (after {', '.join(sorted(needs[name]))})" if needs[name] else ''
+        print(f"{name}: {written[name]} packs{after}")
+    for node, blocked_by in cycles:
+        print(f"WARNING: {node} placed before its prerequisites {', '.join(blocked_by)} to break a cycle")
+
+    total = sum(written.values())
+    print(f"\nTotal reorganized: {total} packs")
+    print(f"Total words: {words[0]} words")
+
+    # Verify no packs were lost
+    if total != loaded[0]:
+        print(f"WARNING: Pack count mismatch! Original: {loaded[0]}, Reorganized: {total}")
+    else:
+        print("SUCCESS: All packs accounted for!")
+
+    print(f"\nSaved to {output}")
+    return 0
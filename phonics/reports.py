@@ -0,0 +1,63 @@
+"""Read-only reports on the workbook: ``count``, ``analyze`` and ``preview``."""
+
+from phonics.words import split_words
+from phonics.workbook import read_rows
+
+
+def count(args):
+    rows = read_rows(args.workbook)
+
+    all_words_current = set()
+    total_entries = 0
+    for _, _, words in rows:
+        word_list = [w.lower() for w in split_words(words)]
+        total_entries += len(word_list)
+        all_words_current.update(word_list)
+
+    print(f"CURRENT WORD BANK:")
+    print(f"  Total word entries: {total_entries}")
+    print(f"  Unique words: {len(all_words_current)}")
+    print(f"  Total sections: {len(rows)}")
+    return 0
+
+
+def analyze(args):
+    rows = read_rows(args.workbook)
+
+    print("CURRENT WORD BANK ANALYSIS")
+    print("=" * 100)
+    print(f"{'Category':<50} {'Word Count':>10}")
+    print("-" * 100)
+
+    for category, _, words in rows:
+        if not category or not words:
+            continue
+        print(f"{category:<50} {len(split_words(words)):>10}")
+
+    print("\n" + "=" * 100)
+    print(f"Total sections: {len(rows)}")
+    return 0
+
+
+def preview(args):
+    rows = read_rows(args.workbook)
+
+    print("=" * 100)
+    print("PHONICS WORD BANK - PREVIEW")
+    print("=" * 100)
+    print()
+
+    for category, _, words in rows[:args.rows]:
+        word_list = split_words(words)
+        preview_text = ', '.join(word_list[:10])
+        if len(word_list) > 10:
+            preview_text += f"... ({len(word_list)} total)"
+
+        print(f"{category or '':45} | {len(word_list):2} words")
+        print(f"  {preview_text}")
+        print()
+
+    print("=" * 100)
+    print(f"Total packs: {len(rows)}")
+    print("=" * 100)
+    return 0
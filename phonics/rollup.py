@@ -0,0 +1,109 @@
+"""Precompute every pupil's tricky words at each ``TrickyWordLevel``.
+
+Pack and sub-pack membership comes from ``src/data/wordPacks.ts``. Each
+pupil's ``pack_progress`` rows are read in one streamed pass; the tricky words
+of every pack are found once and then rolled up into the pack, sub-pack and
+global lists in a single walk in app order. Each list is stored as one
+``tricky_words`` row of ``(pack id, word index)`` pairs, so switching the
+tricky-word filter in the app is one primary-key read.
+"""
+
+from collections import defaultdict
+from datetime import datetime, timezone
+from itertools import groupby
+from operator import itemgetter
+
+from phonics import db
+from phonics.appdata import read_word_packs
+from phonics.trace import count, span
+
+PROGRESS_QUERY = """
+    SELECT user_id, pack_id, words
+    FROM pack_progress
+    ORDER BY user_id
+"""
+DELETE_ROLLUPS = 'DELETE FROM tricky_words WHERE user_id = ANY(%s::uuid[])'
+INSERT_ROLLUPS = """
+    INSERT INTO tricky_words (user_id, level, scope, pack_ids, word_indexes, generated_at)
+    VALUES %s
+"""
+
+
+def rollup(packs, progress):
+    """``[(level, scope, pack_ids, word_indexes)]`` for one pupil's ``{pack_id: words}``.
+
+    Only non-empty lists are returned; a missing scope means no tricky words.
+    """
+    rows = []
+    global_ids, global_indexes = [], []
+    # Keyed by sub-pack, so a sub-pack whose packs are not contiguous still gets one row
+    sub_packs = defaultdict(lambda: ([], []))
+    for pack in packs:
+        words = progress.get(pack.id)
+        if not words:
+            continue
+        indexes = [i for i, word in enumerate(pack.words) if words.get(word) == 'tricky']
+        if not indexes:
+            continue
+        ids = [pack.id] * len(indexes)
+        rows.append(('pack', str(pack.id), ids, indexes))
+        if pack.sub_pack is not None:
+            sub_ids, sub_indexes = sub_packs[pack.sub_pack]
+            sub_ids += ids
+            sub_indexes += indexes
+        global_ids += ids
+        global_indexes += indexes
+
+    for sub_pack, (sub_ids, sub_indexes) in sub_packs.items():
+        rows.append(('subpack', sub_pack, sub_ids, sub_indexes))
+    if global_ids:
+        rows.append(('global', '', global_ids, global_indexes))
+    return rows
+
+
+def _flush(cur, users, batch):
+    with span('write rollups'):
+        cur.execute(DELETE_ROLLUPS, (users,))
+        db.insert_values(cur, INSERT_ROLLUPS, batch)
+    count('rollup rows written', len(batch))
+
+
+def write_rollups(conn, packs):
+    """Replace the ``tricky_words`` rows of every pupil with progress. Returns ``(pupils, rows)``."""
+    generated_at = datetime.now(timezone.utc)
+    pupils = written = 0
+    users, batch = [], []
+
+    with conn, conn.cursor() as cur:
+        for user_id, rows in groupby(db.stream(conn, PROGRESS_QUERY), key=itemgetter(0)):
+            progress = {pack_id: words for _, pack_id, words in rows}
+            users.append(user_id)
+            batch.extend((user_id, *row, generated_at) for row in rollup(packs, progress))
+            pupils += 1
+            if len(batch) >= db.PAGE_SIZE:
+                _flush(cur, users, batch)
+                written += len(batch)
+                users, batch = [], []
+        if users:
+            _flush(cur, users, batch)
+            written += len(batch)
+
+    count('pupils rolled up', pupils)
+    return pupils, written
+
+
+def run(args):
+    url = db.database_url(args.database)
+    if not url:
+        print('No database: pass --database or set SUPABASE_DB_URL / DATABASE_URL')
+        return 1
+
+    packs = read_word_packs()
+    conn = db.connect(url)
+    try:
+        with span('rollup'):
+            pupils, written = write_rollups(conn, packs)
+    finally:
+        conn.close()
+    print(f"Wrote {written} tricky-word rows for {pupils} pupils")
+    return 0
@@ -0,0 +1,142 @@
+"""Precompute each pupil's spaced-repetition review queue.
+
+``pack_progress`` is read in one streamed pass ordered by pupil. Every word a
+pupil has marked gets a due time from an SM-2 style interval: the pack's
+completion count stands in for the number of reviews, and the word's status
+for the answer quality (tricky words keep resetting to one day, mastered words
+stretch out by the ease factor). The pupil's words go into a heap keyed on due
+time and the ones due by the end of the day are popped off, most overdue first,
+into one ``review_queue`` row. Rows are upserted in multi-row batches inside a
+single transaction, so the app reads a ready-made list.
+"""
+
+import heapq
+from datetime import date, datetime, time, timedelta, timezone
+from itertools import groupby
+from operator import itemgetter
+
+from phonics import db
+from phonics.trace import count, span
+
+# SM-2 answer quality (0-5) for each word status
+QUALITY = {'tricky': 2, 'mastered': 5}
+INITIAL_EASE = 2.5
+MIN_EASE = 1.3
+QUEUE_LIMIT = 30  # one page of words, as UI_CONFIG.WORDS_PER_PAGE
+
+PROGRESS_QUERY = """
+    SELECT user_id, pack_id, words, starred, completion_count, last_reviewed
+    FROM pack_progress
+    WHERE last_reviewed IS NOT NULL
+    ORDER BY user_id
+"""
+UPSERT_QUEUE = """
+    INSERT INTO review_queue (user_id, queue_date, pack_ids, words, generated_at)
+    VALUES %s
+    ON CONFLICT (user_id) DO UPDATE SET
+      queue_date = EXCLUDED.queue_date,
+      pack_ids = EXCLUDED.pack_ids,
+      words = EXCLUDED.words,
+      generated_at = EXCLUDED.generated_at
+"""
+
+
+def interval_days(quality, repetitions):
+    """Days until the next review after ``repetitions`` reviews at ``quality``."""
+    interval, ease = 0, INITIAL_EASE
+    for n in range(1, repetitions + 1):
+        if quality < 3:
+            interval = 1
+        elif n == 1:
+            interval = 1
+        elif n == 2:
+            interval = 6
+        else:
+            interval = round(interval * ease)
+        ease = max(MIN_EASE, ease + 0.1 - (5 - quality) * (0.08 + (5 - quality) * 0.02))
+    return interval
+
+
+def due_words(rows):
+    """``(due, pack_id, word)`` for every marked word in one pupil's progress rows."""
+    for _, pack_id, words, starred, completion_count, last_reviewed in rows:
+        # Every word in the row shares its pack's review count, so a status fixes the due time
+        repetitions = max(1, completion_count or 0)
+        due = {status: last_reviewed + timedelta(days=interval_days(quality, repetitions))
+               for status, quality in QUALITY.items()}
+        for word, status in (words or {}).items():
+            if status in due:
+                yield due[status], pack_id, word
+        # Words a parent starred are due straight away
+        for word in starred or {}:
+            yield last_reviewed, pack_id, word
+
+
+def build_queue(rows, until, limit=QUEUE_LIMIT):
+    """Up to ``limit`` ``(pack_id, word)`` pairs due by ``until``, most overdue first."""
+    heap = list(due_words(rows))
+    heapq.heapify(heap)
+    count('words scheduled', len(heap))
+
+    queue, seen = [], set()
+    while heap and len(queue) < limit:
+        due, pack_id, word = heapq.heappop(heap)
+        if due > until:
+            break
+        if (pack_id, word) not in seen:
+            seen.add((pack_id, word))
+            queue.append((pack_id, word))
+    return queue
+
+
+def today():
+    """The queue date for now: the UTC day, which is the day the app asks for."""
+    return datetime.now(timezone.utc).date()
+
+
+def end_of_day(day):
+    """The UTC midnight that ends ``day``; words due before it are queued."""
+    return datetime.combine(day + timedelta(days=1), time.min, tzinfo=timezone.utc)
+
+
+def schedule(conn, day, limit=QUEUE_LIMIT):
+    """Write a ``review_queue`` row for every pupil with progress. Returns ``(pupils, words)``."""
+    until = end_of_day(day)
+    generated_at = datetime.now(timezone.utc)
+    pupils = queued = 0
+    batch = []
+
+    with conn, conn.cursor() as cur:
+        progress = db.stream(conn, PROGRESS_QUERY)
+        for user_id, rows in groupby(progress, key=itemgetter(0)):
+            queue = build_queue(rows, until, limit)
+            batch.append((user_id, day, [p for p, _ in queue], [w for _, w in queue], generated_at))
+            pupils += 1
+            queued += len(queue)
+            if len(batch) >= db.PAGE_SIZE:
+                with span('write queues'):
+                    db.insert_values(cur, UPSERT_QUEUE, batch)
+                batch.clear()
+        if batch:
+            with span('write queues'):
+                db.insert_values(cur, UPSERT_QUEUE, batch)
+
+    count('pupils scheduled', pupils)
+    return pupils, queued
+
+
+def run(args):
+    url = db.database_url(args.database)
+    if not url:
+        print('No database: pass --database or set SUPABASE_DB_URL / DATABASE_URL')
+        return 1
+
+    day = date.fromisoformat(args.date) if args.date else today()
+    conn = db.connect(url)
+    try:
+        with span('schedule'):
+            pupils, queued = schedule(conn, day, args.limit)
+    finally:
+        conn.close()
+    print(f"Wrote review queues for {pupils} pupils ({queued} words due by {day})")
+    return 0
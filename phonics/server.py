@@ -0,0 +1,248 @@
+"""Serve packs to the app over a school's local network.
+
+A small asyncio HTTP/1.1 server (standard library only) for:
+
+* ``/manifest.json``         - every resource below with its ETag and size
+* ``/packs.json``            - all packs
+* ``/packs/<id>.json``       - one pack
+* ``/subpacks/<slug>.json``  - the packs of one sub-pack (a shard)
+* ``/syllables.json``        - the syllable dictionary
+
+Packs and syllables are read from ``src/data/`` and reloaded when those files
+change. Encoded responses (JSON, and a gzip copy for clients that accept it)
+are kept in an LRU; gzip is sent when ``Accept-Encoding`` gives it (or ``*``)
+a non-zero q-value. Every response has a strong ETag, so a client that sends
+``If-None-Match`` gets ``304 Not Modified`` with no body when nothing changed.
+
+Only GET and HEAD are served. A request body is read and discarded so the
+next request on the connection starts where it should; a body over
+``MAX_BODY_BYTES``, or one sent chunked, gets its answer and the connection
+is closed.
+"""
+
+import asyncio
+import gzip
+import hashlib
+import json
+import os
+import re
+from collections import OrderedDict
+from email.utils import formatdate
+
+from phonics import config
+from phonics.appdata import read_syllable_dictionary, read_word_packs
+from phonics.trace import count
+
+CACHE_SIZE = 256
+MAX_HEADER_BYTES = 16 * 1024
+MAX_BODY_BYTES = 64 * 1024
+REASONS = {200: 'OK', 304: 'Not Modified', 400: 'Bad Request', 404: 'Not Found',
+           405: 'Method Not Allowed', 413: 'Content Too Large'}
+
+
+def slug(name):
+    return re.sub(r'[^a-z0-9]+', '-', name.lower()).strip('-')
+
+
+def _pack_json(pack):
+    return {'id': pack.id, 'category': pack.title, 'subPack': pack.sub_pack,
+            'words': pack.words, 'description': pack.description}
+
+
+class Encoded:
+    """One encoded response body and its strong ETags."""
+
+    __slots__ = ('body', 'etag', 'gzip_body', 'gzip_etag')
+
+    def __init__(self, data):
+        self.body = json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        digest = hashlib.sha256(self.body).hexdigest()[:32]
+        self.etag = f'"{digest}"'
+        # A different representation needs a different strong ETag
+        self.gzip_body = gzip.compress(self.body, mtime=0)
+        self.gzip_etag = f'"{digest}-gzip"'
+
+
+class PackStore:
+    """Resources built from ``src/data``, encoded on demand and cached in an LRU."""
+
+    def __init__(self, packs_path=None, syllables_path=None, cache_size=CACHE_SIZE):
+        self.packs_path = str(packs_path or config.WORD_PACKS_TS)
+        self.syllables_path = str(syllables_path or config.SYLLABLE_DICTIONARY_TS)
+        self.cache_size = cache_size
+        self.cache = OrderedDict()
+        self.stamp = None
+        self.refresh()
+
+    def _stamp(self):
+        return tuple((st.st_mtime_ns, st.st_size)
+                     for st in map(os.stat, (self.packs_path, self.syllables_path)))
+
+    def refresh(self):
+        """Reload the sources if either file changed."""
+        stamp = self._stamp()
+        if stamp == self.stamp:
+            return
+        self.stamp = stamp
+        self.packs = {pack.id: pack for pack in read_word_packs(self.packs_path)}
+        self.sub_packs = {}
+        for pack in self.packs.values():
+            self.sub_packs.setdefault(slug(pack.sub_pack), []).append(pack)
+        self.syllables = read_syllable_dictionary(self.syllables_path)
+        self.cache.clear()
+
+    def paths(self):
+        yield '/packs.json'
+        for pack_id in self.packs:
+            yield f'/packs/{pack_id}.json'
+        for name in self.sub_packs:
+            yield f'/subpacks/{name}.json'
+        yield '/syllables.json'
+
+    def build(self, path):
+        """The JSON data for ``path``, or ``None`` if there is no such resource."""
+        if path == '/packs.json':
+            return [_pack_json(p) for p in self.packs.values()]
+        if path == '/syllables.json':
+            return self.syllables
+        if path == '/manifest.json':
+            return {p: {'etag': self.get(p).etag, 'size': len(self.get(p).body)} for p in self.paths()}
+        match = re.fullmatch(r'/packs/(\d+)\.json', path)
+        if match and int(match.group(1)) in self.packs:
+            return _pack_json(self.packs[int(match.group(1))])
+        match = re.fullmatch(r'/subpacks/([a-z0-9-]+)\.json', path)
+        if match and match.group(1) in self.sub_packs:
+            return [_pack_json(p) for p in self.sub_packs[match.group(1)]]
+        return None
+
+    def get(self, path):
+        """Encoded response for ``path`` (``None`` if not found), via the LRU."""
+        encoded = self.cache.get(path)
+        if encoded is not None:
+            self.cache.move_to_end(path)
+            count('cache hits')
+            return encoded
+        count('cache misses')
+        data = self.build(path)
+        if data is None:
+            return None
+        encoded = Encoded(data)
+        self.cache[path] = encoded
+        if len(self.cache) > self.cache_size:
+            self.cache.popitem(last=False)
+        return encoded
+
+
+def etag_matches(header, etag):
+    """Weak comparison, as If-None-Match requires."""
+    if header.strip() == '*':
+        return True
+    return any(tag.strip().removeprefix('W/') == etag for tag in header.split(','))
+
+
+def accepts_gzip(header):
+    """Whether an Accept-Encoding header allows gzip (``gzip;q=0`` refuses it)."""
+    qualities = {}
+    for item in header.split(','):
+        coding, *params = (part.strip() for part in item.split(';'))
+        q = 1.0
+        for param in params:
+            name, _, value = param.partition('=')
+            if name.strip().lower() == 'q':
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        qualities[coding.lower()] = q
+    q = qualities.get('gzip', qualities.get('x-gzip', qualities.get('*', 0.0)))
+    return q > 0
+
+
+def respond(store, method, path, headers):
+    """``(status, extra headers, body)`` for one request."""
+    if method not in ('GET', 'HEAD'):
+        return 405, {'Allow': 'GET, HEAD'}, b''
+    store.refresh()
+    encoded = store.get(path.split('?', 1)[0])
+    if encoded is None:
+        return 404, {}, b''
+
+    use_gzip = accepts_gzip(headers.get('accept-encoding', ''))
+    etag = encoded.gzip_etag if use_gzip else encoded.etag
+    extra = {'ETag': etag, 'Cache-Control': 'no-cache', 'Vary': 'Accept-Encoding'}
+    if etag_matches(headers.get('if-none-match', ''), etag):
+        count('304 responses')
+        return 304, extra, b''
+    extra['Content-Type'] = 'application/json; charset=utf-8'
+    if use_gzip:
+        extra['Content-Encoding'] = 'gzip'
+    return 200, extra, encoded.gzip_body if use_gzip else encoded.body
+
+
+async def handle(store, reader, writer):
+    """Serve requests on one keep-alive connection."""
+    try:
+        while True:
+            try:
+                head = await reader.readuntil(b'\r\n\r\n')
+            except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+                break
+            lines = head.decode('latin-1').split('\r\n')
+            parts = lines[0].split()
+            headers = {}
+            for line in lines[1:]:
+                name, _, value = line.partition(':')
+                if name:
+                    headers[name.strip().lower()] = value.strip()
+
+            length = headers.get('content-length', '0')
+            method = 'GET'
+            if len(parts) != 3 or not length.isdigit():
+                status, extra, body = 400, {}, b''
+            elif int(length) > MAX_BODY_BYTES:
+                status, extra, body = 413, {}, b''
+            else:
+                if int(length):
+                    try:
+                        await reader.readexactly(int(length))
+                    except (asyncio.IncompleteReadError, ConnectionError):
+                        break
+                method, path, _ = parts
+                status, extra, body = respond(store, method, path, headers)
+            count('requests')
+
+            # A chunked body is never read, so nothing after it can be parsed
+            keep_alive = (headers.get('connection', '').lower() != 'close' and status not in (400, 413)
+                          and 'transfer-encoding' not in headers)
+            response = [f'HTTP/1.1 {status} {REASONS[status]}',
+                        f'Date: {formatdate(usegmt=True)}',
+                        'Access-Control-Allow-Origin: *',
+                        'Access-Control-Expose-Headers: ETag',
+                        f'Content-Length: {len(body)}',
+                        f"Connection: {'keep-alive' if keep_alive else 'close'}"]
+            response += [f'{name}: {value}' for name, value in extra.items()]
+            writer.write(('\r\n'.join(response) + '\r\n\r\n').encode('latin-1'))
+            if method != 'HEAD':
+                writer.write(body)
+            await writer.drain()
+            if not keep_alive:
+                break
+    finally:
+        writer.close()
+
+
+async def serve(store, host, port):
+    server = await asyncio.start_server(lambda r, w: handle(store, r, w), host, port,
+                                        limit=MAX_HEADER_BYTES)
+    print(f"Serving {len(store.packs)} packs on http://{host}:{port}/manifest.json (Ctrl+C to stop)")
+    async with server:
+        await server.serve_forever()
+
+
+def run(args):
+    store = PackStore(cache_size=args.cache_size)
+    try:
+        asyncio.run(serve(store, args.host, args.port))
+    except KeyboardInterrupt:
+        print('\nStopped')
+    return 0
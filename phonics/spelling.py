@@ -0,0 +1,188 @@
+"""Check every pack word against a large local wordlist.
+
+The wordlist (``wordlist.txt``, one word per line; ``word count`` lines and
+hunspell ``word/FLAGS`` lines also work) is not shipped - use a British
+list such as SCOWL's ``en_GB`` words. It is compiled once into a
+``Lexicon`` cached under ``config.CACHE_DIR`` and keyed on the list's size,
+mtime and path, so later runs load a few MB of bytes and build nothing:
+
+* a Bloom filter (about 10 bits a word, 7 hashes, ~1% false positives) that
+  rules most unknown words out with a few bit tests, and
+* the exact list: the sorted words as one newline-separated ``bytes`` blob
+  plus an ``array('I')`` of offsets to every 32nd word. A Bloom hit is
+  confirmed by binary-searching the block heads and scanning one block, so
+  no word is ever passed on a false positive.
+
+Matching is case-insensitive. Hyphenated and spaced entries are checked
+part by part (``ice-cream`` passes if ``ice`` and ``cream`` do), and a
+possessive passes if its stem does (``pupil's``).
+"""
+
+import hashlib
+import marshal
+import math
+import os
+import re
+from array import array
+
+from phonics import config
+from phonics.trace import count, span
+
+CACHE_FORMAT = 1
+BLOCK = 32
+BITS_PER_WORD = 10
+HASHES = 7
+POSSESSIVE = re.compile(r"^(.+)'s$")
+
+
+def _hashes(word, m):
+    digest = hashlib.blake2b(word, digest_size=16).digest()
+    h1 = int.from_bytes(digest[:8], 'little')
+    h2 = int.from_bytes(digest[8:], 'little') | 1
+    return [(h1 + i * h2) % m for i in range(HASHES)]
+
+
+class Lexicon:
+    """Bloom filter in front of an exact, block-indexed sorted word blob."""
+
+    def __init__(self, bloom, blob, heads):
+        self.bloom = bloom
+        self.bits = len(bloom) * 8
+        self.blob = blob
+        self.heads = heads
+
+    @classmethod
+    def build(cls, words):
+        words = sorted({w.encode('utf-8') for w in words})
+        bloom = bytearray(max(1, math.ceil(len(words) * BITS_PER_WORD / 8)))
+        bits = len(bloom) * 8
+        for word in words:
+            for h in _hashes(word, bits):
+                bloom[h >> 3] |= 1 << (h & 7)
+        heads = array('I')
+        blob = bytearray()
+        for i, word in enumerate(words):
+            if i % BLOCK == 0:
+                heads.append(len(blob))
+            blob += word + b'\n'
+        return cls(bytes(bloom), bytes(blob), heads)
+
+    def _word_at(self, offset):
+        return self.blob[offset:self.blob.index(b'\n', offset)]
+
+    def _exact(self, word):
+        lo, hi = 0, len(self.heads)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._word_at(self.heads[mid]) <= word:
+                lo = mid + 1
+            else:
+                hi = mid
+        if not lo:
+            return False
+        start = self.heads[lo - 1]
+        end = self.heads[lo] if lo < len(self.heads) else len(self.blob)
+        return word in self.blob[start:end].split(b'\n')
+
+    def __contains__(self, word):
+        word = word.lower().encode('utf-8')
+        for h in _hashes(word, self.bits):
+            if not self.bloom[h >> 3] & (1 << (h & 7)):
+                return False
+        count('bloom hits')
+        return self._exact(word)
+
+    def __len__(self):
+        return self.blob.count(b'\n')
+
+    def memory(self):
+        return len(self.bloom) + len(self.blob) + self.heads.itemsize * len(self.heads)
+
+
+def read_wordlist(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            parts = line.split()
+            if parts and not parts[0].isdigit():
+                yield parts[0].split('/', 1)[0].lower()
+
+
+def load_lexicon(path=None):
+    """The compiled lexicon for a wordlist, from the cache if it is current; ``None`` if no list."""
+    path = os.path.abspath(path or config.WORDLIST)
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    signature = (path, stat.st_size, stat.st_mtime_ns)
+    cache_file = config.CACHE_DIR / f"lexicon-{hashlib.sha256(path.encode('utf-8')).hexdigest()[:16]}.bin"
+
+    try:
+        with span('read lexicon'), open(cache_file, 'rb') as f:
+            cached = marshal.load(f)
+        if cached[:2] == (CACHE_FORMAT, signature):
+            _, _, bloom, blob, heads = cached
+            return Lexicon(bloom, blob, array('I', heads))
+    except (OSError, EOFError, ValueError, TypeError):
+        pass
+
+    with span('compile lexicon'):
+        lexicon = Lexicon.build(read_wordlist(path))
+    config.CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    tmp = cache_file.with_name(f'{cache_file.name}.{os.getpid()}.tmp')
+    with open(tmp, 'wb') as f:
+        marshal.dump((CACHE_FORMAT, signature, lexicon.bloom, lexicon.blob, lexicon.heads.tobytes()), f)
+    os.replace(tmp, cache_file)
+    return lexicon
+
+
+def known(lexicon, word):
+    """Whether every part of ``word`` is in ``lexicon``."""
+    if word in lexicon:
+        return True
+    parts = [p for p in re.split(r'[-\s]+', word) if p]
+    if len(parts) > 1:
+        return all(known(lexicon, part) for part in parts)
+    match = POSSESSIVE.match(word)
+    return bool(match) and match.group(1) in lexicon
+
+
+def unknown_words(lexicon, packs):
+    """``{word: [pack ids]}`` for pack words not in ``lexicon``, in one pass."""
+    checked = {}
+    unknown = {}
+    for pack in packs:
+        for word in pack.words:
+            ok = checked.get(word)
+            if ok is None:
+                ok = checked[word] = known(lexicon, word)
+            if not ok:
+                unknown.setdefault(word, []).append(pack.id)
+    count('words checked', len(checked))
+    return unknown
+
+
+def run(args):
+    lexicon = load_lexicon(args.wordlist)
+    if lexicon is None:
+        print(f"No wordlist at {args.wordlist or config.WORDLIST}; "
+              "download one (e.g. SCOWL en_GB) or pass --wordlist")
+        return 1
+
+    if args.input:
+        from phonics.packfile import iter_packs
+
+        packs = iter_packs(args.input)
+    else:
+        from phonics.appdata import read_word_packs
+
+        packs = read_word_packs()
+
+    with span('check words'):
+        unknown = unknown_words(lexicon, packs)
+    for word in sorted(unknown, key=str.lower):
+        ids = unknown[word]
+        print(f"  {word:<20} pack{'s' if len(ids) > 1 else ''} {', '.join(map(str, ids))}")
+    print(f"{len(unknown)} words not in the wordlist "
+          f"({len(lexicon):,} words, {lexicon.memory() / 1e6:.1f} MB)")
+    return 1 if unknown else 0
@@ -0,0 +1,253 @@
+"""Re-split the workbook's sections.
+
+Three strategies, all rewriting the workbook in place by default:
+
+* ``size``   - split any section over ``max_words`` into numbered parts
+* ``levels`` - drop duplicate words and split each category into difficulty levels
+* ``packs``  - merge every level/part back into its category and re-cut into packs
+
+With ``--frequency`` words are ranked against the local frequency list:
+levels break difficulty ties with the more common word first, and packs are
+ordered by frequency instead of alphabetically. With ``--calibrated`` levels
+score words from ``word_difficulty.json`` (see ``phonics.calibrate``) instead
+of the heuristic.
+"""
+
+from collections import defaultdict
+
+from phonics import config
+from phonics.difficulty import calibrated_scorer, get_difficulty_score, load_difficulty_table
+from phonics.features import load_features
+from phonics.trace import count, span
+from phonics.words import split_words
+from phonics.workbook import read_rows, write_rows
+
+LEVEL_SIZE = 35
+PACK_SIZE = 30
+MIN_PACK_WORDS = 10
+
+# (level number, upper score bound, short label, long label)
+LEVELS = [
+    (1, 15, 'Easy', 'Easy (1 syllable)'),
+    (2, 25, 'Medium', 'Medium (2 syllables)'),
+    (3, None, 'Hard', 'Hard (3+ syllables)'),
+]
+
+
+def _chunks(items, size):
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+
+def split_by_size(rows, max_words=40):
+    """Split sections with more than ``max_words`` words into ``(Part i/n)`` sections."""
+    sections = []
+    for category, pattern, words in rows:
+        if not category or not words:
+            continue
+
+        word_list = split_words(words)
+        if len(word_list) <= max_words:
+            sections.append((category, pattern, words))
+            continue
+
+        chunks = _chunks(word_list, max_words)
+        for idx, chunk in enumerate(chunks, 1):
+            sections.append((f"{category} (Part {idx}/{len(chunks)})",
+                             f"{pattern} - Part {idx} of {len(chunks)}",
+                             ', '.join(chunk)))
+    return sections
+
+
+def split_by_difficulty(words_list, category_base, pattern_base, ranks=None, score=get_difficulty_score):
+    """Split words into difficulty levels, breaking ties by frequency rank if given"""
+    if not words_list:
+        return []
+
+    word_scores = [(word, score(word)) for word in words_list]
+    if ranks:
+        word_scores.sort(key=lambda x: (x[1], ranks[x[0]]))
+    else:
+        word_scores.sort(key=lambda x: x[1])
+    count('words scored', len(word_scores))
+    scores = [s for w, s in word_scores]
+
+    if max(scores) - min(scores) <= 5:
+        # All similar difficulty - just split by quantity
+        chunks = _chunks([w for w, s in word_scores], LEVEL_SIZE)
+        if len(chunks) == 1:
+            return [(category_base, pattern_base, ', '.join(chunks[0]))]
+        return [(f"{category_base} - Level 1{chr(65 + idx)}",
+                 f"{pattern_base} - Part {idx + 1} (same difficulty)",
+                 ', '.join(chunk))
+                for idx, chunk in enumerate(chunks)]
+
+    results = []
+    lower = None
+    for level, upper, label, long_label in LEVELS:
+        level_words = [w for w, s in word_scores
+                       if (lower is None or s > lower) and (upper is None or s <= upper)]
+        lower = upper
+        if not level_words:
+            continue
+
+        chunks = _chunks(level_words, LEVEL_SIZE)
+        if len(chunks) == 1:
+            results.append((f"{category_base} - Level {level}",
+                            f"{pattern_base} - {long_label}",
+                            ', '.join(chunks[0])))
+        else:
+            for idx, chunk in enumerate(chunks):
+                results.append((f"{category_base} - Level {level}{chr(65 + idx)}",
+                                f"{pattern_base} - {label} Part {idx + 1}",
+                                ', '.join(chunk)))
+    return results
+
+
+def find_duplicates(rows):
+    """Map each word that appears in more than one section to those sections."""
+    all_words = defaultdict(list)
+    for category, _, words in rows:
+        if not category or not words:
+            continue
+        for word in split_words(words):
+            all_words[word.lower()].append(category)
+    return {word: cats for word, cats in all_words.items() if len(cats) > 1}
+
+
+def split_into_levels(rows, ranks=None, score=get_difficulty_score):
+    """Remove duplicate words (keeping the first) and split each category by difficulty."""
+    sections = []
+    processed_words = set()
+
+    for category, pattern, words in rows:
+        if not category or not words:
+            continue
+
+        # Skip if this is already a split section (from previous split)
+        if "(Part " in category:
+            category = category.split(" (Part")[0]
+
+        unique_words = []
+        for word in split_words(words):
+            word_lower = word.lower()
+            # Keep word if it's the first time we see it, or if it's in a high-freq/exception list
+            if (word_lower not in processed_words or "FREQUENCY" in category
+                    or "EXCEPTION" in category or "STATUTORY" in category):
+                unique_words.append(word)
+                processed_words.add(word_lower)
+
+        if unique_words:
+            sections.extend(split_by_difficulty(unique_words, category, pattern, ranks, score))
+    return sections
+
+
+def regroup_into_packs(rows, pack_size=PACK_SIZE, ranks=None):
+    """Merge levels and parts back into base categories and cut them into packs.
+
+    Words are ordered alphabetically, or most frequent first if ``ranks`` is given.
+    """
+    word_collections = defaultdict(set)
+    category_descriptions = {}
+
+    for category, pattern, words in rows:
+        if not category or not words:
+            continue
+
+        # Extract base category (remove "Level X", "Part X", etc.)
+        base = category.split(' - Level')[0].split(' (Part')[0].strip()
+        word_collections[base].update(w.lower() for w in split_words(words))
+
+        if base not in category_descriptions and pattern:
+            desc = pattern
+            for marker in (' - Part', ' - Level', ' - Easy', ' - Medium', ' - Hard'):
+                desc = desc.split(marker)[0]
+            category_descriptions[base] = desc.strip()
+
+    sections = []
+    for base in sorted(word_collections):
+        words = sorted(word_collections[base])
+        if ranks:
+            words.sort(key=ranks.__getitem__)
+        description = category_descriptions.get(base, "")
+
+        if len(words) < MIN_PACK_WORDS:
+            print(f"  WARNING: Skipping {base} - too few words ({len(words)})")
+            continue
+
+        chunks = _chunks(words, pack_size)
+        if len(chunks) == 1:
+            sections.append((base, description, ', '.join(words)))
+            continue
+        for idx, chunk in enumerate(chunks, 1):
+            sections.append((f"{base} - Pack {idx}",
+                             f"{description} (Pack {idx} of {len(chunks)})",
+                             ', '.join(chunk)))
+    return sections
+
+
+def write_duplicate_report(path, duplicates):
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("DUPLICATE WORDS REPORT\n")
+        f.write("=" * 50 + "\n\n")
+        f.write(f"Total duplicate words found: {len(duplicates)}\n\n")
+
+        for word, cats in sorted(duplicates.items()):
+            f.write(f"'{word}' appears in:\n")
+            for cat in cats:
+                f.write(f"  - {cat}\n")
+            f.write("\n")
+
+
+def run(args):
+    workbook = args.workbook or config.WORKBOOK
+    output = args.output or workbook
+    rows = read_rows(workbook)
+
+    words = [w for _, _, cell in rows for w in split_words(cell)]
+    with span('load features'):
+        features = load_features(words, args.frequency_list)
+
+    score = features.difficulty
+    if args.calibrated:
+        scores = load_difficulty_table()
+        if scores is None:
+            print(f"No difficulty table at {config.DIFFICULTY_JSON}; run `python -m phonics calibrate`")
+            return 1
+        score = calibrated_scorer(scores, features.difficulty)
+
+    ranks = None
+    if args.frequency:
+        if not features.ranked:
+            print(f"No frequency list at {args.frequency_list or config.WORD_FREQUENCY}")
+            return 1
+        ranks = {w: features.frequency(w) for w in
+                 {w.lower() if args.strategy == 'packs' else w for w in words}}
+
+    if args.strategy == 'size':
+        with span('split by size'):
+            sections = split_by_size(rows, args.max_words)
+        write_rows(output, sections, "Word Bank (Split)",
+                   headers=("Category", "Pattern/Description", f"Words (max {args.max_words} per section)"),
+                   widths=(40, 42, 90))
+        print(f"Large sections split into max {args.max_words} words each")
+    elif args.strategy == 'levels':
+        with span('dedup'):
+            duplicates = find_duplicates(rows)
+        print(f"Found {len(duplicates)} duplicate words!")
+        with span('split by difficulty'):
+            sections = split_into_levels(rows, ranks, score)
+        write_rows(output, sections, "Organized Word Bank",
+                   headers=("Category & Level", "Pattern/Difficulty", "Words"),
+                   widths=(45, 45, 90))
+        write_duplicate_report(config.DUPLICATE_REPORT, duplicates)
+        print(f"Duplicates removed (kept first occurrence)")
+        print(f"Duplicate report saved to: {config.DUPLICATE_REPORT}")
+    else:
+        with span('regroup into packs'):
+            sections = regroup_into_packs(rows, ranks=ranks)
+        write_rows(output, sections, "Word Packs", widths=(40, 40, 90))
+        print(f"Pack size: ~{PACK_SIZE} words each")
+
+    print(f"Total sections: {len(sections)}")
+    print(f"File: {output}")
+    return 0
@@ -0,0 +1,45 @@
+"""Mirror the live ``wordPacks`` array from app.js back into the workbook."""
+
+import json
+import re
+
+from phonics import config
+from phonics.model import Pack
+from phonics.workbook import update_cells
+
+WORD_PACKS_PATTERN = re.compile(r'let wordPacks = (\[[\s\S]*?\]);')
+
+
+def read_app_packs(path):
+    """Parse the ``let wordPacks = [...]`` JSON literal out of app.js into packs."""
+    with open(path, 'r', encoding='utf-8') as f:
+        content = f.read()
+
+    match = WORD_PACKS_PATTERN.search(content)
+    if not match:
+        raise ValueError(f"Could not find wordPacks array in {path}")
+    return [Pack.from_dict(data) for data in json.loads(match.group(1))]
+
+
+def run(args):
+    app_js = args.app_js or config.APP_JS
+    print(f"Reading {app_js}...")
+    try:
+        word_packs = read_app_packs(app_js)
+    except (ValueError, json.JSONDecodeError) as e:
+        print(f"ERROR: {e}")
+        return 1
+    print(f"Found {len(word_packs)} packs in app.js")
+
+    cells = {}
+    for pack in word_packs:
+        # Excel row is pack_id + 1 (because row 1 is header)
+        row_num = pack.id + 1
+        cells[f'A{row_num}'] = pack.title
+        cells[f'B{row_num}'] = pack.description
+        cells[f'C{row_num}'] = ', '.join(pack.words)
+
+    update_cells(args.workbook or config.WORKBOOK, cells)
+    print(f"\nSUCCESS! Excel now mirrors what's live in app.js")
+    print(f"Updated {len(word_packs)} packs in Excel")
+    return 0
@@ -0,0 +1,115 @@
+"""Stage spans and counters for the toolchain, plus the ``--profile`` runner.
+
+Commands wrap their stages in ``span('name')`` and report volumes with
+``count('rows read', n)``. Both are close to free: counters are a dict
+update, and spans are only recorded while profiling is enabled.
+
+``python -m phonics --profile DIR <command>`` runs the command under
+cProfile and tracemalloc, prints a per-stage summary and writes:
+
+* ``DIR/<command>.prof``       - cProfile stats (``python -m pstats``, snakeviz)
+* ``DIR/<command>.trace.json`` - Chrome trace events; open in chrome://tracing,
+  https://ui.perfetto.dev or https://www.speedscope.app
+"""
+
+import json
+import os
+import time
+from contextlib import contextmanager
+
+counters = {}
+_spans = []  # (name, start_ns, end_ns, traced memory at end or None)
+_enabled = False
+_origin_ns = 0
+
+
+@contextmanager
+def span(name):
+    """Time a named stage. Recorded only while profiling is enabled."""
+    if not _enabled:
+        yield
+        return
+    start = time.perf_counter_ns()
+    try:
+        yield
+    finally:
+        _spans.append((name, start, time.perf_counter_ns(), _traced_memory()))
+
+
+def count(name, n=1):
+    """Add ``n`` to a named counter."""
+    counters[name] = counters.get(name, 0) + n
+
+
+def _traced_memory():
+    import tracemalloc
+
+    return tracemalloc.get_traced_memory()[0] if tracemalloc.is_tracing() else None
+
+
+def chrome_trace(spans, counter_values, peak_bytes):
+    """Build a Chrome trace event document from recorded spans."""
+    pid = os.getpid()
+    events = [{'name': 'process_name', 'ph': 'M', 'pid': pid, 'tid': 0,
+               'args': {'name': 'phonics'}}]
+    for name, start, end, memory in spans:
+        events.append({'name': name, 'ph': 'X', 'pid': pid, 'tid': 0,
+                       'ts': (start - _origin_ns) / 1000, 'dur': (end - start) / 1000})
+        if memory is not None:
+            events.append({'name': 'traced memory', 'ph': 'C', 'pid': pid, 'tid': 0,
+                           'ts': (end - _origin_ns) / 1000, 'args': {'bytes': memory}})
+    return {
+        'traceEvents': events,
+        'displayTimeUnit': 'ms',
+        'otherData': {'counters': counter_values, 'peak_memory_bytes': peak_bytes},
+    }
+
+
+def print_summary(spans, counter_values, peak_bytes):
+    totals = {}
+    for name, start, end, _ in spans:
+        calls, elapsed = totals.get(name, (0, 0))
+        totals[name] = (calls + 1, elapsed + end - start)
+
+    print("\n" + "=" * 60)
+    print(f"{'Stage':<36} {'Calls':>6} {'Time (ms)':>14}")
+    print("-" * 60)
+    for name, (calls, elapsed) in sorted(totals.items(), key=lambda item: -item[1][1]):
+        print(f"{name:<36} {calls:>6} {elapsed / 1e6:>14.2f}")
+    if counter_values:
+        print("-" * 60)
+        for name, value in sorted(counter_values.items()):
+            print(f"{name:<36} {value:>21,}")
+    print("-" * 60)
+    print(f"{'peak traced memory':<36} {peak_bytes / 1024 / 1024:>18.2f} MB")
+    print("=" * 60)
+
+
+def profile_run(handler, args, out_dir, name):
+    """Run ``handler(args)`` with spans, cProfile and tracemalloc enabled."""
+    import cProfile
+    import tracemalloc
+
+    global _enabled, _origin_ns
+    out_dir.mkdir(parents=True, exist_ok=True)
+    counters.clear()
+    _spans.clear()
+    _enabled = True
+    _origin_ns = time.perf_counter_ns()
+
+    tracemalloc.start()
+    profiler = cProfile.Profile()
+    try:
+        with span(name):
+            result = profiler.runcall(handler, args)
+    finally:
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        _enabled = False
+
+        profiler.dump_stats(out_dir / f'{name}.prof')
+        with open(out_dir / f'{name}.trace.json', 'w', encoding='utf-8') as f:
+            json.dump(chrome_trace(_spans, counters, peak), f)
+        print_summary(_spans, counters, peak)
+        print(f"Profile written to {out_dir / f'{name}.prof'} and {out_dir / f'{name}.trace.json'}")
+    return result
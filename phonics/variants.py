@@ -0,0 +1,217 @@
+"""Curriculum variants: a word bank plus a small overlay of changes.
+
+A variant is a JSON file in ``variants/`` (``config.VARIANTS_DIR``) naming
+its base - one of the hand-maintained banks or another variant - and the
+changes to make to it::
+
+    {
+      "base": "comprehensive",
+      "description": "Oakfield Primary: Year 1 adjustments",
+      "rename_words": {"mum": "mam"},
+      "remove_words": {"1. SHORT VOWEL A": ["pasta"], "*": ["gal"]},
+      "add_words": {"1. SHORT VOWEL A": ["zap", "clap"]},
+      "remove_packs": ["0D. YEAR 5/6 STATUTORY SPELLING"],
+      "rename_packs": {"1. SHORT VOWEL A": "1. SHORT A"},
+      "add_packs": [["9. SCHOOL TOPIC WORDS", "Our topic this term", "volcano, lava"]]
+    }
+
+Pack names in an overlay are the names in its base; ``"*"`` in
+``remove_words`` means every pack. Changes are applied in the order above.
+
+Variants are resolved lazily and copy-on-write. Every bank and variant
+shares one ``WordTable``, and a resolved variant reuses its base's ``Pack``
+objects (and their word arrays) for every pack the overlay does not touch,
+so resolving fifty school variants costs the base once plus the packs each
+overlay changes. Bases are resolved once per process however many variants
+sit on them.
+"""
+
+import json
+from array import array
+
+from phonics import config
+from phonics.banks import BANK_NAMES, load_bank
+from phonics.model import WORDS, Pack
+from phonics.trace import count, span
+from phonics.words import split_words
+
+OVERLAY_KEYS = ('base', 'description', 'rename_words', 'remove_words', 'add_words',
+                'remove_packs', 'rename_packs', 'add_packs')
+
+
+class VariantError(ValueError):
+    pass
+
+
+class Bank:
+    """Resolved packs of a bank or variant, in workbook order."""
+
+    def __init__(self, name, packs, module):
+        self.name = name
+        self.packs = packs
+        self.module = module  # the bank module whose sheet layout this uses
+        self._by_category = None
+        self._postings = None
+
+    def pack(self, category):
+        if self._by_category is None:
+            self._by_category = {pack.category: i for i, pack in enumerate(self.packs)}
+        try:
+            return self._by_category[category]
+        except KeyError:
+            raise VariantError(f"{self.name} has no pack {category!r}") from None
+
+    def containing(self, word_id):
+        """Indexes of the packs containing ``word_id`` (indexed on first use)."""
+        if self._postings is None:
+            self._postings = {}
+            for i, pack in enumerate(self.packs):
+                for w in set(pack.word_ids):
+                    self._postings.setdefault(w, []).append(i)
+        return self._postings.get(word_id, ())
+
+    def rows(self):
+        """``(category, description, words)`` rows, as in a bank module's ``WORD_BANK``."""
+        return [(p.category, p.description, ', '.join(p.words)) for p in self.packs]
+
+
+def _bank_packs(module, table=WORDS):
+    return [Pack.from_words(i, category, description, category, split_words(words), table=table)
+            for i, (category, description, words) in enumerate(module.WORD_BANK)]
+
+
+def read_overlay(name, variants_dir=None):
+    path = (variants_dir or config.VARIANTS_DIR) / f'{name}.json'
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            overlay = json.load(f)
+    except FileNotFoundError:
+        raise VariantError(f"Unknown variant {name!r}: no {path}") from None
+    unknown = overlay.keys() - set(OVERLAY_KEYS)
+    if unknown:
+        raise VariantError(f"{path}: unknown keys {', '.join(sorted(unknown))}")
+    if 'base' not in overlay:
+        raise VariantError(f"{path}: no base")
+    return overlay
+
+
+def apply_overlay(base, name, overlay, table=WORDS):
+    """The packs of ``base`` with ``overlay`` applied; untouched packs are shared."""
+    packs = list(base.packs)
+    words = {}  # pack index -> word list being edited (copied on first write)
+
+    def edit(i):
+        if i not in words:
+            words[i] = list(packs[i].word_ids)
+        return words[i]
+
+    for old, new in overlay.get('rename_words', {}).items():
+        old_id, new_id = table.get(old), table.intern(new)
+        for i in base.containing(old_id) if old_id is not None else ():
+            ids = edit(i)
+            ids[:] = [new_id if w == old_id else w for w in ids]
+
+    for category, removed in overlay.get('remove_words', {}).items():
+        removed_ids = {table.get(w) for w in removed} - {None}
+        targets = (sorted({i for w in removed_ids for i in base.containing(w)}) if category == '*'
+                   else [base.pack(category)])
+        for i in targets:
+            if removed_ids.intersection(words.get(i, packs[i].word_ids)):
+                ids = edit(i)
+                ids[:] = [w for w in ids if w not in removed_ids]
+
+    for category, added in overlay.get('add_words', {}).items():
+        ids = edit(base.pack(category))
+        present = set(ids)
+        for word in added:
+            word_id = table.intern(word)
+            if word_id not in present:
+                ids.append(word_id)
+                present.add(word_id)
+
+    for i, ids in words.items():
+        packs[i] = packs[i].replace(word_ids=array('I', ids))
+    count('packs copied', len(words))
+
+    renames = overlay.get('rename_packs', {})
+    removed_packs = {base.pack(category) for category in overlay.get('remove_packs', ())}
+    for category, new in renames.items():
+        i = base.pack(category)
+        packs[i] = packs[i].replace(title=new, category=new)
+    packs = [pack for i, pack in enumerate(packs) if i not in removed_packs]
+    next_id = max((pack.id for pack in base.packs), default=-1) + 1
+    for category, description, pack_words in overlay.get('add_packs', ()):
+        packs.append(Pack.from_words(next_id, category, description, category,
+                                     split_words(pack_words), table=table))
+        next_id += 1
+    return Bank(name, packs, base.module)
+
+
+class Variants:
+    """Banks and variants by name, each resolved once on first use."""
+
+    def __init__(self, variants_dir=None, table=WORDS):
+        self.variants_dir = variants_dir or config.VARIANTS_DIR
+        self.table = table
+        self.resolved = {}
+        self._resolving = []
+
+    def names(self):
+        if not self.variants_dir.is_dir():
+            return []
+        return sorted(path.stem for path in self.variants_dir.glob('*.json'))
+
+    def get(self, name):
+        bank = self.resolved.get(name)
+        if bank is not None:
+            return bank
+        if name in self._resolving:
+            raise VariantError(f"Variant cycle: {' -> '.join(self._resolving + [name])}")
+        self._resolving.append(name)
+        try:
+            if name in BANK_NAMES:
+                module = load_bank(name)
+                with span(f'resolve {name}'):
+                    bank = Bank(name, _bank_packs(module, self.table), module)
+            else:
+                overlay = read_overlay(name, self.variants_dir)
+                base = self.get(overlay['base'])
+                with span(f'resolve {name}'):
+                    bank = apply_overlay(base, name, overlay, self.table)
+        finally:
+            self._resolving.pop()
+        self.resolved[name] = bank
+        return bank
+
+
+def sharing(bank, base):
+    """``(shared packs, copied packs)`` of ``bank`` relative to ``base``."""
+    base_arrays = {id(pack.word_ids) for pack in base.packs}
+    shared = sum(id(pack.word_ids) in base_arrays for pack in bank.packs)
+    return shared, len(bank.packs) - shared
+
+
+def run(args):
+    variants = Variants(args.variants_dir)
+    names = args.names or variants.names()
+    if not names:
+        print(f"No variants in {variants.variants_dir}")
+        return 0
+
+    failed = 0
+    for name in names:
+        try:
+            bank = variants.get(name)
+        except VariantError as e:
+            print(f"  {name}: {e}")
+            failed += 1
+            continue
+        if name in BANK_NAMES:
+            print(f"{name}: {len(bank.packs)} packs (bank)")
+            continue
+        base = variants.get(read_overlay(name, variants.variants_dir)['base'])
+        shared, copied = sharing(bank, base)
+        words = sum(len(pack) for pack in bank.packs)
+        print(f"{name}: {len(bank.packs)} packs, {words} words on {base.name} "
+              f"({shared} packs shared, {copied} copied or added)")
+    return 1 if failed else 0
@@ -0,0 +1,168 @@
+"""Rebuild the pack artifacts whenever the workbook is saved.
+
+The workbook is polled for size/mtime changes. Once a change has settled for
+the debounce period the rows are re-read and diffed against the last parse,
+and only the stages that the change affects are re-run:
+
+* a word or description edit patches the affected extracted packs in place
+  and re-runs reorganize, since the teaching order is computed from the
+  words and an edit can move a category;
+* a renamed, added, removed or reordered section re-runs extract and
+  reorganize (pack numbering is applied in memory, the workbook itself is
+  never written to, so it stays safe to keep open in Excel);
+* artifacts are only rewritten when their content changed, so the Vite dev
+  server reloads once per real change.
+
+The rebuilt packs get fresh ids and sub-packs, while the pack ids in the
+curated ``src/data/wordPacks.ts`` are the ones stored in pupils' progress,
+releases, rollups and compacted bits. So the TypeScript goes to a separate
+preview file (``config.WATCH_PACKS_TS``) unless ``--write-app-data`` asks
+for the app's own file. ``npm run dev:watch`` (``vite --mode watch``) aliases
+``@/data/wordPacks`` to that preview, so the dev server shows each save live.
+"""
+
+import json
+import time
+
+from phonics import config
+from phonics.export import render_word_packs, write_if_changed
+from phonics.extract import extract_packs
+from phonics.model import WordTable
+from phonics.reorganize import reorganize
+from phonics.trace import span
+from phonics.words import split_words
+from phonics.workbook import read_rows
+
+POLL_INTERVAL = 0.1
+
+
+def _signature(path):
+    try:
+        stat = path.stat()
+    except FileNotFoundError:  # Excel replaces the file on save
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def diff_rows(old_rows, new_rows):
+    """Return ``(changed row indices, structural)`` between two parses.
+
+    A change is structural when sections were added, removed, renamed or
+    emptied, i.e. when pack numbering or sub-pack membership may change.
+    """
+    if old_rows is None or len(old_rows) != len(new_rows):
+        return list(range(len(new_rows))), True
+
+    changed = [i for i, (old, new) in enumerate(zip(old_rows, new_rows)) if old != new]
+    structural = any(
+        old_rows[i][0] != new_rows[i][0] or bool(old_rows[i][2]) != bool(new_rows[i][2])
+        for i in changed
+    )
+    return changed, structural
+
+
+class PackBuild:
+    """Last parsed rows plus the extracted and reorganized packs built from them."""
+
+    def __init__(self):
+        self.table = WordTable()
+        self.rows = None
+        self.packs = []
+        self.reorganized = []
+        self.order = None
+        self._pack_for_row = {}
+
+    def update(self, rows):
+        """Bring the build up to date with ``rows``; returns the stages that ran."""
+        changed, structural = diff_rows(self.rows, rows)
+        self.rows = rows
+        if not changed:
+            return []
+
+        if structural:
+            with span('extract packs'):
+                self.packs = extract_packs(rows, table=self.table)
+            self._reorganize()
+            self._index()
+            return ['extract', 'reorganize']
+
+        for i in changed:
+            category, description, words = rows[i]
+            pack = self.packs[self._pack_for_row[i]]
+            pack.word_ids = self.table.encode(split_words(words))
+            pack.description = description if description else f"{len(pack)} words"
+        # The order depends on the words, so the edit may have moved packs
+        return ['patch', 'reorder'] if self._reorganize() else ['patch']
+
+    def _reorganize(self):
+        """Re-run reorganize on the extracted packs; returns whether the teaching order changed."""
+        with span('reorganize'):
+            self.reorganized, (ordered, _, _) = reorganize(self.packs)
+        order = [(sub_pack['name'], categories) for sub_pack, categories in ordered]
+        changed = order != self.order
+        self.order = order
+        return changed
+
+    def _index(self):
+        self._pack_for_row = {}
+        for i, (category, _, words) in enumerate(self.rows):
+            if category and words:
+                self._pack_for_row[i] = len(self._pack_for_row)
+
+    def export(self, ts_path=None):
+        """Write the artifacts, the TypeScript to ``ts_path``; returns the paths that actually changed."""
+        outputs = {
+            config.EXTRACTED_JSON: json.dumps([p.to_dict() for p in self.packs], indent=2, ensure_ascii=False),
+            config.REORGANIZED_JSON: json.dumps([p.to_dict() for p in self.reorganized], indent=2,
+                                                ensure_ascii=False),
+            ts_path or config.WATCH_PACKS_TS: render_word_packs(self.reorganized),
+        }
+        return [path for path, text in outputs.items() if write_if_changed(path, text)]
+
+
+def rebuild(build, workbook, ts_path):
+    started = time.perf_counter()
+    try:
+        rows = read_rows(workbook)
+    except Exception as e:  # half-written file; the next save event will retry
+        print(f"Could not read {workbook.name}: {e}")
+        return
+
+    stages = build.update(rows)
+    written = build.export(ts_path) if stages else []
+    elapsed = (time.perf_counter() - started) * 1000
+    if written:
+        names = ', '.join(p.name for p in written)
+        print(f"[{time.strftime('%H:%M:%S')}] {'+'.join(stages)}: updated {names} in {elapsed:.0f} ms")
+    else:
+        print(f"[{time.strftime('%H:%M:%S')}] no pack changes ({elapsed:.0f} ms)")
+
+
+def run(args):
+    workbook = args.workbook or config.WORKBOOK
+    if args.write_app_data and args.output:
+        print('Pass either -o or --write-app-data, not both')
+        return 1
+    ts_path = config.WORD_PACKS_TS if args.write_app_data else args.output or config.WATCH_PACKS_TS
+    build = PackBuild()
+    rebuild(build, workbook, ts_path)
+    print(f"Watching {workbook} (Ctrl+C to stop), writing {ts_path}")
+    if not args.write_app_data:
+        print('Serve the preview with `npm run dev:watch`')
+
+    last_seen = _signature(workbook)
+    changed_at = None
+    try:
+        while True:
+            time.sleep(POLL_INTERVAL)
+            signature = _signature(workbook)
+            if signature != last_seen:
+                last_seen = signature
+                changed_at = time.monotonic()
+            elif changed_at is not None and signature is not None \
+                    and time.monotonic() - changed_at >= args.debounce:
+                changed_at = None
+                rebuild(build, workbook, ts_path)
+    except KeyboardInterrupt:
+        pass
+    return 0
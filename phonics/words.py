@@ -0,0 +1,40 @@
+"""Small text helpers shared by the workbook commands."""
+
+import re
+import unicodedata
+
+PACK_PREFIX = re.compile(r'^(P\d+:\s*)+')
+WORD = re.compile(r"^[A-Za-z][A-Za-z'\- ]*[A-Za-z]$|^[A-Za-z]$")
+
+
+def split_words(text):
+    """Split a comma-separated word cell into a list of stripped words."""
+    if not text:
+        return []
+    return [w.strip() for w in text.split(',') if w.strip()]
+
+
+def strip_pack_number(name):
+    """Remove any ``P#:`` prefix (or repeated prefixes) from a category name."""
+    return PACK_PREFIX.sub('', name)
+
+
+def base_category(category):
+    """Category name without its `` - Pack N`` suffix."""
+    return category.split(' - Pack')[0]
+
+
+def normalise_word(token):
+    """Clean one typed or extracted word; ``None`` if it is not a word."""
+    token = unicodedata.normalize('NFKC', token).replace('’', "'").replace('‘', "'")
+    token = ' '.join(token.split()).strip(" .;:")
+    return token if WORD.match(token) else None
+
+
+def unknown_phrase(word, phrases):
+    """Whether ``word`` has an internal space but is not one of ``phrases`` (lower case).
+
+    Text extracted from a PDF can run two words together (``is assist``) or
+    split one (``cl ay``), so only phrases the bank already has are trusted.
+    """
+    return ' ' in word and word.lower() not in phrases
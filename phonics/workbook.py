@@ -0,0 +1,157 @@
+"""Reading and writing the word bank workbook.
+
+openpyxl is only imported when the workbook actually has to be parsed or
+written. Parsed rows are kept as a binary snapshot under ``config.CACHE_DIR``
+(one per workbook path, shared by every read-only command). A snapshot is
+used as is while the workbook's size and modification time are unchanged;
+when they change, the file's SHA-256 is compared with the one the snapshot
+was built from, so a touched or re-checked-out but identical workbook is
+still not re-parsed.
+"""
+
+import hashlib
+import io
+import marshal
+import os
+import sys
+from pathlib import Path
+
+from phonics import config
+from phonics.trace import count, span
+
+SNAPSHOT_FORMAT = 1
+
+HEADER_COLOR = "4472C4"
+CATEGORY_COLOR = "E7E6E6"
+
+
+def _signature(path):
+    stat = path.stat()
+    return (str(path.resolve()), stat.st_mtime_ns, stat.st_size)
+
+
+def _read_file(path):
+    """The workbook's bytes and their SHA-256, read once so the hash is of what gets parsed."""
+    with span('hash workbook'):
+        data = path.read_bytes()
+        return data, hashlib.sha256(data).hexdigest()
+
+
+def _snapshot_file(path):
+    name = hashlib.sha256(str(path.resolve()).encode('utf-8')).hexdigest()[:16]
+    return config.CACHE_DIR / f'workbook-{name}.snapshot'
+
+
+def _read_snapshot(snapshot_file):
+    try:
+        with span('read snapshot'), open(snapshot_file, 'rb') as f:
+            snapshot = marshal.load(f)
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    # marshal's format may change between Python versions
+    if not isinstance(snapshot, tuple) or snapshot[:2] != (SNAPSHOT_FORMAT, sys.version_info[:2]):
+        return None
+    return snapshot
+
+
+def _write_snapshot(snapshot_file, signature, content_hash, rows):
+    with span('write snapshot'):
+        config.CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp = snapshot_file.with_name(f'{snapshot_file.name}.{os.getpid()}.tmp')
+        with open(tmp, 'wb') as f:
+            marshal.dump((SNAPSHOT_FORMAT, sys.version_info[:2], signature, content_hash, rows), f)
+        os.replace(tmp, snapshot_file)
+
+
+def read_rows(path=None, use_cache=True):
+    """Return the workbook's data rows as ``(category, description, words)`` tuples.
+
+    The header row is skipped; blank rows are kept so row numbers line up with
+    the sheet (data row ``i`` is sheet row ``i + 2``).
+    """
+    path = Path(path or config.WORKBOOK)
+    signature = _signature(path)
+    snapshot_file = _snapshot_file(path)
+
+    cached_hash = rows = None
+    snapshot = _read_snapshot(snapshot_file) if use_cache else None
+    if snapshot is not None:
+        _, _, cached_signature, cached_hash, rows = snapshot
+        if cached_signature == signature:
+            return rows
+
+    # The signature is taken before the read: if the file is saved meanwhile,
+    # the next call sees a new signature and checks the hash again
+    data, content_hash = _read_file(path)
+    if content_hash == cached_hash:
+        count('snapshots revalidated')
+    else:
+        rows = parse_rows(io.BytesIO(data))
+    _write_snapshot(snapshot_file, signature, content_hash, rows)
+    return rows
+
+
+def parse_rows(path):
+    """Parse the workbook (a path or binary file) with openpyxl, bypassing the cache."""
+    with span('import openpyxl'):
+        from openpyxl import load_workbook
+
+    with span('parse workbook'):
+        wb = load_workbook(path, read_only=True)
+        ws = wb.active
+        rows = []
+        for values in ws.iter_rows(min_row=2, max_col=3, values_only=True):
+            values = tuple(values) + (None,) * (3 - len(values))
+            rows.append(tuple(None if v is None else str(v) for v in values))
+        wb.close()
+    count('rows read', len(rows))
+    return rows
+
+
+def write_rows(path, rows, title, headers=("Category", "Description", "Words"),
+               widths=(40, 40, 90), category_font_size=10):
+    """Write ``(category, description, words)`` rows to a new styled workbook."""
+    with span('import openpyxl'):
+        from openpyxl import Workbook
+        from openpyxl.styles import Font, PatternFill, Alignment
+
+    wb = Workbook()
+    ws = wb.active
+    ws.title = title
+
+    # Headers
+    header_fill = PatternFill(start_color=HEADER_COLOR, end_color=HEADER_COLOR, fill_type="solid")
+    header_font = Font(bold=True, color="FFFFFF", size=12)
+    for column, header in zip('ABC', headers):
+        cell = ws[f'{column}1']
+        cell.value = header
+        cell.fill = header_fill
+        cell.font = header_font
+        cell.alignment = Alignment(horizontal='center', vertical='center')
+
+    for column, width in zip('ABC', widths):
+        ws.column_dimensions[column].width = width
+
+    category_fill = PatternFill(start_color=CATEGORY_COLOR, end_color=CATEGORY_COLOR, fill_type="solid")
+    for row, (category, description, words) in enumerate(rows, start=2):
+        ws[f'A{row}'] = category
+        ws[f'B{row}'] = description
+        ws[f'C{row}'] = words
+
+        ws[f'A{row}'].font = Font(bold=True, size=category_font_size)
+        ws[f'A{row}'].fill = category_fill
+        ws[f'C{row}'].alignment = Alignment(wrap_text=True, vertical='top')
+
+    with span('save workbook'):
+        wb.save(path)
+
+
+def update_cells(path, cells):
+    """Set ``{'A2': value, ...}`` on the active sheet and save the workbook in place."""
+    from openpyxl import load_workbook
+
+    wb = load_workbook(path)
+    ws = wb.active
+    for ref, value in cells.items():
+        ws[ref] = value
+    wb.save(path)
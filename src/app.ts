@@ -50,6 +50,19 @@ export class AppState {
 
 export const appState = new AppState();
 
+/**
+ * Replace the built-in packs with the latest release from public/releases
+ */
+async function updateWordPacks(): Promise<void> {
+  const { loadLatestRelease, releasePacks } = await import('@/utils/releases');
+  const bundle = await loadLatestRelease();
+  if (bundle) {
+    // In place, so everything holding the array sees the new packs
+    wordPacks.splice(0, wordPacks.length, ...releasePacks(bundle, wordPacks));
+    renderSubPackList(wordPacks);
+  }
+}
+
 /**
  * Initialize application
  */
@@ -100,6 +113,9 @@ export async function init(): Promise<void> {
     // Update user bar if authenticated
     updateUserBar();
 
+    // Swap in the latest released packs once they are patched and verified
+    void updateWordPacks();
+
     // Listen for auth skip event
     window.addEventListener('auth-skipped', () => {
       renderSubPackList(wordPacks);
@@ -15,6 +15,8 @@ export const SUPABASE_CONFIG = {
     PACK_PROGRESS: 'pack_progress',
     USER_SESSIONS: 'user_sessions',
     CUSTOM_PACKS: 'custom_packs',
+    REVIEW_QUEUE: 'review_queue',
+    TRICKY_WORDS: 'tricky_words',
   },
 } as const;
 
@@ -4,9 +4,21 @@
  */
 
 import { createClient, SupabaseClient } from '@supabase/supabase-js';
-import type { User, DatabasePackProgress, PackProgress, CustomPack, DatabaseCustomPack } from '@/types';
+import type {
+  User,
+  DatabasePackProgress,
+  PackProgress,
+  CustomPack,
+  DatabaseCustomPack,
+  DatabaseReviewQueue,
+  ReviewQueueItem,
+  DatabaseTrickyWords,
+  TrickyWordFilter,
+  TrickyWordRef,
+} from '@/types';
 import { SUPABASE_CONFIG } from '@/constants/config';
 import { logger } from '@/utils/logger';
+import { buildReviewQueue, queueDate } from '@/utils/reviewQueue';
 
 export class SupabaseService {
   private client: SupabaseClient | null = null;
@@ -414,6 +426,85 @@ export class SupabaseService {
       throw error;
     }
   }
+
+  // ========== Review Queue Methods ==========
+
+  /**
+   * Get today's precomputed review queue for user (written by `python -m phonics schedule`)
+   * If the nightly job has not written today's row, the queue is computed from progress
+   */
+  async getReviewQueue(userId: string): Promise<ReviewQueueItem[]> {
+    if (!this.client) throw new Error('Supabase not initialized');
+
+    try {
+      const today = queueDate();
+      const { data, error } = await this.client
+        .from(SUPABASE_CONFIG.TABLE_NAMES.REVIEW_QUEUE)
+        .select('*')
+        .eq('user_id', userId)
+        .eq('queue_date', today)
+        .maybeSingle();
+
+      if (error) {
+        logger.error('Failed to fetch review queue', error);
+        throw error;
+      }
+
+      const row = data as DatabaseReviewQueue | null;
+      if (!row) {
+        const queue = buildReviewQueue(await this.getUserProgress(userId), today);
+        logger.info('No review queue for today, computed from progress', { count: queue.length });
+        return queue;
+      }
+
+      const queue: ReviewQueueItem[] = row.words.map((word, i) => ({ word, packId: row.pack_ids[i] }));
+      logger.info('Fetched review queue', { count: queue.length });
+      return queue;
+    } catch (error) {
+      logger.error('Error fetching review queue', error);
+      throw error;
+    }
+  }
+
+  /**
+   * Get precomputed tricky words for one filter (written by `python -m phonics rollup`)
+   */
+  async getTrickyWords(userId: string, filter: TrickyWordFilter): Promise<TrickyWordRef[]> {
+    if (!this.client) throw new Error('Supabase not initialized');
+
+    let scope = '';
+    if (filter.level === 'subpack') {
+      scope = filter.subPackName ?? '';
+    } else if (filter.level === 'pack') {
+      scope = String(filter.packId ?? '');
+    }
+
+    try {
+      const { data, error } = await this.client
+        .from(SUPABASE_CONFIG.TABLE_NAMES.TRICKY_WORDS)
+        .select('pack_ids, word_indexes')
+        .eq('user_id', userId)
+        .eq('level', filter.level)
+        .eq('scope', scope)
+        .maybeSingle();
+
+      if (error) {
+        logger.error('Failed to fetch tricky words', error);
+        throw error;
+      }
+
+      const row = data as Pick<DatabaseTrickyWords, 'pack_ids' | 'word_indexes'> | null;
+      const refs: TrickyWordRef[] = row
+        ? row.pack_ids.map((packId, i) => ({ packId, wordIndex: row.word_indexes[i] }))
+        : [];
+
+      logger.info('Fetched tricky words', { level: filter.level, count: refs.length });
+      return refs;
+    } catch (error) {
+      logger.error('Error fetching tricky words', error);
+      throw error;
+    }
+  }
 }
 
 // Export singleton instance
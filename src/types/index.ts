@@ -95,6 +95,35 @@ export interface DatabaseCustomPack {
   synced_at: string;
 }
 
+// Precomputed spaced-repetition queue (one row per user)
+export interface DatabaseReviewQueue {
+  user_id: string;
+  queue_date: string; // YYYY-MM-DD
+  pack_ids: number[];
+  words: string[]; // most overdue first; pack_ids[i] is the pack of words[i]
+  generated_at: string;
+}
+
+export interface ReviewQueueItem {
+  word: string;
+  packId: number;
+}
+
+// Precomputed tricky words (one row per user, level and scope)
+export interface DatabaseTrickyWords {
+  user_id: string;
+  level: TrickyWordLevel;
+  scope: string; // '' for global, sub-pack name, or pack id
+  pack_ids: number[];
+  word_indexes: number[]; // word_indexes[i] is a position in pack pack_ids[i]
+  generated_at: string;
+}
+
+export interface TrickyWordRef {
+  packId: number;
+  wordIndex: number;
+}
+
 // Sync status for UI feedback
 export type SyncStatus = 'idle' | 'syncing' | 'success' | 'error' | 'offline';
 
@@ -0,0 +1,231 @@
+/**
+ * Word bank updates from public/releases - fetch the deltas, not the bank
+ *
+ * `python -m phonics release` writes numbered bundles (v<N>.json), an RFC
+ * 6902 JSON Patch between each pair and index.json listing them with their
+ * sha256. The last bundle applied is kept in localStorage, so on start-up
+ * the app fetches the index and only the patches after that version,
+ * checking the hash after each one. A missing patch, a failed operation or
+ * a hash mismatch falls back to downloading the latest bundle whole.
+ */
+
+import type { WordPack } from '@/types';
+import { logger } from './logger';
+
+const RELEASES_URL = `${import.meta.env.BASE_URL}releases/`;
+const STORAGE_KEY = 'phonics-app-bank-release';
+
+/** Layout of v<N>.json */
+export interface ReleaseBundle {
+  version: number;
+  packs: Record<string, { category: string; subPack: string; description: string; words: string[] }>;
+}
+
+/** Layout of index.json */
+export interface ReleaseIndex {
+  latest: number;
+  releases: Array<{
+    version: number;
+    file: string;
+    size: number;
+    sha256: string;
+    patch?: { file: string; ops: number; size: number };
+  }>;
+}
+
+/** The operations `make_patch` emits */
+export type PatchOperation =
+  | { op: 'add' | 'replace' | 'test'; path: string; value: unknown }
+  | { op: 'remove'; path: string }
+  | { op: 'move'; from: string; path: string };
+
+export class PatchError extends Error {}
+
+type Container = Record<string, unknown> | unknown[];
+
+function parent(document: unknown, path: string): [Container, string] {
+  if (!path.startsWith('/')) {
+    throw new PatchError(`bad path ${path}`);
+  }
+  const parts = path
+    .slice(1)
+    .split('/')
+    .map((part) => part.replace(/~1/g, '/').replace(/~0/g, '~'));
+  let target = document as Container;
+  for (const part of parts.slice(0, -1)) {
+    const next = Array.isArray(target) ? target[Number(part)] : target[part];
+    if (next === null || typeof next !== 'object') {
+      throw new PatchError(`no such path ${path}`);
+    }
+    target = next as Container;
+  }
+  return [target, parts[parts.length - 1]];
+}
+
+function arrayIndex(list: unknown[], key: string, path: string, end: number): number {
+  const index = key === '-' ? list.length : Number(key);
+  if (!/^(\d+|-)$/.test(key) || index > end) {
+    throw new PatchError(`index out of range: ${path}`);
+  }
+  return index;
+}
+
+function get(document: unknown, path: string): unknown {
+  const [target, key] = parent(document, path);
+  const value = Array.isArray(target) ? target[Number(key)] : target[key];
+  if (value === undefined) {
+    throw new PatchError(`no such path ${path}`);
+  }
+  return value;
+}
+
+function remove(document: unknown, path: string): unknown {
+  const value = get(document, path);
+  const [target, key] = parent(document, path);
+  if (Array.isArray(target)) {
+    target.splice(Number(key), 1);
+  } else {
+    delete target[key];
+  }
+  return value;
+}
+
+function add(document: unknown, path: string, value: unknown): void {
+  const [target, key] = parent(document, path);
+  if (Array.isArray(target)) {
+    target.splice(arrayIndex(target, key, path, target.length), 0, value);
+  } else {
+    target[key] = value;
+  }
+}
+
+/**
+ * Apply a patch to `document` in place
+ */
+export function applyPatch<T>(document: T, patch: PatchOperation[]): T {
+  for (const op of patch) {
+    switch (op.op) {
+      case 'add':
+        add(document, op.path, structuredClone(op.value));
+        break;
+      case 'remove':
+        remove(document, op.path);
+        break;
+      case 'replace': {
+        // Assigned in place, so object keys keep their order for the hash
+        get(document, op.path);
+        const [target, key] = parent(document, op.path);
+        if (Array.isArray(target)) {
+          target[Number(key)] = structuredClone(op.value);
+        } else {
+          target[key] = structuredClone(op.value);
+        }
+        break;
+      }
+      case 'move':
+        add(document, op.path, remove(document, op.from));
+        break;
+      case 'test':
+        if (JSON.stringify(get(document, op.path)) !== JSON.stringify(op.value)) {
+          throw new PatchError(`test failed at ${op.path}`);
+        }
+        break;
+      default:
+        throw new PatchError(`unsupported op ${(op as { op: string }).op}`);
+    }
+  }
+  return document;
+}
+
+/**
+ * Hex sha256 of a bundle as the release job encodes it
+ */
+export async function bundleHash(bundle: ReleaseBundle | string): Promise<string> {
+  const text = typeof bundle === 'string' ? bundle : JSON.stringify(bundle) + '\n';
+  const digest = await crypto.subtle.digest('SHA-256', new TextEncoder().encode(text));
+  return Array.from(new Uint8Array(digest), (b) => b.toString(16).padStart(2, '0')).join('');
+}
+
+async function fetchOk(url: string): Promise<Response> {
+  const response = await fetch(url);
+  if (!response.ok) {
+    throw new Error(`Failed to load ${url}: ${response.status}`);
+  }
+  return response;
+}
+
+function cachedBundle(): ReleaseBundle | null {
+  try {
+    const stored = localStorage.getItem(STORAGE_KEY);
+    return stored ? (JSON.parse(stored) as ReleaseBundle) : null;
+  } catch {
+    return null;
+  }
+}
+
+/**
+ * Patch `bundle` up to `index.latest`, or `null` if any step is missing or wrong
+ */
+async function patchForward(bundle: ReleaseBundle, index: ReleaseIndex): Promise<ReleaseBundle | null> {
+  for (const entry of index.releases.filter((r) => r.version > bundle.version)) {
+    if (!entry.patch) return null;
+    try {
+      const patch = (await (await fetchOk(RELEASES_URL + entry.patch.file)).json()) as PatchOperation[];
+      applyPatch(bundle, patch);
+    } catch (error) {
+      logger.warn(`Could not apply ${entry.patch.file}`, error);
+      return null;
+    }
+    if (bundle.version !== entry.version || (await bundleHash(bundle)) !== entry.sha256) {
+      logger.warn(`Patched bundle does not match v${entry.version}`);
+      return null;
+    }
+  }
+  return bundle;
+}
+
+/**
+ * The latest release, by patches from the stored one where possible
+ *
+ * `null` when there are no releases yet, or nothing can be fetched and
+ * verified (the app then keeps the packs it was built with).
+ */
+export async function loadLatestRelease(): Promise<ReleaseBundle | null> {
+  try {
+    const index = (await (await fetchOk(RELEASES_URL + 'index.json')).json()) as ReleaseIndex;
+    const latest = index.releases.find((r) => r.version === index.latest);
+    if (!latest) return null;
+
+    const cached = cachedBundle();
+    if (cached && cached.version === latest.version) return cached;
+
+    let bundle = cached && cached.version < latest.version ? await patchForward(cached, index) : null;
+    if (bundle) {
+      logger.info(`Patched word bank from v${cached!.version} to v${bundle.version}`);
+    } else {
+      const text = await (await fetchOk(RELEASES_URL + latest.file)).text();
+      if ((await bundleHash(text)) !== latest.sha256) {
+        throw new Error(`${latest.file} does not match its sha256`);
+      }
+      bundle = JSON.parse(text) as ReleaseBundle;
+      logger.info(`Downloaded word bank v${bundle.version}`);
+    }
+    localStorage.setItem(STORAGE_KEY, JSON.stringify(bundle));
+    return bundle;
+  } catch (error) {
+    logger.error('Failed to update the word bank', error);
+    return null;
+  }
+}
+
+/**
+ * Packs from a release, keeping fields the bundle leaves out (patterns)
+ */
+export function releasePacks(bundle: ReleaseBundle, current: WordPack[]): WordPack[] {
+  const byId = new Map(current.map((pack) => [pack.id, pack]));
+  return Object.entries(bundle.packs).map(([id, pack]) => ({
+    ...byId.get(Number(id)),
+    id: Number(id),
+    ...pack,
+  }));
+}
@@ -0,0 +1,90 @@
+/**
+ * Spaced-repetition review queue, computed on the client
+ *
+ * Mirrors `python -m phonics schedule`, which precomputes the same queue
+ * nightly into review_queue: every marked word gets an SM-2 style due time
+ * (the pack's completion count stands in for the number of reviews, the
+ * word's status for the answer quality), parent-starred words are due at
+ * once, and the words due by the end of the day come back most overdue
+ * first. Used when the nightly row for today is missing.
+ */
+
+import type { PackProgress, ReviewQueueItem, UserProgress } from '@/types';
+import { UI_CONFIG } from '@/constants/config';
+
+// SM-2 answer quality (0-5) for each word status
+const QUALITY: Record<string, number> = { tricky: 2, mastered: 5 };
+const INITIAL_EASE = 2.5;
+const MIN_EASE = 1.3;
+const DAY_MS = 24 * 60 * 60 * 1000;
+
+/**
+ * Days until the next review after `repetitions` reviews at `quality`
+ */
+export function intervalDays(quality: number, repetitions: number): number {
+  let interval = 0;
+  let ease = INITIAL_EASE;
+  for (let n = 1; n <= repetitions; n++) {
+    if (quality < 3 || n === 1) {
+      interval = 1;
+    } else if (n === 2) {
+      interval = 6;
+    } else {
+      interval = Math.round(interval * ease);
+    }
+    ease = Math.max(MIN_EASE, ease + 0.1 - (5 - quality) * (0.08 + (5 - quality) * 0.02));
+  }
+  return interval;
+}
+
+/**
+ * The queue date the nightly job writes for `now` (YYYY-MM-DD, UTC)
+ */
+export function queueDate(now: Date = new Date()): string {
+  return now.toISOString().slice(0, 10);
+}
+
+/**
+ * Up to `limit` words due by the end of `day` (YYYY-MM-DD, UTC), most overdue first
+ */
+export function buildReviewQueue(
+  progress: UserProgress | Record<number, PackProgress>,
+  day: string = queueDate(),
+  limit: number = UI_CONFIG.WORDS_PER_PAGE
+): ReviewQueueItem[] {
+  const until = Date.parse(`${day}T00:00:00Z`) + DAY_MS;
+  const due: Array<{ due: number; packId: number; word: string }> = [];
+
+  for (const [id, pack] of Object.entries(progress as UserProgress)) {
+    const packId = Number(id);
+    const reviewed = pack.lastReviewed ? Date.parse(pack.lastReviewed) : NaN;
+    // Custom packs are not scheduled, and a pack never reviewed has nothing due
+    if (!Number.isInteger(packId) || Number.isNaN(reviewed)) continue;
+
+    // Every word in the pack shares its review count, so a status fixes the due time
+    const repetitions = Math.max(1, pack.completionCount || 0);
+    for (const [word, status] of Object.entries(pack.words || {})) {
+      const quality = QUALITY[status];
+      if (quality !== undefined) {
+        due.push({ due: reviewed + intervalDays(quality, repetitions) * DAY_MS, packId, word });
+      }
+    }
+    for (const word of Object.keys(pack.starred || {})) {
+      due.push({ due: reviewed, packId, word });
+    }
+  }
+
+  due.sort((a, b) => a.due - b.due || a.packId - b.packId || (a.word < b.word ? -1 : a.word > b.word ? 1 : 0));
+
+  const queue: ReviewQueueItem[] = [];
+  const seen = new Set<string>();
+  for (const entry of due) {
+    if (entry.due > until || queue.length >= limit) break;
+    const key = `${entry.packId}:${entry.word}`;
+    if (!seen.has(key)) {
+      seen.add(key);
+      queue.push({ word: entry.word, packId: entry.packId });
+    }
+  }
+  return queue;
+}
@@ -1,18 +1,28 @@
 /**
- * Text-to-speech utility using Web Speech API
+ * Text-to-speech utility using pre-rendered clips with a Web Speech API fallback
  */
 
 import { logger } from './logger';
 
+const AUDIO_BASE = `${import.meta.env.BASE_URL}audio/`;
+
+interface AudioManifest {
+  clips: Record<string, string>;
+}
+
 class SpeechService {
   private synthesis: SpeechSynthesis | null = null;
   private voice: SpeechSynthesisVoice | null = null;
   private initialized = false;
+  private clips: Record<string, string> = {};
+  private audio: HTMLAudioElement | null = null;
 
   /**
    * Initialize the speech service
    */
   initialize(): void {
+    void this.loadManifest();
+
     if (!('speechSynthesis' in window)) {
       logger.warn('Speech synthesis not supported in this browser');
       return;
@@ -43,18 +53,52 @@ class SpeechService {
     }
   }
 
+  /**
+   * Load the manifest of pre-rendered clips written by `python -m phonics audio`
+   */
+  async loadManifest(): Promise<void> {
+    try {
+      const response = await fetch(`${AUDIO_BASE}manifest.json`);
+      if (!response.ok) {
+        return;
+      }
+      const manifest: AudioManifest = await response.json();
+      this.clips = manifest.clips;
+      logger.info('Audio manifest loaded', { clips: Object.keys(this.clips).length });
+    } catch (error) {
+      logger.warn('No pre-rendered audio, using live speech synthesis', error);
+    }
+  }
+
   /**
    * Check if speech is available
    */
   isAvailable(): boolean {
-    return this.initialized && this.synthesis !== null;
+    return Object.keys(this.clips).length > 0 || (this.initialized && this.synthesis !== null);
   }
 
   /**
-   * Speak a word
+   * Speak a word, playing its pre-rendered clip when there is one
    */
   speak(text: string, options?: { rate?: number; pitch?: number; volume?: number }): void {
-    if (!this.isAvailable()) {
+    const clip = this.clips[text] ?? this.clips[text.toLowerCase()];
+    if (clip) {
+      this.stop();
+      this.audio = new Audio(AUDIO_BASE + clip);
+      this.audio.volume = options?.volume ?? 1.0;
+      this.audio.play().catch(error => {
+        logger.warn('Failed to play audio clip, using live speech synthesis', error);
+        this.speakLive(text, options);
+      });
+      logger.info('Playing word clip', { text });
+      return;
+    }
+
+    this.speakLive(text, options);
+  }
+
+  private speakLive(text: string, options?: { rate?: number; pitch?: number; volume?: number }): void {
+    if (!this.initialized || this.synthesis === null) {
       logger.warn('Speech synthesis not available');
       return;
     }
@@ -85,6 +129,10 @@ class SpeechService {
    * Stop any ongoing speech
    */
   stop(): void {
+    if (this.audio) {
+      this.audio.pause();
+      this.audio = null;
+    }
     if (this.synthesis) {
       this.synthesis.cancel();
     }
@@ -0,0 +1,166 @@
+/**
+ * Word search over the preset packs - which pack is a word in?
+ *
+ * The index is built by `python -m phonics search` and fetched from
+ * public/search-index.json the first time a search runs. Words are sorted
+ * lowercase, so prefix matches are one contiguous range found by binary
+ * search; longer queries also match inside words via a trigram index.
+ */
+
+import { logger } from './logger';
+
+const NGRAM = 3;
+const INDEX_URL = `${import.meta.env.BASE_URL}search-index.json`;
+
+/** Layout of search-index.json */
+export interface SearchIndexData {
+  version: number;
+  subPacks: string[];
+  packs: Array<[number, string, number]>; // [id, category, subPacks index]
+  words: string[]; // sorted by lowercase form
+  wordPacks: Array<number | number[]>; // packs index (or indexes) per word
+  ngrams: Record<string, number[]>; // trigram -> delta-encoded word indexes
+}
+
+export interface WordSearchResult {
+  word: string;
+  packs: Array<{ id: number; category: string; subPack: string }>;
+}
+
+function trigrams(word: string): string[] {
+  const grams = new Set<string>();
+  for (let i = 0; i + NGRAM <= word.length; i++) {
+    grams.add(word.slice(i, i + NGRAM));
+  }
+  return [...grams];
+}
+
+export class WordSearchIndex {
+  private keys: string[];
+  private postings = new Map<string, Uint32Array>();
+
+  constructor(private data: SearchIndexData) {
+    this.keys = data.words.map((word) => word.toLowerCase());
+
+    Object.entries(data.ngrams).forEach(([gram, deltas]) => {
+      const ids = new Uint32Array(deltas.length);
+      let id = 0;
+      deltas.forEach((delta, i) => {
+        id += delta;
+        ids[i] = id;
+      });
+      this.postings.set(gram, ids);
+    });
+  }
+
+  /**
+   * First index whose key is >= target
+   */
+  private lowerBound(target: string, lo = 0): number {
+    let hi = this.keys.length;
+    while (lo < hi) {
+      const mid = (lo + hi) >>> 1;
+      if (this.keys[mid] < target) {
+        lo = mid + 1;
+      } else {
+        hi = mid;
+      }
+    }
+    return lo;
+  }
+
+  private prefix(query: string, limit: number): number[] {
+    const lo = this.lowerBound(query);
+    const hi = this.lowerBound(query + '\uffff', lo);
+    const matches: number[] = [];
+    for (let i = lo; i < hi && matches.length < limit; i++) {
+      matches.push(i);
+    }
+    return matches;
+  }
+
+  private substring(query: string, limit: number): number[] {
+    let candidates: Uint32Array | undefined;
+    for (const gram of trigrams(query)) {
+      const ids = this.postings.get(gram);
+      if (!ids) return [];
+      if (!candidates || ids.length < candidates.length) {
+        candidates = ids;
+      }
+    }
+
+    const matches: number[] = [];
+    for (const i of candidates ?? []) {
+      if (this.keys[i].includes(query)) {
+        matches.push(i);
+        if (matches.length >= limit) break;
+      }
+    }
+    return matches;
+  }
+
+  /**
+   * Words starting with the query, then (for 3+ letters) words containing it
+   */
+  search(query: string, limit = 20): WordSearchResult[] {
+    const q = query.trim().toLowerCase();
+    if (!q) return [];
+
+    const matches = this.prefix(q, limit);
+    if (q.length >= NGRAM && matches.length < limit) {
+      const seen = new Set(matches);
+      for (const i of this.substring(q, limit + matches.length)) {
+        if (!seen.has(i)) {
+          matches.push(i);
+          if (matches.length >= limit) break;
+        }
+      }
+    }
+
+    return matches.map((i) => {
+      const packIndexes = this.data.wordPacks[i];
+      return {
+        word: this.data.words[i],
+        packs: (Array.isArray(packIndexes) ? packIndexes : [packIndexes]).map((p) => {
+          const [id, category, subPack] = this.data.packs[p];
+          return { id, category, subPack: this.data.subPacks[subPack] };
+        }),
+      };
+    });
+  }
+}
+
+let loading: Promise<WordSearchIndex> | null = null;
+
+/**
+ * Fetch the search index once, on first use
+ */
+export function loadWordSearch(): Promise<WordSearchIndex> {
+  if (!loading) {
+    loading = fetch(INDEX_URL)
+      .then((response) => {
+        if (!response.ok) {
+          throw new Error(`Failed to load search index: ${response.status}`);
+        }
+        return response.json();
+      })
+      .then((data: SearchIndexData) => {
+        logger.info('Search index loaded', { words: data.words.length });
+        return new WordSearchIndex(data);
+      })
+      .catch((error) => {
+        loading = null; // allow a retry
+        logger.error('Failed to load search index', error);
+        throw error;
+      });
+  }
+  return loading;
+}
+
+/**
+ * Search the preset packs for a word
+ */
+export async function searchWords(query: string, limit = 20): Promise<WordSearchResult[]> {
+  const index = await loadWordSearch();
+  return index.search(query, limit);
+}
@@ -0,0 +1,35 @@
+-- Migration: Add compact word-status columns to pack_progress
+-- Filled from the JSONB columns by `python -m phonics compact` (service role).
+-- Statuses are stored by each word's position in the pack at bank release
+-- bank_version (public/releases/v<bank_version>.json):
+--   word_bits     2 bits per word, word i in byte i / 4 at bit 2 * (i % 4)
+--                 0 unmarked, 1 tricky, 2 mastered, 3 starred
+--   starred_bits  1 bit per word, word i in byte i / 8 at bit i % 8
+-- Trailing zero bytes are dropped. Rows whose words are not all in the pack
+-- at that release keep bank_version NULL and only the JSONB form.
+
+ALTER TABLE pack_progress ADD COLUMN IF NOT EXISTS bank_version INTEGER;
+ALTER TABLE pack_progress ADD COLUMN IF NOT EXISTS word_bits BYTEA;
+ALTER TABLE pack_progress ADD COLUMN IF NOT EXISTS starred_bits BYTEA;
+
+-- The app writes only the JSONB columns, so any change to them clears the
+-- bits (unless the same update sets new ones); readers then fall back to the
+-- JSONB until the next compact run re-encodes the row.
+CREATE OR REPLACE FUNCTION clear_stale_pack_progress_bits()
+RETURNS TRIGGER AS $$
+BEGIN
+  IF (NEW.words IS DISTINCT FROM OLD.words OR NEW.starred IS DISTINCT FROM OLD.starred)
+     AND NEW.word_bits IS NOT DISTINCT FROM OLD.word_bits THEN
+    NEW.bank_version = NULL;
+    NEW.word_bits = NULL;
+    NEW.starred_bits = NULL;
+  END IF;
+  RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS clear_pack_progress_bits ON pack_progress;
+CREATE TRIGGER clear_pack_progress_bits
+  BEFORE UPDATE OF words, starred ON pack_progress
+  FOR EACH ROW
+  EXECUTE FUNCTION clear_stale_pack_progress_bits();
@@ -0,0 +1,23 @@
+-- Migration: Add review_queue table for precomputed spaced-repetition queues
+-- Rows are written in bulk by `python -m phonics schedule` (service role);
+-- the app only reads its own row.
+
+CREATE TABLE IF NOT EXISTS review_queue (
+  user_id UUID PRIMARY KEY REFERENCES auth.users(id) ON DELETE CASCADE,
+  queue_date DATE NOT NULL,
+  pack_ids INTEGER[] NOT NULL DEFAULT '{}', -- pack of each queued word
+  words TEXT[] NOT NULL DEFAULT '{}', -- queued words, most overdue first
+  generated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+);
+
+-- Enable Row Level Security
+ALTER TABLE review_queue ENABLE ROW LEVEL SECURITY;
+
+-- Create policy: Users can only see their own review queue
+CREATE POLICY "Users can view own review queue" ON review_queue
+  FOR SELECT
+  USING (auth.uid() = user_id);
+
+-- Grant permissions
+GRANT SELECT ON review_queue TO authenticated;
+GRANT ALL ON review_queue TO service_role;
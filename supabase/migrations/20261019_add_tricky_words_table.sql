@@ -0,0 +1,29 @@
+-- Migration: Add tricky_words table for precomputed tricky-word rollups
+-- Rows are written in bulk by `python -m phonics rollup` (service role).
+-- One row per user and TrickyWordLevel scope:
+--   level 'global'  scope ''              every tricky word
+--   level 'subpack' scope <subPack name>  tricky words in that sub-pack
+--   level 'pack'    scope <pack id>       tricky words in that pack
+
+CREATE TABLE IF NOT EXISTS tricky_words (
+  user_id UUID NOT NULL REFERENCES auth.users(id) ON DELETE CASCADE,
+  level TEXT NOT NULL CHECK (level IN ('global', 'subpack', 'pack')),
+  scope TEXT NOT NULL DEFAULT '',
+  pack_ids INTEGER[] NOT NULL DEFAULT '{}', -- pack of each tricky word
+  word_indexes SMALLINT[] NOT NULL DEFAULT '{}', -- position of the word in that pack
+  generated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+
+  PRIMARY KEY (user_id, level, scope)
+);
+
+-- Enable Row Level Security
+ALTER TABLE tricky_words ENABLE ROW LEVEL SECURITY;
+
+-- Create policy: Users can only see their own tricky words
+CREATE POLICY "Users can view own tricky words" ON tricky_words
+  FOR SELECT
+  USING (auth.uid() = user_id);
+
+-- Grant permissions
+GRANT SELECT ON tricky_words TO authenticated;
+GRANT ALL ON tricky_words TO service_role;
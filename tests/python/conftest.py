@@ -0,0 +1,94 @@
+"""Shared fixtures for the ``phonics`` toolchain tests (run with ``python -m pytest tests/python``)."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from phonics import config  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    """Keep every cache (features, snapshots, lexicons) out of the repository."""
+    path = tmp_path / 'cache'
+    monkeypatch.setattr(config, 'CACHE_DIR', path)
+    return path
+
+
+PACK_PROGRESS = """
+    CREATE TEMP TABLE pack_progress (
+      id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+      user_id UUID NOT NULL,
+      pack_id INTEGER NOT NULL,
+      words JSONB NOT NULL DEFAULT '{}',
+      starred JSONB DEFAULT '{}',
+      completed BOOLEAN DEFAULT FALSE,
+      completion_count INTEGER DEFAULT 0,
+      last_reviewed TIMESTAMPTZ,
+      synced_at TIMESTAMPTZ DEFAULT NOW(),
+      created_at TIMESTAMPTZ DEFAULT NOW(),
+      updated_at TIMESTAMPTZ DEFAULT NOW(),
+      bank_version INTEGER,
+      word_bits BYTEA,
+      starred_bits BYTEA,
+      UNIQUE (user_id, pack_id)
+    )
+"""
+CUSTOM_PACKS = """
+    CREATE TEMP TABLE custom_packs (
+      id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+      user_id UUID NOT NULL,
+      local_id TEXT NOT NULL,
+      name TEXT NOT NULL,
+      words TEXT[] NOT NULL DEFAULT '{}',
+      created_at TIMESTAMPTZ DEFAULT NOW(),
+      updated_at TIMESTAMPTZ DEFAULT NOW(),
+      synced_at TIMESTAMPTZ DEFAULT NOW(),
+      UNIQUE (user_id, local_id)
+    )
+"""
+TRICKY_WORDS = """
+    CREATE TEMP TABLE tricky_words (
+      user_id UUID NOT NULL,
+      level TEXT NOT NULL,
+      scope TEXT NOT NULL DEFAULT '',
+      pack_ids INTEGER[] NOT NULL DEFAULT '{}',
+      word_indexes SMALLINT[] NOT NULL DEFAULT '{}',
+      generated_at TIMESTAMPTZ DEFAULT NOW(),
+      PRIMARY KEY (user_id, level, scope)
+    )
+"""
+REVIEW_QUEUE = """
+    CREATE TEMP TABLE review_queue (
+      user_id UUID PRIMARY KEY,
+      queue_date DATE NOT NULL,
+      pack_ids INTEGER[] NOT NULL DEFAULT '{}',
+      words TEXT[] NOT NULL DEFAULT '{}',
+      generated_at TIMESTAMPTZ DEFAULT NOW()
+    )
+"""
+
+
+@pytest.fixture
+def database():
+    """A connection to ``$DATABASE_URL`` with empty temporary app tables shadowing the real ones.
+
+    Skipped when no database is configured or psycopg2 is not installed.
+    """
+    from phonics import db
+
+    url = db.database_url()
+    if not url:
+        pytest.skip('no database: set DATABASE_URL to a local Postgres')
+    pytest.importorskip('psycopg2')
+    conn = db.connect(url)
+    with conn, conn.cursor() as cur:
+        cur.execute(PACK_PROGRESS)
+        cur.execute(CUSTOM_PACKS)
+        cur.execute(TRICKY_WORDS)
+        cur.execute(REVIEW_QUEUE)
+    yield conn
+    conn.close()
@@ -0,0 +1,69 @@
+import json
+import math
+import random
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from phonics.calibrate import calibrate, fit_rasch, read_attempts  # noqa: E402
+from phonics.difficulty import calibrated_scorer, load_difficulty_table  # noqa: E402
+
+WORDS = ['cat', 'ship', 'night', 'beautiful']
+TRUE_DIFFICULTY = [-2.0, -0.5, 0.5, 2.0]
+
+
+def simulate(n_pupils=400, seed=0):
+    """Progress rows where every pupil marks every word once."""
+    rng = random.Random(seed)
+    rows = []
+    for pupil in range(n_pupils):
+        ability = rng.gauss(0, 1)
+        marks = {word: 'mastered' if rng.random() < 1 / (1 + math.exp(d - ability)) else 'tricky'
+                 for word, d in zip(WORDS, TRUE_DIFFICULTY)}
+        rows.append((f'pupil-{pupil}', marks))
+    return rows
+
+
+def test_read_attempts():
+    users, words, outcomes, n_users, word_list = read_attempts([
+        ('a', {'Cat': 'mastered', 'ship': 'tricky', 'hat': 'starred'}),
+        ('b', None),
+        ('a', {'cat': 'tricky'}),
+    ])
+    assert (users.tolist(), words.tolist(), outcomes.tolist()) == ([0, 0, 0], [0, 1, 0], [1, 0, 0])
+    assert n_users == 2 and word_list == ['cat', 'ship']
+
+
+def test_fit_recovers_word_order():
+    users, words, outcomes, n_users, word_list = read_attempts(simulate())
+    abilities, difficulties = fit_rasch(users, words, outcomes, n_users, len(word_list))
+    assert word_list == WORDS
+    assert list(np.argsort(difficulties)) == [0, 1, 2, 3]
+    assert difficulties.mean() == pytest.approx(0)
+    # Joint maximum likelihood over four words stretches the scale a little
+    assert np.corrcoef(difficulties, TRUE_DIFFICULTY)[0, 1] > 0.99
+    assert np.isfinite(abilities).all()
+
+
+def test_perfect_pupils_stay_finite():
+    rows = [('ace', {w: 'mastered' for w in WORDS}), ('stuck', {w: 'tricky' for w in WORDS})] + simulate(50)
+    abilities, _ = fit_rasch(*read_attempts(rows)[:4], len(WORDS))
+    assert np.isfinite(abilities).all() and abilities[0] > abilities[2:].max() - 1e-9
+
+
+def test_calibrate_on_the_heuristic_scale(tmp_path):
+    rows = simulate() + [('late', {'zebra': 'tricky'})]
+    table = calibrate(rows, min_attempts=20)
+    assert table['pupils'] == 401 and table['attempts'] == 1601
+    assert list(table['words']) == sorted(WORDS)  # zebra has too few marks
+    scores = [table['words'][w]['score'] for w in WORDS]
+    assert scores == sorted(scores)
+    assert all(table['words'][w]['attempts'] == 400 for w in WORDS)
+    assert calibrate([('a', {'cat': 'starred'})]) is None
+
+    path = tmp_path / 'word_difficulty.json'
+    path.write_text(json.dumps(table), encoding='utf-8')
+    score = calibrated_scorer(load_difficulty_table(path), fallback=lambda w: -1)
+    assert score('Ship') == table['words']['ship']['score']
+    assert score('zebra') == -1
@@ -0,0 +1,59 @@
+import pytest
+
+pytest.importorskip('reportlab')
+pypdf = pytest.importorskip('pypdf')
+
+from phonics.cards import content_hash, pack_content, render_pack, render_packs, select_packs  # noqa: E402
+from phonics.model import Pack, WordTable  # noqa: E402
+
+SYLLABLES = {'rabbit': ['rab', 'bit'], 'cat': ['cat'], 'picnic': ['pic', 'nic']}
+
+
+def make_pack(pack_id, words, sub_pack='Short Vowels'):
+    return Pack.from_words(pack_id, f'P{pack_id}: Test', '', 'T', words, table=WordTable(), sub_pack=sub_pack)
+
+
+def test_content_keeps_multi_syllable_splits():
+    content = pack_content(make_pack(1, ['cat', 'Rabbit', 'hat']), SYLLABLES)
+    assert content == {'id': 1, 'title': 'P1: Test', 'words': ['cat', 'Rabbit', 'hat'],
+                       'splits': {'Rabbit': ['rab', 'bit']}}
+
+
+def test_hash_follows_printed_content():
+    content = pack_content(make_pack(1, ['cat', 'rabbit']), SYLLABLES)
+    assert content_hash(content) == content_hash(pack_content(make_pack(1, ['cat', 'rabbit']), SYLLABLES))
+    assert content_hash(content) != content_hash(pack_content(make_pack(1, ['cat', 'rabbits']), SYLLABLES))
+    assert content_hash(content) != content_hash(pack_content(make_pack(1, ['cat', 'rabbit']), {}))
+
+
+def test_pages(tmp_path):
+    words = [f'word{i}' for i in range(9)] + ['picnic']
+    path = tmp_path / 'pack.pdf'
+    render_pack(pack_content(make_pack(1, words), SYLLABLES), str(path))
+    pages = pypdf.PdfReader(path).pages
+    # Two pages of eight cards, then one worksheet of up to fourteen lines
+    assert len(pages) == 3
+    assert 'word7' in pages[0].extract_text() and 'word8' not in pages[0].extract_text()
+    assert 'pic · nic' in pages[1].extract_text()
+    assert 'write it on the line' in pages[2].extract_text()
+    assert '3 / 3' in pages[2].extract_text()
+
+    again = tmp_path / 'again.pdf'
+    render_pack(pack_content(make_pack(1, words), SYLLABLES), str(again))
+    assert again.read_bytes() == path.read_bytes()
+
+
+def test_only_changed_packs_are_rendered():
+    contents = [pack_content(make_pack(i, ['cat', f'w{i}']), SYLLABLES) for i in (1, 2)]
+    cached, rendered = render_packs(contents, jobs=1)
+    assert rendered == 2
+    contents[1] = pack_content(make_pack(2, ['cat', 'changed']), SYLLABLES)
+    again, rendered = render_packs(contents, jobs=1)
+    assert rendered == 1 and again[1] == cached[1] and again[2] != cached[2]
+
+
+def test_select_packs():
+    packs = [make_pack(1, ['cat']), make_pack(2, ['ship'], 'Digraphs'), make_pack(3, ['chip'], 'Digraphs')]
+    assert [p.id for p in select_packs(packs, [3, 1])] == [1, 3]
+    assert [p.id for p in select_packs(packs, sub_pack='digraphs')] == [2, 3]
+    assert select_packs(packs) is packs
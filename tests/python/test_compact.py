@@ -0,0 +1,87 @@
+import json
+import uuid
+from pathlib import Path
+
+from phonics.compact import (BankVersions, benchmark, compact, decode, decode_set, encode,
+                             encode_set, unencodable)
+from phonics.model import Pack, WordTable
+from phonics.releases import release
+
+WORDS = ['cat', 'hat', 'map', 'bag', 'pan', 'jam', 'ram', 'tap', 'sad']
+
+
+def test_encode_round_trip():
+    statuses = {'cat': 'mastered', 'bag': 'tricky', 'sad': 'starred'}
+    data = encode(WORDS, statuses)
+    assert len(data) == 3
+    assert decode(WORDS, data) == statuses
+
+
+def test_encode_drops_trailing_zero_bytes():
+    assert encode(WORDS, {'hat': 'tricky'}) == bytes([1 << 2])
+    assert encode(WORDS, {}) == b''
+    assert decode(WORDS, b'') == {}
+
+
+def test_encode_set_round_trip():
+    data = encode_set(WORDS, {'map', 'sad'})
+    assert data == bytes([1 << 2, 1])
+    assert decode_set(WORDS, data) == ['map', 'sad']
+
+
+def test_unencodable():
+    assert unencodable(WORDS, {'cat': 'mastered', 'dog': 'tricky', 'hat': 'learning'}) == ['dog', 'hat']
+
+
+def _released(tmp_path):
+    table = WordTable()
+    packs = [Pack.from_words(1, 'Short a', 'cat', '1. SHORT VOWEL A', WORDS, table=table),
+             Pack.from_words(2, 'Short i', 'pin', '1. SHORT VOWEL I', ['pin', 'sit', 'big'], table=table)]
+    release(packs, tmp_path)
+    return BankVersions(tmp_path)
+
+
+def test_compact_and_benchmark_skip_unencodable_rows(database, tmp_path):
+    versions = _released(tmp_path)
+    user_id = str(uuid.uuid4())
+    rows = [
+        (1, {'cat': 'mastered', 'bag': 'tricky'}, {'bag': 'starred'}),
+        (2, {'pin': 'mastered', 'zebra': 'tricky'}, {}),
+    ]
+    with database, database.cursor() as cur:
+        for pack_id, words, starred in rows:
+            cur.execute('INSERT INTO pack_progress (user_id, pack_id, words, starred) VALUES (%s, %s, %s, %s)',
+                        (user_id, pack_id, json.dumps(words), json.dumps(starred)))
+
+    encoded, skipped, problems = compact(database, versions, 1)
+    assert (encoded, skipped) == (1, 1)
+    assert 'zebra' in problems[0]
+
+    result = benchmark(database, versions)
+    assert result['rows'] == 1
+    assert result['pupils'] == 1
+
+
+def test_app_writes_clear_the_bits(database, tmp_path):
+    versions = _released(tmp_path)
+    migration = Path(__file__).parents[2] / 'supabase' / 'migrations' / '20261019_add_pack_progress_bits.sql'
+    user_id = str(uuid.uuid4())
+    with database, database.cursor() as cur:
+        cur.execute(migration.read_text(encoding='utf-8'))
+        for pack_id, words in ((1, {'cat': 'mastered'}), (2, {'pin': 'tricky'})):
+            cur.execute('INSERT INTO pack_progress (user_id, pack_id, words) VALUES (%s, %s, %s)',
+                        (user_id, pack_id, json.dumps(words)))
+    assert compact(database, versions, 1)[:2] == (2, 0)
+
+    with database, database.cursor() as cur:
+        # As the app saves: the JSONB columns only
+        cur.execute("UPDATE pack_progress SET words = %s, completed = TRUE WHERE pack_id = 1",
+                    (json.dumps({'cat': 'tricky'}),))
+        cur.execute("UPDATE pack_progress SET words = words, completed = TRUE WHERE pack_id = 2")
+        cur.execute('SELECT pack_id, bank_version, word_bits IS NULL FROM pack_progress ORDER BY pack_id')
+        assert cur.fetchall() == [(1, None, True), (2, 1, False)]
+
+    assert compact(database, versions, 1)[:2] == (2, 0)
+    with database.cursor() as cur:
+        cur.execute('SELECT word_bits FROM pack_progress WHERE pack_id = 1')
+        assert decode(WORDS, bytes(cur.fetchone()[0])) == {'cat': 'tricky'}
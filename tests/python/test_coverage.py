@@ -0,0 +1,36 @@
+import pytest
+
+pytest.importorskip('scipy')
+
+from phonics.coverage import coverage_matrix, graphemes, progression  # noqa: E402
+from phonics.features import load_features  # noqa: E402
+from phonics.model import Pack, WordTable  # noqa: E402
+
+WORD_LISTS = [
+    ['cat', 'hat', 'map'],
+    ['ship', 'fish', 'chat'],
+    ['night', 'light', 'sheep'],
+    ['make', 'cake', 'ship'],
+    ['rain', 'tail', 'chip'],
+]
+
+
+def test_graphemes():
+    assert graphemes('night') == ['n', 'igh', 't']
+    assert graphemes('make') == ['m', 'a_e', 'k']
+    assert graphemes('Ship-shape') == ['sh', 'i', 'p', 'sh', 'a_e', 'p']
+
+
+def test_progression():
+    table = WordTable()
+    packs = [Pack.from_words(i * 10, f'P{i}', '', 'C', words, table=table)
+             for i, words in enumerate(WORD_LISTS, start=1)]
+    matrix, names = coverage_matrix(packs, load_features(w for ws in WORD_LISTS for w in ws))
+    report = {entry['grapheme']: entry for entry in progression(matrix, names, packs, window=2)}
+
+    assert report['sh'] == {'grapheme': 'sh', 'firstPack': 20, 'packs': 3, 'words': 4,
+                            'density': 1.0, 'nextWindow': 3, 'longestGap': 1}
+    assert report['a_e'] == {'grapheme': 'a_e', 'firstPack': 40, 'packs': 1, 'words': 2,
+                             'density': 1.0, 'nextWindow': 2, 'longestGap': 1}
+    assert report['a']['nextWindow'] == 4 and report['a']['longestGap'] == 3
+    assert 'q' not in report
@@ -0,0 +1,85 @@
+import uuid
+
+from phonics.custom import LocalIds, PackReader, _records, import_packs
+
+USER = str(uuid.UUID(int=1))
+OTHER = str(uuid.UUID(int=2))
+SPELLINGS = {'cat': 'cat', 'hat': 'hat', 'ship': 'ship', 'fish': 'fish', 'monday': 'Monday'}
+
+
+def records(*rows, header=('user_id', 'local_id', 'name', 'words')):
+    return _records(iter([header, *rows]))
+
+
+def read(*rows, **kwargs):
+    reader = PackReader(SPELLINGS, **kwargs)
+    return [pack[1:] for pack in reader.packs(records(*rows))], reader
+
+
+def test_pack_continues_over_rows():
+    packs, _ = read((USER, 'C1', 'Animals', 'cat'),
+                    (USER, '', 'Animals', 'hat, cat'),
+                    (USER, '', 'Sea', 'fish'))
+    assert packs == [(USER, 'C1', 'Animals', ['cat', 'hat']),
+                     (USER, '', 'Sea', ['fish'])]
+
+
+def test_later_local_id_is_carried_back():
+    packs, _ = read((USER, '', 'Animals', 'cat'),
+                    (USER, 'C4', 'Animals', 'hat'))
+    assert packs == [(USER, 'C4', 'Animals', ['cat', 'hat'])]
+
+
+def test_new_pack_on_different_local_id_or_user():
+    packs, _ = read((USER, 'C1', 'Animals', 'cat'),
+                    (USER, 'C2', 'Animals', 'hat'),
+                    (OTHER, '', 'Animals', 'ship'))
+    assert [p[:2] for p in packs] == [(USER, 'C1'), (USER, 'C2'), (OTHER, '')]
+
+
+def test_words_are_normalised_and_checked():
+    packs, reader = read((USER, '', 'Days', 'MONDAY,  fish , zorb, 42'))
+    assert packs == [(USER, '', 'Days', ['Monday', 'fish', 'zorb'])]
+    assert reader.unknown_words == 1
+    assert [m for _, m in reader.problems] == ["not a word: '42'"]
+
+    packs, reader = read((USER, '', 'Days', 'monday, zorb'), bank_only=True)
+    assert packs == [(USER, '', 'Days', ['Monday'])]
+
+
+def test_bad_packs_are_reported():
+    packs, reader = read(('nobody', '', 'Animals', 'cat'), (USER, '', 'Empty', '42'))
+    assert packs == []
+    assert [m for _, m in reader.problems] == [
+        "bad user_id: 'nobody'", "not a word: '42'", "pack 'Empty' has no words"]
+
+
+def test_local_ids():
+    ids = LocalIds(lambda user_id: [('C1', 'Animals'), ('C3', 'Sea')])
+    assert ids.assign(USER, '', 'Sea') == 'C3'
+    assert ids.assign(USER, '', 'Colours') == 'C4'
+    assert ids.assign(USER, 'C9', 'Days') == 'C9'
+    assert ids.assign(USER, '', 'Shapes') == 'C10'
+    assert ids.assign(USER, 'C1', 'Animals') == 'C1'
+    assert ids.assign(USER, '', 'Animals') is None
+
+
+def test_import_continued_pack(database):
+    with database, database.cursor() as cur:
+        cur.execute("INSERT INTO custom_packs (user_id, local_id, name, words) "
+                    "VALUES (%s, 'C2', 'Sea', '{fish}')", (USER,))
+
+    problems = []
+    reader = PackReader(SPELLINGS)
+    packs = reader.packs(records((USER, 'C1', 'Animals', 'cat'),
+                                 (USER, '', 'Animals', 'hat'),
+                                 (USER, '', 'Sea', 'ship, fish'),
+                                 (USER, '', 'Colours', 'cat')))
+    assert import_packs(database, packs, lambda line, message: problems.append(message)) == 3
+    assert problems == []
+
+    with database.cursor() as cur:
+        cur.execute('SELECT local_id, name, words FROM custom_packs ORDER BY local_id')
+        assert cur.fetchall() == [('C1', 'Animals', ['cat', 'hat']),
+                                  ('C2', 'Sea', ['ship', 'fish']),
+                                  ('C3', 'Colours', ['cat'])]
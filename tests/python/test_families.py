@@ -0,0 +1,39 @@
+from phonics.families import SuffixIndex, rime
+from phonics.model import Pack, WordTable
+
+
+def index():
+    table = WordTable()
+    packs = [
+        Pack.from_words(3, 'P3', '', 'C', ['stump', 'cake', 'Jump'], table=table),
+        Pack.from_words(1, 'P1', '', 'A', ['jump', 'cat', 'bump'], table=table),
+        Pack.from_words(2, 'P2', '', 'B', ['lump', 'hat', 'ump'], table=table),
+    ]
+    return SuffixIndex(packs, table)
+
+
+def test_ending_in_pack_order():
+    assert index().ending('-ump') == [(1, 'jump'), (1, 'bump'), (2, 'lump'), (2, 'ump'),
+                                      (3, 'stump'), (3, 'Jump')]
+
+
+def test_ending_within_pack_range():
+    suffixes = index()
+    assert suffixes.ending('UMP', min_pack=2, max_pack=2) == [(2, 'lump'), (2, 'ump')]
+    assert suffixes.ending('ump', min_pack=3) == [(3, 'stump'), (3, 'Jump')]
+    assert suffixes.ending('at', max_pack=1) == [(1, 'cat')]
+    assert suffixes.ending('at', min_pack=4) == []
+
+
+def test_missing_ending():
+    assert index().ending('ox') == []
+
+
+def test_whole_index():
+    assert len(index().ending('')) == 9
+
+
+def test_rime():
+    assert [rime(w) for w in ('cat', 'jump', 'cake', 'night', 'play', 'my', 'rhythm')] == \
+        ['at', 'ump', 'ake', 'ight', 'ay', 'y', 'ythm']
+    assert rime('hmm') is None
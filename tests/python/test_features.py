@@ -0,0 +1,65 @@
+import os
+
+from phonics import config, features
+from phonics.coverage import graphemes
+from phonics.difficulty import count_syllables, get_difficulty_score
+from phonics.families import rime
+from phonics.features import CACHE_FILE, load_features
+
+
+def test_features_match_their_definitions(tmp_path):
+    table = load_features(['Night', 'cat', 'rhythm'], tmp_path / 'no-list.txt')
+    assert table.words == ['cat', 'night', 'rhythm']
+    for word in ('Night', 'cat', 'rhythm'):
+        assert table.syllables(word) == count_syllables(word)
+        assert table.difficulty(word) == get_difficulty_score(word)
+        assert table.graphemes(word) == graphemes(word)
+        assert table.rime(word) == rime(word)
+    assert table.row('night')['length'] == 5
+    assert 'NIGHT' in table and 'day' not in table
+    assert not table.ranked and 'frequency' not in table.columns
+
+
+def test_cache_computes_new_words_only(tmp_path, monkeypatch):
+    computed = []
+    compute = features.compute_features
+
+    def counting(words):
+        computed.append(list(words))
+        return compute(words)
+
+    monkeypatch.setattr(features, 'compute_features', counting)
+    no_list = tmp_path / 'no-list.txt'
+    load_features(['cat', 'ship'], no_list)
+    table = load_features(['ship', 'Cat', 'zebra', 'apple'], no_list)
+    assert computed == [['cat', 'ship'], ['apple', 'zebra']]
+    assert table.words == ['apple', 'cat', 'ship', 'zebra']
+    assert table.difficulty('zebra') == get_difficulty_score('zebra')
+
+    assert load_features(['cat'], no_list).words == table.words
+    assert len(computed) == 2
+
+
+def test_frequency_reranked_when_the_list_changes(tmp_path):
+    freq = tmp_path / 'freq.txt'
+    freq.write_text('cat 10\nship 5\n', encoding='utf-8')
+    table = load_features(['cat', 'ship', 'zebra'], freq)
+    assert table.ranked
+    assert [table.frequency(w) for w in ('cat', 'ship', 'zebra')] == [1, 2, 3]
+
+    freq.write_text('ship 50\ncat 10\n', encoding='utf-8')
+    os.utime(freq, ns=(0, 10**18))
+    table = load_features([], freq)
+    assert [table.frequency(w) for w in ('cat', 'ship', 'zebra')] == [2, 1, 3]
+
+    assert not load_features([], tmp_path / 'gone.txt').ranked
+
+
+def test_stale_or_broken_cache_is_rebuilt(tmp_path, monkeypatch):
+    no_list = tmp_path / 'no-list.txt'
+    load_features(['cat'], no_list)
+    monkeypatch.setattr(features, 'FEATURES_VERSION', features.FEATURES_VERSION + 1)
+    assert load_features(['ship'], no_list).words == ['ship']
+
+    (config.CACHE_DIR / CACHE_FILE).write_bytes(b'not marshal')
+    assert load_features(['hat'], no_list).words == ['hat']
@@ -0,0 +1,48 @@
+from phonics.frequency import FrequencyTable, load_frequency
+from phonics.split import regroup_into_packs, split_by_difficulty
+
+
+def test_ranks_by_count_then_alphabetically():
+    table = FrequencyTable.from_counts({'the': 90, 'cat': 5, 'bat': 5, 'and': 70})
+    assert table.words == ['and', 'bat', 'cat', 'the']
+    assert [table.rank(w) for w in ('the', 'and', 'bat', 'cat')] == [1, 2, 3, 4]
+    assert table.rank('The') == 1
+    assert table.rank('zebra') == table.unranked == 5
+    assert len(table) == 4
+
+
+def test_rank_words_matches_rank():
+    table = FrequencyTable.from_counts({'the': 90, 'cat': 5, 'bat': 5, 'and': 70})
+    words = ['cat', 'Cat', 'zebra', 'the', 'a', 'cat']
+    assert table.rank_words(words) == {w: table.rank(w) for w in words}
+
+
+def test_load_with_counts(tmp_path):
+    path = tmp_path / 'freq.txt'
+    path.write_text('the 900\nCat\t20\n\ndog 40\ncat 30\n', encoding='utf-8')
+    table = load_frequency(path)
+    assert [table.rank(w) for w in ('the', 'cat', 'dog')] == [1, 2, 3]
+
+
+def test_load_in_file_order(tmp_path):
+    path = tmp_path / 'freq.txt'
+    path.write_text('the\nof\nand\nthe\n', encoding='utf-8')
+    table = load_frequency(path)
+    assert [table.rank(w) for w in ('the', 'of', 'and')] == [1, 2, 3]
+    assert load_frequency(tmp_path / 'missing.txt') is None
+
+
+def test_frequency_breaks_difficulty_ties():
+    ranks = {'cat': 3, 'hat': 1, 'map': 2}
+    [(_, _, words)] = split_by_difficulty(['cat', 'hat', 'map'], 'A', 'a', ranks, score=lambda w: 10)
+    assert words == 'hat, map, cat'
+    [(_, _, words)] = split_by_difficulty(['cat', 'hat', 'map'], 'A', 'a', score=lambda w: 10)
+    assert words == 'cat, hat, map'
+
+
+def test_packs_ordered_by_frequency():
+    words = [f'w{i:02d}' for i in range(12)]
+    rows = [('A - Level 1', 'short a - Easy', ', '.join(words))]
+    ranks = {w: 12 - i for i, w in enumerate(words)}
+    assert regroup_into_packs(rows, ranks=ranks) == [('A', 'short a', ', '.join(reversed(words)))]
+    assert regroup_into_packs(rows) == [('A', 'short a', ', '.join(words))]
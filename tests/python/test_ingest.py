@@ -0,0 +1,30 @@
+from phonics.ingest import drop_unknown_phrases, merge_pages, parse_page_text
+from phonics.words import normalise_word, unknown_phrase
+
+
+def test_normalise_word():
+    assert normalise_word(' don’t. ') == "don't"
+    assert normalise_word('ice  cream') == 'ice cream'
+    assert normalise_word('42') is None
+
+
+def test_unknown_phrase():
+    phrases = {'ice cream'}
+    assert not unknown_phrase('cat', phrases)
+    assert not unknown_phrase('Ice Cream', phrases)
+    assert unknown_phrase('cl ay', phrases)
+
+
+def test_parse_and_merge_pages():
+    pages = [parse_page_text('Introduction\na\tcat, hat,\nmap'),
+             parse_page_text('bag, is assist\nsh ship, ice cream')]
+    assert merge_pages(pages) == [('a', ['cat', 'hat', 'map', 'bag', 'is assist']),
+                                  ('sh', ['ship', 'ice cream'])]
+
+
+def test_run_together_tokens_are_reported_not_ingested():
+    sections = [('a', ['cat', 'is assist']), ('ay', ['cl ay', 'play']), ('ea', ['Ice Cream'])]
+    problems = drop_unknown_phrases(sections, {'cat': 'a', 'ice cream': 'ea'})
+    assert sections == [('a', ['cat']), ('ay', ['play']), ('ea', ['Ice Cream'])]
+    assert problems == ["a: not a word or known phrase: 'is assist'",
+                        "ay: not a word or known phrase: 'cl ay'"]
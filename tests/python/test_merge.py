@@ -0,0 +1,76 @@
+import json
+import os
+
+import pytest
+
+from phonics.merge import PupilProgress, group_exports, merge_pupil
+
+
+def pack(words, reviewed, starred=None, completed=False, count=0):
+    return {'words': words, 'starred': starred or {}, 'completed': completed,
+            'completionCount': count, 'lastReviewed': reviewed}
+
+
+def test_latest_review_wins_per_word():
+    pupil = PupilProgress()
+    pupil.add('1', pack({'cat': 'tricky', 'hat': 'mastered'}, '2026-10-02T09:00:00Z',
+                        completed=True, count=3), file_time=2)
+    pupil.add('1', pack({'cat': 'mastered', 'map': 'tricky'}, '2026-10-03T09:00:00Z', count=1), file_time=1)
+    assert pupil.progress() == {'1': {
+        'words': {'cat': 'mastered', 'hat': 'mastered', 'map': 'tricky'},
+        'starred': {},
+        'completed': False,
+        'completionCount': 3,
+        'lastReviewed': '2026-10-03T09:00:00Z',
+    }}
+
+
+def test_older_export_does_not_override():
+    pupil = PupilProgress()
+    pupil.add('1', pack({'cat': 'mastered'}, '2026-10-03T09:00:00Z'), file_time=1)
+    pupil.add('1', pack({'cat': 'tricky'}, '2026-10-01T09:00:00Z', starred={'cat': 'starred'}), file_time=2)
+    merged = pupil.progress()['1']
+    assert merged['words'] == {'cat': 'mastered'}
+    assert merged['starred'] == {'cat': 'starred'}
+    assert merged['lastReviewed'] == '2026-10-03T09:00:00Z'
+
+
+def test_tie_goes_to_the_newer_file():
+    pupil = PupilProgress()
+    pupil.add('1', pack({'cat': 'tricky'}, None), file_time=2)
+    pupil.add('1', pack({'cat': 'mastered'}, None), file_time=1)
+    assert pupil.progress()['1']['words'] == {'cat': 'tricky'}
+
+
+def test_packs_in_id_order_and_bad_packs_rejected():
+    pupil = PupilProgress()
+    for pack_id in ('10', 'C2', '2'):
+        assert pupil.add(pack_id, pack({}, None), file_time=0)
+    assert not pupil.add('3', {'words': ['cat']}, file_time=0)
+    assert list(pupil.progress()) == ['2', '10', 'C2']
+
+
+def test_group_and_merge_exports(tmp_path):
+    pytest.importorskip('ijson')
+    (tmp_path / 'amelia').mkdir()
+    files = {
+        'amelia/ipad.json': {'1': pack({'cat': 'tricky'}, '2026-10-01T09:00:00Z')},
+        'amelia_laptop.json': {'1': pack({'cat': 'mastered'}, '2026-10-02T09:00:00Z'), '2': 'oops'},
+        'ben_ipad.json': {'1': pack({'hat': 'tricky'}, None)},
+    }
+    for name, data in files.items():
+        (tmp_path / name).write_text(json.dumps(data))
+    (tmp_path / 'ben_broken.json').write_text('{"1": {')
+    os.utime(tmp_path / 'ben_broken.json', (0, 0))
+
+    pupils = group_exports(tmp_path)
+    assert {pupil: len(paths) for pupil, paths in pupils.items()} == {'amelia': 2, 'ben': 2}
+
+    problems = []
+    merged = merge_pupil(pupils['amelia'], lambda path, message: problems.append(message))
+    assert merged['1']['words'] == {'cat': 'mastered'}
+    assert problems == ['pack 2 is not pack progress']
+
+    merged = merge_pupil(pupils['ben'], lambda path, message: problems.append(message))
+    assert merged['1']['words'] == {'hat': 'tricky'}
+    assert problems[-1].startswith('not a progress export')
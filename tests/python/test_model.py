@@ -0,0 +1,58 @@
+import json
+
+import pytest
+
+from phonics.model import Pack, WordTable, load_packs
+
+
+def test_words_are_interned_once():
+    table = WordTable(['cat'])
+    assert table.encode(['hat', 'cat', 'hat']).tolist() == [1, 0, 1]
+    assert len(table) == 2 and list(table) == ['cat', 'hat']
+    assert table.get('hat') == 1 and table.get('map') is None
+    assert table[1] == 'hat'
+    assert table.decode([1, 0]) == ['hat', 'cat']
+
+
+def test_packs_share_the_table():
+    table = WordTable()
+    a = Pack.from_words(1, 'P1', '', 'A', ['cat', 'hat'], table=table)
+    b = Pack.from_words(2, 'P2', '', 'B', ['hat', 'map'], table=table)
+    assert len(table) == 3
+    assert a.word_ids[1] == b.word_ids[0]
+    assert b.words == ['hat', 'map'] and len(b) == 2
+
+
+def test_replace_shares_the_word_array():
+    pack = Pack.from_words(1, 'P1', 'short a', 'A', ['cat', 'hat'], table=WordTable())
+    copy = pack.replace(id=7, sub_pack='Short Vowels', sub_pack_description='a e i o u')
+    assert copy.word_ids is pack.word_ids and copy.table is pack.table
+    assert (copy.id, copy.title, copy.sub_pack) == (7, 'P1', 'Short Vowels')
+    assert (pack.id, pack.sub_pack) == (1, None)
+
+
+def test_slots():
+    pack = Pack.from_words(1, 'P1', '', 'A', ['cat'], table=WordTable())
+    with pytest.raises(AttributeError):
+        pack.colour = 'red'
+
+
+def test_dict_round_trip(tmp_path):
+    data = [
+        {'id': 1, 'title': 'P1: A', 'description': 'short a', 'category': 'A', 'words': ['cat', 'hat']},
+        {'id': 2, 'title': 'P2: SH', 'description': 'sh', 'category': 'SH', 'words': ['ship', 'cat'],
+         'subPack': 'Digraphs', 'subPackDescription': 'two letters'},
+    ]
+    path = tmp_path / 'packs.json'
+    path.write_text(json.dumps(data), encoding='utf-8')
+    table = WordTable()
+    packs = load_packs(path, table)
+    assert [pack.to_dict() for pack in packs] == data
+    assert len(table) == 3
+    assert packs[0] == Pack.from_dict(data[0], WordTable())
+    assert packs[0] != packs[1]
+
+
+def test_from_dict_falls_back_to_category_for_title():
+    pack = Pack.from_dict({'id': 3, 'category': 'P3: Short Vowel I', 'words': ['pin']}, WordTable())
+    assert pack.title == 'P3: Short Vowel I' and pack.description is None
@@ -0,0 +1,69 @@
+from functools import partial
+
+import pytest
+
+from phonics.export import render_word_packs, write_word_packs
+from phonics.extract import extract_packs
+from phonics.model import WordTable
+from phonics.packfile import PackFileError, iter_packs, read_index, read_pack, write_packs
+from phonics.reorganize import reorganize
+
+ROWS = [
+    ('1. SHORT VOWEL A', 'Short a', 'cat, hat, map, bag, pan, jam'),
+    ('3. DIGRAPH SH', 'sh', 'ship, shop, fish, dish, shed, rush'),
+    ('1. SHORT VOWEL I', 'Short i', 'pin, sit, big, tip, wig, lid'),
+]
+
+
+@pytest.fixture
+def table():
+    return WordTable()
+
+
+@pytest.fixture
+def bank(tmp_path, table):
+    path = tmp_path / 'packs.ndjson'
+    packs = extract_packs(ROWS, table=table)
+    assert write_packs(path, packs) == len(packs)
+    return str(path), packs
+
+
+def test_iter_packs_round_trip(bank, table):
+    path, packs = bank
+    assert list(iter_packs(path, table)) == packs
+
+
+def test_read_pack_seeks_by_id(bank, table):
+    path, packs = bank
+    for pack in reversed(packs):
+        assert read_pack(path, pack.id, table) == pack
+    assert read_pack(path, 999, table) is None
+
+
+def test_stale_index_is_rebuilt(bank, table):
+    path, packs = bank
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write('{"id": 99, "title": "Extra", "category": "Extra", "words": ["zip"]}\n')
+    assert len(read_index(path)) == 2 + 2 * (len(packs) + 1)
+    assert read_pack(path, 99, table).words == ['zip']
+
+
+def test_not_a_pack_file(tmp_path):
+    path = tmp_path / 'other.ndjson'
+    path.write_text('{"id": 1}\n')
+    with pytest.raises(PackFileError):
+        list(iter_packs(path))
+
+
+def test_streamed_reorganize_and_export_match_in_memory(bank, table, tmp_path):
+    path, packs = bank
+    in_memory, plan = reorganize(packs)
+    streamed, streamed_plan = reorganize(iter_packs(path, table),
+                                         load=partial(read_pack, path, table=table, index=read_index(path)))
+    assert list(streamed) == in_memory
+    assert streamed_plan[0] == plan[0]
+
+    output = tmp_path / 'wordPacks.ts'
+    assert write_word_packs(output, lambda: iter(in_memory)) == (len(in_memory), True)
+    assert output.read_text(encoding='utf-8') == render_word_packs(in_memory)
+    assert write_word_packs(output, lambda: iter(in_memory)) == (len(in_memory), False)
@@ -0,0 +1,79 @@
+from collections import Counter
+
+from phonics import config
+from phonics.packfile import iter_packs
+from phonics.prerequisites import CategoryProfile, plan, prerequisites, topological_order
+from phonics.reorganize import reorganize
+
+A, SH, CH, MAGIC = '1. SHORT VOWEL A', '3. DIGRAPH SH', '3. DIGRAPH CH', '7. MAGIC E / SPLIT DIGRAPHS'
+SIGHT = '0A. YEAR 1 HIGH FREQUENCY'
+
+
+def profile(words, uses, difficulty):
+    category = CategoryProfile()
+    category.add(words)
+    category.uses = Counter(uses)
+    category.difficulty = difficulty
+    return category
+
+
+PROFILES = {
+    A: profile(['cat', 'hat', 'map', 'tap'], {'a': 4}, 1.0),
+    SH: profile(['ship', 'shop', 'fish', 'cash'], {'sh': 4, 'i': 1, 'o': 1, 'a': 1}, 2.5),
+    CH: profile(['chat', 'chap', 'chip', 'chin'], {'ch': 4, 'a': 2, 'i': 2}, 2.0),
+    MAGIC: profile(['cake', 'shake', 'make', 'tape'], {'a_e': 4, 'sh': 1}, 3.0),
+    SIGHT: profile(['the', 'shape'], {'sh': 1, 'a_e': 1}, 0.5),
+}
+
+
+def test_prerequisites_need_a_share_of_the_words():
+    assert prerequisites(PROFILES) == {
+        A: set(),
+        SH: {A},  # one word in four is not below the share
+        CH: {A},  # short i has no category here
+        MAGIC: {SH},  # its own a_e does not count
+        SIGHT: set(),
+    }
+    assert prerequisites(PROFILES, use_share=0.3)[SH] == set()
+    assert prerequisites(PROFILES, teaches={CH: ('ch',), SH: ('sh', 'a')})[CH] == {SH}
+
+
+def test_easiest_ready_node_first():
+    # a and b tie on difficulty and go by name; c is unlocked by a and is easier than b
+    order, cycles = topological_order({'b': set(), 'a': set(), 'c': {'a'}}, {'a': 1, 'b': 1, 'c': 0})
+    assert order == ['a', 'c', 'b']
+    assert cycles == []
+
+
+def test_cycle_places_easiest_node_on_it():
+    # w only comes after the cycle, and the p/q cycle waits on the x/y one
+    needs = {'x': {'y'}, 'y': {'x'}, 'z': set(), 'w': {'x'}, 'p': {'q', 'x'}, 'q': {'p'}}
+    order, cycles = topological_order(needs, {'x': 2, 'y': 1, 'z': 3, 'w': 0, 'p': 0, 'q': 0.5})
+    assert order == ['z', 'y', 'x', 'w', 'p', 'q']
+    assert cycles == [('y', ['x']), ('p', ['q'])]
+
+
+def test_plan_orders_sub_packs_and_categories():
+    sub_packs = [
+        {'name': 'Long', 'categories': [MAGIC]},
+        {'name': 'Digraphs', 'categories': [SH, CH]},
+        {'name': 'Vowels', 'categories': [A, '1. SHORT VOWEL E']},  # no short e words here
+        {'name': 'Sight', 'categories': [SIGHT]},
+    ]
+    ordered, needs, cycles = plan(PROFILES, sub_packs)
+    assert [(sub_pack['name'], categories) for sub_pack, categories in ordered] == [
+        ('Sight', [SIGHT]),
+        ('Vowels', [A]),
+        ('Digraphs', [CH, SH]),
+        ('Long', [MAGIC]),
+    ]
+    assert needs == {'Long': {'Digraphs'}, 'Digraphs': {'Vowels'}, 'Vowels': set(), 'Sight': set()}
+    assert cycles == []
+
+
+def test_word_bank_follows_phonics_order():
+    _, (ordered, _, cycles) = reorganize(iter_packs(str(config.EXTRACTED_JSON)))
+    names = [sub_pack['name'] for sub_pack, _ in ordered]
+    teaching = ['Short Vowels', 'Digraphs', 'Magic E & Long Vowels', 'Long Vowel Teams']
+    assert sorted(teaching, key=names.index) == teaching
+    assert cycles == []
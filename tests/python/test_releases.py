@@ -0,0 +1,67 @@
+import json
+
+import pytest
+
+from phonics.model import Pack, WordTable
+from phonics.releases import PatchError, apply_patch, bundle, make_patch, read_index, release, verify
+
+
+def packs(*word_lists):
+    table = WordTable()
+    return [Pack.from_words(i, f"P{i}: Pack {i}", f"{len(words)} words", f"Pack {i}", words,
+                            table=table, sub_pack='Sub')
+            for i, words in enumerate(word_lists, start=1)]
+
+
+OLD = packs(['cat', 'hat', 'map'], ['pin', 'sit'], ['ship', 'shop'])
+
+
+@pytest.mark.parametrize('new', [
+    packs(['cat', 'hat', 'map'], ['pin', 'sit'], ['ship', 'shop']),
+    packs(['cat', 'bat', 'map'], ['pin', 'sit', 'big'], ['ship']),
+    packs(['cat', 'map'], ['pin', 'sit', 'hat'], ['ship', 'shop']),  # hat moves pack
+    packs(['hat'], ['cat', 'map', 'pin'], ['sit', 'ship', 'shop']),  # several moves
+    packs(['cat', 'hat', 'map'], ['pin', 'sit']),  # pack removed
+    packs(['cat', 'hat', 'map'], ['pin', 'sit'], ['ship', 'shop'], ['chip']),  # pack added
+])
+def test_patch_round_trip(new):
+    old_bundle, new_bundle = bundle(OLD, 1), bundle(new, 2)
+    patch = make_patch(old_bundle, new_bundle)
+    assert apply_patch(old_bundle, patch) == new_bundle
+    assert old_bundle == bundle(OLD, 1)  # applied to a copy
+
+
+def test_single_word_fix_is_a_small_patch():
+    new = packs(['cat', 'bat', 'map'], ['pin', 'sit'], ['ship', 'shop'])
+    patch = make_patch(bundle(OLD, 1), bundle(new, 2))
+    assert [op for op in patch if op['path'] != '/version'] == [
+        {'op': 'replace', 'path': '/packs/1/words/1', 'value': 'bat'}]
+
+
+def test_apply_patch_errors():
+    document = bundle(OLD, 1)
+    with pytest.raises(PatchError):
+        apply_patch(document, [{'op': 'test', 'path': '/version', 'value': 2}])
+    with pytest.raises(PatchError):
+        apply_patch(document, [{'op': 'remove', 'path': '/packs/9'}])
+    with pytest.raises(PatchError):
+        apply_patch(document, [{'op': 'copy', 'from': '/version', 'path': '/x'}])
+
+
+def test_release_and_verify(tmp_path):
+    assert release(OLD, tmp_path)['version'] == 1
+    assert release(OLD, tmp_path) is None
+    new = packs(['cat', 'map'], ['pin', 'sit', 'hat'], ['ship', 'shop'])
+    entry = release(new, tmp_path)
+    assert entry['version'] == 2 and entry['patch']['file'] == 'v1-v2.patch.json'
+    assert read_index(tmp_path)['latest'] == 2
+    assert verify(new, tmp_path) == []
+    assert verify(OLD, tmp_path) == ['v2 differs from a fresh export; run `python -m phonics release`']
+
+
+def test_verify_reports_a_bad_patch(tmp_path):
+    release(OLD, tmp_path)
+    release(packs(['cat'], ['pin'], ['ship']), tmp_path)
+    (tmp_path / 'v1-v2.patch.json').write_text(json.dumps([{'op': 'remove', 'path': '/packs/1/words/7'}]))
+    problems = verify(packs(['cat'], ['pin'], ['ship']), tmp_path)
+    assert len(problems) == 1 and problems[0].startswith('v2: cannot apply')
@@ -0,0 +1,67 @@
+import json
+import uuid
+
+from phonics.model import Pack, WordTable
+from phonics.rollup import rollup, write_rollups
+
+
+def make_packs(*specs):
+    table = WordTable()
+    return [Pack.from_words(pack_id, f'P{pack_id}', '', 'C', words, table=table, sub_pack=sub_pack)
+            for pack_id, sub_pack, words in specs]
+
+
+PACKS = make_packs(
+    (1, 'Short Vowels', ['cat', 'hat', 'map']),
+    (2, 'Short Vowels', ['pin', 'sit']),
+    (3, 'Digraphs', ['ship', 'chip']),
+)
+
+
+def test_rollup_levels():
+    progress = {1: {'cat': 'tricky', 'hat': 'mastered', 'map': 'tricky'}, 2: {'sit': 'tricky'},
+                3: {'ship': 'mastered'}}
+    assert rollup(PACKS, progress) == [
+        ('pack', '1', [1, 1], [0, 2]),
+        ('pack', '2', [2], [1]),
+        ('subpack', 'Short Vowels', [1, 1, 2], [0, 2, 1]),
+        ('global', '', [1, 1, 2], [0, 2, 1]),
+    ]
+
+
+def test_first_pack_without_sub_pack():
+    packs = make_packs((1, None, ['cat']), (2, 'Digraphs', ['ship']))
+    assert rollup(packs, {1: {'cat': 'tricky'}, 2: {'ship': 'tricky'}}) == [
+        ('pack', '1', [1], [0]),
+        ('pack', '2', [2], [0]),
+        ('subpack', 'Digraphs', [2], [0]),
+        ('global', '', [1, 2], [0, 0]),
+    ]
+
+
+def test_non_contiguous_sub_pack_gets_one_row():
+    packs = make_packs((1, 'A', ['cat']), (2, 'B', ['ship']), (3, 'A', ['pin']))
+    rows = rollup(packs, {1: {'cat': 'tricky'}, 2: {'ship': 'tricky'}, 3: {'pin': 'tricky'}})
+    keys = [(level, scope) for level, scope, _, _ in rows]
+    assert len(keys) == len(set(keys))
+    assert ('subpack', 'A', [1, 3], [0, 0]) in rows
+
+
+def test_no_progress():
+    assert rollup(PACKS, {}) == []
+    assert rollup(PACKS, {1: {'cat': 'mastered'}}) == []
+
+
+def test_write_rollups(database):
+    user_id = str(uuid.uuid4())
+    with database, database.cursor() as cur:
+        for pack_id, words in ((1, {'cat': 'tricky'}), (3, {'ship': 'tricky'})):
+            cur.execute('INSERT INTO pack_progress (user_id, pack_id, words) VALUES (%s, %s, %s)',
+                        (user_id, pack_id, json.dumps(words)))
+        cur.execute("INSERT INTO tricky_words (user_id, level, scope) VALUES (%s, 'pack', '2')", (user_id,))
+
+    assert write_rollups(database, PACKS) == (1, 5)
+    with database.cursor() as cur:
+        cur.execute('SELECT level, scope, pack_ids FROM tricky_words ORDER BY level, scope')
+        assert cur.fetchall() == [('global', '', [1, 3]), ('pack', '1', [1]), ('pack', '3', [3]),
+                                  ('subpack', 'Digraphs', [3]), ('subpack', 'Short Vowels', [1])]
@@ -0,0 +1,62 @@
+import json
+import uuid
+from datetime import date, datetime, timedelta, timezone
+
+from phonics import schedule as schedule_module
+from phonics.schedule import build_queue, end_of_day, interval_days, schedule, today
+
+UTC = timezone.utc
+DAY = date(2026, 10, 19)
+# Same progress as tests/utils/reviewQueue.test.ts, so the two stay in step
+ROWS = [
+    (None, 3, {'cat': 'tricky', 'hat': 'mastered', 'map': 'starred'}, {'bag': 'starred'}, 0,
+     datetime(2026, 10, 17, 8, tzinfo=UTC)),
+    (None, 7, {'ship': 'mastered', 'fish': 'tricky'}, {}, 3, datetime(2026, 10, 1, 8, tzinfo=UTC)),
+    (None, 9, {'chip': 'mastered'}, {}, 2, datetime(2026, 10, 18, 8, tzinfo=UTC)),
+]
+
+
+def test_interval_days():
+    assert [interval_days(5, n) for n in range(1, 6)] == [1, 6, 16, 45, 131]
+    assert [interval_days(2, n) for n in range(1, 4)] == [1, 1, 1]
+
+
+def test_build_queue_most_overdue_first():
+    assert build_queue(ROWS, end_of_day(DAY)) == [
+        (7, 'fish'), (3, 'bag'), (7, 'ship'), (3, 'cat'), (3, 'hat')]
+    assert build_queue(ROWS, end_of_day(DAY), limit=2) == [(7, 'fish'), (3, 'bag')]
+    assert (9, 'chip') in build_queue(ROWS, end_of_day(DAY + timedelta(days=5)))
+
+
+def test_day_boundary_is_utc_midnight():
+    until = end_of_day(DAY)
+    assert until == datetime(2026, 10, 20, tzinfo=UTC)
+    row = (None, 1, {'cat': 'tricky'}, {}, 1, until - timedelta(days=1, seconds=1))
+    assert build_queue([row], until) == [(1, 'cat')]
+    row = (None, 1, {'cat': 'tricky'}, {}, 1, until - timedelta(days=1) + timedelta(seconds=1))
+    assert build_queue([row], until) == []
+
+
+def test_today_is_the_utc_date(monkeypatch):
+    class LateEvening(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            # 23:30 in New York is already the next day in UTC
+            return datetime(2026, 10, 20, 3, 30, tzinfo=UTC).astimezone(tz)
+
+    monkeypatch.setattr(schedule_module, 'datetime', LateEvening)
+    assert today() == date(2026, 10, 20)
+
+
+def test_schedule_writes_queue(database):
+    user_id = str(uuid.uuid4())
+    with database, database.cursor() as cur:
+        for _, pack_id, words, starred, completions, reviewed in ROWS:
+            cur.execute('INSERT INTO pack_progress (user_id, pack_id, words, starred, completion_count, '
+                        'last_reviewed) VALUES (%s, %s, %s, %s, %s, %s)',
+                        (user_id, pack_id, json.dumps(words), json.dumps(starred), completions, reviewed))
+
+    assert schedule(database, DAY) == (1, 5)
+    with database.cursor() as cur:
+        cur.execute('SELECT queue_date, pack_ids, words FROM review_queue')
+        assert cur.fetchall() == [(DAY, [7, 3, 7, 3, 3], ['fish', 'bag', 'ship', 'cat', 'hat'])]
@@ -0,0 +1,50 @@
+import json
+
+from phonics import config
+from phonics.appdata import read_word_packs
+from phonics.model import Pack, WordTable
+from phonics.search import SearchIndex
+
+
+def index():
+    table = WordTable()
+    return SearchIndex([
+        Pack.from_words(21, 'P21: Short Vowel I - Pack 2', '', 'I', ['fish', 'I', 'ship', 'wish', 'Fish'],
+                        table=table, sub_pack='Short Vowels'),
+        Pack.from_words(39, 'P39: SH Digraph - Pack 1', '', 'SH', ['ship', 'shop', 'fish'],
+                        table=table, sub_pack='Digraphs'),
+    ])
+
+
+def test_prefix_then_substring():
+    search = index()
+    assert [word for word, _ in search.search('sh')] == ['ship', 'shop']
+    assert [word for word, _ in search.search('ish')] == ['fish', 'wish']
+    assert [word for word, _ in search.search('ish', limit=1)] == ['fish']
+    assert [word for word, _ in search.search('fis')] == ['fish']  # not again as a substring
+    assert search.search('  ') == [] and search.search('xyz') == []
+
+
+def test_results_list_every_pack_once():
+    assert index().search('I') == [('I', [(21, 'P21: Short Vowel I - Pack 2', 'Short Vowels')])]
+    assert index().search('FISH') == [('fish', [(21, 'P21: Short Vowel I - Pack 2', 'Short Vowels'),
+                                               (39, 'P39: SH Digraph - Pack 1', 'Digraphs')])]
+
+
+def test_json_layout():
+    # The same data as the fixture in tests/utils/wordSearch.test.ts
+    assert json.loads(index().to_json()) == {
+        'version': 1,
+        'subPacks': ['Short Vowels', 'Digraphs'],
+        'packs': [[21, 'P21: Short Vowel I - Pack 2', 0], [39, 'P39: SH Digraph - Pack 1', 1]],
+        'words': ['fish', 'I', 'ship', 'shop', 'wish'],
+        'wordPacks': [[0, 1], 0, [0, 1], 1, 0],
+        'ngrams': {'fis': [0], 'hip': [2], 'hop': [3], 'ish': [0, 4], 'shi': [2], 'sho': [3], 'wis': [4]},
+    }
+
+
+def test_committed_index_matches_the_bank():
+    with open(config.SEARCH_INDEX_JSON, 'r', encoding='utf-8') as f:
+        committed = f.read()
+    assert committed == SearchIndex(read_word_packs()).to_json(), \
+        'public/search-index.json is stale; run `python -m phonics search`'
@@ -0,0 +1,92 @@
+import asyncio
+import gzip
+import json
+
+import pytest
+
+from phonics.server import PackStore, accepts_gzip, handle, respond
+
+
+@pytest.fixture(scope='module')
+def store():
+    return PackStore()
+
+
+@pytest.mark.parametrize('header, expected', [
+    ('gzip', True),
+    ('gzip, deflate, br', True),
+    ('deflate, GZIP;q=0.5', True),
+    ('*', True),
+    ('', False),
+    ('identity', False),
+    ('gzip;q=0', False),
+    ('gzip; q=0.0, deflate', False),
+    ('gzip;q=0, *', False),
+    ('*;q=0', False),
+    ('gzip;q=oops', False),
+])
+def test_accepts_gzip(header, expected):
+    assert accepts_gzip(header) is expected
+
+
+def test_etag_revalidation(store):
+    status, extra, body = respond(store, 'GET', '/packs/1.json', {})
+    assert status == 200 and 'Content-Encoding' not in extra
+    assert json.loads(body)['id'] == 1
+    etag = extra['ETag']
+
+    assert respond(store, 'GET', '/packs/1.json?v=2', {'if-none-match': etag}) == (
+        304, {'ETag': etag, 'Cache-Control': 'no-cache', 'Vary': 'Accept-Encoding'}, b'')
+    assert respond(store, 'GET', '/packs/1.json', {'if-none-match': f'"other", W/{etag}'})[0] == 304
+    assert respond(store, 'GET', '/packs/1.json', {'if-none-match': '*'})[0] == 304
+    assert respond(store, 'GET', '/packs/2.json', {'if-none-match': etag})[0] == 200
+
+
+def test_gzip_is_its_own_representation(store):
+    plain = respond(store, 'GET', '/syllables.json', {'accept-encoding': 'gzip;q=0'})
+    status, extra, body = respond(store, 'GET', '/syllables.json', {'accept-encoding': 'gzip'})
+    assert status == 200 and extra['Content-Encoding'] == 'gzip'
+    assert gzip.decompress(body) == plain[2]
+    assert extra['ETag'] != plain[1]['ETag']
+    # The plain ETag does not validate the gzip copy
+    assert respond(store, 'GET', '/syllables.json', {'accept-encoding': 'gzip',
+                                                     'if-none-match': plain[1]['ETag']})[0] == 200
+
+
+def test_not_found_and_methods(store):
+    assert respond(store, 'GET', '/packs/0.json', {})[0] == 404
+    assert respond(store, 'POST', '/packs.json', {})[:2] == (405, {'Allow': 'GET, HEAD'})
+
+
+def exchange(store, request):
+    """Send ``request`` on one connection and read until the server closes it."""
+    async def main():
+        server = await asyncio.start_server(lambda r, w: handle(store, r, w), '127.0.0.1', 0)
+        port = server.sockets[0].getsockname()[1]
+        async with server:
+            reader, writer = await asyncio.open_connection('127.0.0.1', port)
+            writer.write(request)
+            await writer.drain()
+            data = await asyncio.wait_for(reader.read(), 5)
+            writer.close()
+            return data
+    return asyncio.run(main())
+
+
+def statuses(data):
+    return [line.split()[1] for line in data.split(b'\r\n') if line.startswith(b'HTTP/1.1 ')]
+
+
+def test_request_body_is_drained(store):
+    data = exchange(store, b'POST /packs.json HTTP/1.1\r\nContent-Length: 19\r\n\r\nGET /x HTTP/1.1\r\n\r\n'
+                           b'HEAD /packs/1.json HTTP/1.1\r\nConnection: close\r\n\r\n')
+    assert statuses(data) == [b'405', b'200']
+
+
+def test_oversized_or_chunked_body_closes(store):
+    data = exchange(store, b'POST /packs.json HTTP/1.1\r\nContent-Length: 1000000\r\n\r\n'
+                           b'GET /packs/1.json HTTP/1.1\r\n\r\n')
+    assert statuses(data) == [b'413'] and b'Connection: close' in data
+    data = exchange(store, b'PUT /packs.json HTTP/1.1\r\nTransfer-Encoding: chunked\r\n\r\n'
+                           b'4\r\nGET \r\n0\r\n\r\n')
+    assert statuses(data) == [b'405']
@@ -0,0 +1,51 @@
+import random
+import string
+
+from phonics import config
+from phonics.model import Pack, WordTable
+from phonics.spelling import Lexicon, known, load_lexicon, unknown_words
+
+WORDS = ['cat', 'hat', 'ice', 'cream', 'pupil', 'tee', 'shirt', 'zebra']
+
+
+def test_membership_is_exact():
+    rng = random.Random(0)
+    words = {''.join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 9))) for _ in range(3000)}
+    lexicon = Lexicon.build(words)
+    assert len(lexicon) == len(words)
+    assert all(word in lexicon for word in words)
+    others = {''.join(rng.choices(string.ascii_lowercase, k=6)) for _ in range(3000)} - words
+    assert not any(word in lexicon for word in others)
+
+
+def test_case_insensitive():
+    lexicon = Lexicon.build(WORDS)
+    assert 'Zebra' in lexicon
+    assert 'zebr' not in lexicon and 'zebras' not in lexicon
+    assert '' not in Lexicon.build([])
+
+
+def test_known_checks_parts_and_possessives():
+    lexicon = Lexicon.build(WORDS)
+    assert known(lexicon, 'ice-cream')
+    assert known(lexicon, 'tee shirt')
+    assert known(lexicon, "pupil's")
+    assert not known(lexicon, 'ice-lolly')
+
+
+def test_unknown_words():
+    table = WordTable()
+    packs = [Pack.from_words(1, 'P1', '', 'A', ['cat', 'hta'], table=table),
+             Pack.from_words(2, 'P2', '', 'B', ['hta', 'zebra'], table=table)]
+    assert unknown_words(Lexicon.build(WORDS), packs) == {'hta': [1, 2]}
+
+
+def test_load_lexicon_caches(tmp_path):
+    wordlist = tmp_path / 'wordlist.txt'
+    wordlist.write_text('12\nCat/S\nhat 7\n', encoding='utf-8')
+    assert load_lexicon(tmp_path / 'missing.txt') is None
+    lexicon = load_lexicon(wordlist)
+    assert 'cat' in lexicon and 'hat' in lexicon and len(lexicon) == 2
+    assert list(config.CACHE_DIR.glob('lexicon-*.bin'))
+    cached = load_lexicon(wordlist)
+    assert (cached.bloom, cached.blob, cached.heads) == (lexicon.bloom, lexicon.blob, lexicon.heads)
@@ -0,0 +1,87 @@
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from phonics.model import Pack, WordTable
+from phonics.variants import Bank, Variants, VariantError, apply_overlay, sharing
+
+
+def base_bank(table):
+    rows = [('A', 'short a', ['cat', 'hat', 'mum']), ('I', 'short i', ['pin', 'mum', 'gal']),
+            ('SH', 'sh', ['ship', 'shop'])]
+    packs = [Pack.from_words(i, category, description, category, words, table=table)
+             for i, (category, description, words) in enumerate(rows)]
+    return Bank('base', packs, SimpleNamespace())
+
+
+def test_overlay_changes_in_order():
+    table = WordTable()
+    base = base_bank(table)
+    bank = apply_overlay(base, 'school', {
+        'rename_words': {'mum': 'mam'},
+        'remove_words': {'A': ['hat'], '*': ['gal']},
+        'add_words': {'A': ['zap', 'cat'], 'I': ['mam']},
+        'remove_packs': ['SH'],
+        'rename_packs': {'A': 'SHORT A'},
+        'add_packs': [['TOPIC', 'this term', 'volcano, lava']],
+    }, table)
+    assert [(p.id, p.category, p.words) for p in bank.packs] == [
+        (0, 'SHORT A', ['cat', 'mam', 'zap']),
+        (1, 'I', ['pin', 'mam']),
+        (3, 'TOPIC', ['volcano', 'lava']),
+    ]
+    assert bank.rows()[2] == ('TOPIC', 'this term', 'volcano, lava')
+    # The base is untouched
+    assert [p.words for p in base.packs] == [['cat', 'hat', 'mum'], ['pin', 'mum', 'gal'], ['ship', 'shop']]
+
+
+def test_untouched_packs_are_shared():
+    table = WordTable()
+    base = base_bank(table)
+    bank = apply_overlay(base, 'school', {'add_words': {'SH': ['fish']}, 'remove_words': {'A': ['zebra']}}, table)
+    assert bank.packs[0] is base.packs[0] and bank.packs[1] is base.packs[1]
+    assert sharing(bank, base) == (2, 1)
+
+
+def test_unknown_pack():
+    table = WordTable()
+    with pytest.raises(VariantError, match="no pack 'Q'"):
+        apply_overlay(base_bank(table), 'school', {'add_words': {'Q': ['queen']}}, table)
+
+
+def write(directory, name, overlay):
+    (directory / f'{name}.json').write_text(json.dumps(overlay), encoding='utf-8')
+
+
+def test_variants_resolve_once_over_their_base(tmp_path):
+    write(tmp_path, 'oakfield', {'base': 'comprehensive', 'add_packs': [['9. TOPIC', '', 'volcano']]})
+    write(tmp_path, 'oakfield-y1', {'base': 'oakfield', 'remove_packs': ['9. TOPIC']})
+    variants = Variants(tmp_path, WordTable())
+    assert variants.names() == ['oakfield', 'oakfield-y1']
+
+    comprehensive = variants.get('comprehensive')
+    oakfield, year1 = variants.get('oakfield'), variants.get('oakfield-y1')
+    assert variants.get('oakfield') is oakfield
+    assert oakfield.packs[-1].category == '9. TOPIC'
+    assert len(oakfield.packs) == len(comprehensive.packs) + 1
+    assert [p.category for p in year1.packs] == [p.category for p in comprehensive.packs]
+    assert sharing(year1, comprehensive) == (len(comprehensive.packs), 0)
+    assert year1.module is comprehensive.module
+
+
+def test_bad_overlays(tmp_path):
+    write(tmp_path, 'a', {'base': 'b'})
+    write(tmp_path, 'b', {'base': 'a'})
+    write(tmp_path, 'typo', {'base': 'comprehensive', 'add_word': {}})
+    write(tmp_path, 'orphan', {'description': 'no base'})
+    variants = Variants(tmp_path, WordTable())
+    with pytest.raises(VariantError, match='cycle: a -> b -> a'):
+        variants.get('a')
+    with pytest.raises(VariantError, match='unknown keys add_word'):
+        variants.get('typo')
+    with pytest.raises(VariantError, match='no base'):
+        variants.get('orphan')
+    with pytest.raises(VariantError, match="Unknown variant 'missing'"):
+        variants.get('missing')
+    assert Variants(tmp_path / 'none').names() == []
@@ -0,0 +1,55 @@
+from phonics.extract import extract_packs
+from phonics.model import WordTable
+from phonics.reorganize import reorganize
+from phonics.watch import PackBuild, diff_rows
+
+ROWS = [
+    ('1. SHORT VOWEL A', 'Short a', 'cat, hat, map, bag, pan, jam'),
+    ('1. SHORT VOWEL I', 'Short i', 'pin, sit, big, tip, wig, lid'),
+    ('3. DIGRAPH SH', 'sh', 'ship, shop, fish, dish, shed, rush'),
+]
+HARD_A = 'catamaran, abracadabra, salamander, caravan, anaconda, banana'
+
+
+def fresh(rows):
+    packs, _ = reorganize(extract_packs(rows, table=WordTable()))
+    return [p.to_dict() for p in packs]
+
+
+def test_word_edit_is_not_structural():
+    edited = [ROWS[0][:2] + (HARD_A,)] + ROWS[1:]
+    assert diff_rows(ROWS, edited) == ([0], False)
+
+
+def test_word_edit_matches_fresh_build():
+    build = PackBuild()
+    build.update(ROWS)
+    assert [p.to_dict() for p in build.reorganized] == fresh(ROWS)
+    first = [p.category for p in build.reorganized]
+
+    edited = [ROWS[0][:2] + (HARD_A,)] + ROWS[1:]
+    stages = build.update(edited)
+
+    assert [p.to_dict() for p in build.reorganized] == fresh(edited)
+    assert [p.category for p in build.reorganized] != first
+    assert stages == ['patch', 'reorder']
+
+
+def test_word_edit_keeping_order_is_a_patch():
+    build = PackBuild()
+    build.update(ROWS)
+    edited = [ROWS[0][:2] + ('cat, hat, map, bag, pan, jam, ram',)] + ROWS[1:]
+    assert build.update(edited) == ['patch']
+    assert [p.to_dict() for p in build.reorganized] == fresh(edited)
+
+
+def test_export_leaves_app_data_alone(tmp_path, monkeypatch):
+    from phonics import config
+
+    for name in ('EXTRACTED_JSON', 'REORGANIZED_JSON', 'WORD_PACKS_TS', 'WATCH_PACKS_TS'):
+        monkeypatch.setattr(config, name, tmp_path / name.lower())
+    build = PackBuild()
+    build.update(ROWS)
+    assert config.WATCH_PACKS_TS in build.export()
+    assert not config.WORD_PACKS_TS.exists()
+    assert build.export(config.WORD_PACKS_TS) == [config.WORD_PACKS_TS]
@@ -0,0 +1,33 @@
+import pytest
+
+pytest.importorskip('openpyxl')
+
+from phonics import workbook  # noqa: E402
+
+ROWS = [('1. SHORT VOWEL A', 'Short a', 'cat, hat'), ('1. SHORT VOWEL I', 'Short i', 'pin, sit')]
+EDITED = [ROWS[0], ('1. SHORT VOWEL I', 'Short i', 'pin, sit, big')]
+
+
+def test_snapshot_is_reused_and_refreshed(tmp_path):
+    path = tmp_path / 'bank.xlsx'
+    workbook.write_rows(path, ROWS, 'Words')
+    assert workbook.read_rows(path) == ROWS
+    assert workbook.read_rows(path) == ROWS
+
+    workbook.write_rows(path, EDITED, 'Words')
+    assert workbook.read_rows(path) == EDITED
+
+
+def test_save_during_parse_is_not_cached_as_the_new_file(tmp_path, monkeypatch):
+    path = tmp_path / 'bank.xlsx'
+    workbook.write_rows(path, ROWS, 'Words')
+    parse_rows = workbook.parse_rows
+
+    def save_while_parsing(f):
+        workbook.write_rows(path, EDITED, 'Words')
+        return parse_rows(f)
+
+    monkeypatch.setattr(workbook, 'parse_rows', save_while_parsing)
+    assert workbook.read_rows(path) == ROWS
+    monkeypatch.setattr(workbook, 'parse_rows', parse_rows)
+    assert workbook.read_rows(path) == EDITED
@@ -0,0 +1,152 @@
+/**
+ * Tests for word bank releases
+ */
+
+import { describe, it, expect, afterEach, vi } from 'vitest';
+import {
+  applyPatch,
+  bundleHash,
+  loadLatestRelease,
+  releasePacks,
+  PatchError,
+  type PatchOperation,
+  type ReleaseBundle,
+  type ReleaseIndex,
+} from '@/utils/releases';
+
+// Bundles, patch and hashes as `python -m phonics release` writes them
+const v1 = (): ReleaseBundle => ({
+  version: 1,
+  packs: {
+    '1': { category: 'P1: A', subPack: 'Short Vowels', description: 'short a', words: ['cat', 'hat', 'map'] },
+    '2': { category: 'P2: SH', subPack: 'Digraphs', description: 'sh', words: ['ship', 'shop', 'fish'] },
+    '10': { category: 'P10: Café', subPack: 'Advanced Vocabulary', description: 'loan words', words: ['café'] },
+  },
+});
+const V1_SHA = 'bfc78b7c97488ceac34d0c576bb59bd47d4450cff74bd73b04c7c4a01ae48a46';
+const V2_SHA = '29d0d9ca6ec8932cc6810f55e9e839899e7f688e9dfb528f73deef961328eabf';
+const patch: PatchOperation[] = [
+  { op: 'test', path: '/version', value: 1 },
+  { op: 'replace', path: '/version', value: 2 },
+  { op: 'replace', path: '/packs/2/description', value: 'sh digraph' },
+  { op: 'add', path: '/packs/2/words/3', value: 'wish' },
+  { op: 'move', from: '/packs/2/words/0', path: '/packs/1/words/3' },
+];
+const index: ReleaseIndex = {
+  latest: 2,
+  releases: [
+    { version: 1, file: 'v1.json', size: 0, sha256: V1_SHA },
+    { version: 2, file: 'v2.json', size: 0, sha256: V2_SHA, patch: { file: 'v1-v2.patch.json', ops: 5, size: 0 } },
+  ],
+};
+
+function v2(): ReleaseBundle {
+  return applyPatch(v1(), patch);
+}
+
+function serve(files: Record<string, unknown>) {
+  const fetchMock = vi.fn(async (url: string) => {
+    const name = url.split('/').pop()!;
+    if (!(name in files)) return new Response('', { status: 404 });
+    const body = files[name];
+    return new Response(typeof body === 'string' ? body : JSON.stringify(body));
+  });
+  vi.stubGlobal('fetch', fetchMock);
+  return fetchMock;
+}
+
+function fetched(fetchMock: ReturnType<typeof serve>): string[] {
+  return fetchMock.mock.calls.map(([url]) => url.split('/').pop()!);
+}
+
+describe('Releases', () => {
+  afterEach(() => {
+    vi.unstubAllGlobals();
+  });
+
+  describe('applyPatch', () => {
+    it('should apply a release patch', () => {
+      expect(v2()).toEqual({
+        version: 2,
+        packs: {
+          '1': { category: 'P1: A', subPack: 'Short Vowels', description: 'short a', words: ['cat', 'hat', 'map', 'ship'] },
+          '2': { category: 'P2: SH', subPack: 'Digraphs', description: 'sh digraph', words: ['shop', 'fish', 'wish'] },
+          '10': { category: 'P10: Café', subPack: 'Advanced Vocabulary', description: 'loan words', words: ['café'] },
+        },
+      });
+    });
+
+    it('should add and remove packs', () => {
+      const bundle = applyPatch(v1(), [
+        { op: 'remove', path: '/packs/10' },
+        { op: 'add', path: '/packs/3', value: { category: 'P3', subPack: 'S', description: '', words: [] } },
+        { op: 'remove', path: '/packs/1/words/0' },
+      ]);
+      expect(Object.keys(bundle.packs)).toEqual(['1', '2', '3']);
+      expect(bundle.packs['1'].words).toEqual(['hat', 'map']);
+    });
+
+    it('should reject a patch for another version or a bad path', () => {
+      expect(() => applyPatch(v2(), patch)).toThrow(PatchError);
+      expect(() => applyPatch(v1(), [{ op: 'remove', path: '/packs/7/words/0' }])).toThrow(PatchError);
+      expect(() => applyPatch(v1(), [{ op: 'add', path: '/packs/1/words/9', value: 'x' }])).toThrow(PatchError);
+    });
+  });
+
+  describe('bundleHash', () => {
+    it('should hash bundles the way the release job does', async () => {
+      expect(await bundleHash(v1())).toBe(V1_SHA);
+      expect(await bundleHash(v2())).toBe(V2_SHA);
+    });
+  });
+
+  describe('loadLatestRelease', () => {
+    it('should download the latest bundle the first time', async () => {
+      const fetchMock = serve({ 'index.json': index, 'v2.json': JSON.stringify(v2()) + '\n' });
+      expect(await loadLatestRelease()).toEqual(v2());
+      expect(fetched(fetchMock)).toEqual(['index.json', 'v2.json']);
+    });
+
+    it('should patch forward from the stored release', async () => {
+      localStorage.setItem('phonics-app-bank-release', JSON.stringify(v1()));
+      const fetchMock = serve({ 'index.json': index, 'v1-v2.patch.json': patch });
+      expect(await loadLatestRelease()).toEqual(v2());
+      expect(fetched(fetchMock)).toEqual(['index.json', 'v1-v2.patch.json']);
+
+      // Up to date: only the index
+      expect(await loadLatestRelease()).toEqual(v2());
+      expect(fetched(fetchMock)).toEqual(['index.json', 'v1-v2.patch.json', 'index.json']);
+    });
+
+    it('should fall back to the full bundle when a patch does not verify', async () => {
+      localStorage.setItem('phonics-app-bank-release', JSON.stringify(v1()));
+      const wrong = [...patch, { op: 'add', path: '/packs/1/words/0', value: 'bat' }];
+      const fetchMock = serve({ 'index.json': index, 'v1-v2.patch.json': wrong, 'v2.json': JSON.stringify(v2()) + '\n' });
+      expect(await loadLatestRelease()).toEqual(v2());
+      expect(fetched(fetchMock)).toEqual(['index.json', 'v1-v2.patch.json', 'v2.json']);
+    });
+
+    it('should keep the built-in packs when nothing verifies', async () => {
+      serve({ 'index.json': index, 'v2.json': JSON.stringify(v1()) });
+      expect(await loadLatestRelease()).toBeNull();
+      expect(localStorage.getItem('phonics-app-bank-release')).toBeNull();
+    });
+  });
+
+  describe('releasePacks', () => {
+    it('should keep fields the bundle leaves out', () => {
+      const packs = releasePacks(v2(), [
+        { id: 1, category: 'old', subPack: 'old', words: [], patterns: ['short-a'] },
+      ]);
+      expect(packs[0]).toEqual({
+        id: 1,
+        category: 'P1: A',
+        subPack: 'Short Vowels',
+        description: 'short a',
+        words: ['cat', 'hat', 'map', 'ship'],
+        patterns: ['short-a'],
+      });
+      expect(packs.map((p) => p.id)).toEqual([1, 2, 10]);
+    });
+  });
+});
@@ -0,0 +1,83 @@
+/**
+ * Tests for the client-side review queue
+ */
+
+import { describe, it, expect } from 'vitest';
+import { buildReviewQueue, intervalDays, queueDate } from '@/utils/reviewQueue';
+import type { UserProgress } from '@/types';
+
+// Same progress as the rows `phonics.schedule.build_queue` was checked against
+const progress: UserProgress = {
+  '3': {
+    words: { cat: 'tricky', hat: 'mastered', map: 'starred' },
+    starred: { bag: 'starred' },
+    completed: false,
+    completionCount: 0,
+    lastReviewed: '2026-10-17T08:00:00Z',
+  },
+  '7': {
+    words: { ship: 'mastered', fish: 'tricky' },
+    completed: true,
+    completionCount: 3,
+    lastReviewed: '2026-10-01T08:00:00Z',
+  },
+  '9': {
+    words: { chip: 'mastered' },
+    completed: true,
+    completionCount: 2,
+    lastReviewed: '2026-10-18T08:00:00Z',
+  },
+  C1: {
+    words: { zebra: 'tricky' },
+    completed: false,
+    lastReviewed: '2026-10-01T08:00:00Z',
+  },
+  '12': {
+    words: { rain: 'tricky' },
+    completed: false,
+    lastReviewed: null,
+  },
+};
+
+describe('Review queue', () => {
+  describe('intervalDays', () => {
+    it('should stretch mastered words by the ease factor', () => {
+      expect([1, 2, 3, 4, 5].map((n) => intervalDays(5, n))).toEqual([1, 6, 16, 45, 131]);
+    });
+
+    it('should keep tricky words at one day', () => {
+      expect([1, 2, 3].map((n) => intervalDays(2, n))).toEqual([1, 1, 1]);
+    });
+  });
+
+  describe('buildReviewQueue', () => {
+    it('should match the nightly job, most overdue first', () => {
+      expect(buildReviewQueue(progress, '2026-10-19')).toEqual([
+        { packId: 7, word: 'fish' },
+        { packId: 3, word: 'bag' },
+        { packId: 7, word: 'ship' },
+        { packId: 3, word: 'cat' },
+        { packId: 3, word: 'hat' },
+      ]);
+    });
+
+    it('should stop at the limit', () => {
+      expect(buildReviewQueue(progress, '2026-10-19', 2)).toEqual([
+        { packId: 7, word: 'fish' },
+        { packId: 3, word: 'bag' },
+      ]);
+    });
+
+    it('should include words that fall due later', () => {
+      const later = buildReviewQueue(progress, '2026-10-24');
+      expect(later).toContainEqual({ packId: 9, word: 'chip' });
+      expect(later).not.toContainEqual({ packId: 12, word: 'rain' });
+    });
+  });
+
+  describe('queueDate', () => {
+    it('should give the UTC day', () => {
+      expect(queueDate(new Date('2026-10-19T23:30:00Z'))).toBe('2026-10-19');
+    });
+  });
+});
@@ -0,0 +1,60 @@
+/**
+ * Tests for the word search index
+ */
+
+import { describe, it, expect } from 'vitest';
+import { WordSearchIndex, type SearchIndexData } from '@/utils/wordSearch';
+
+// Same layout as `python -m phonics search` writes
+const data: SearchIndexData = {
+  version: 1,
+  subPacks: ['Short Vowels', 'Digraphs'],
+  packs: [
+    [21, 'P21: Short Vowel I - Pack 2', 0],
+    [39, 'P39: SH Digraph - Pack 1', 1],
+  ],
+  words: ['fish', 'I', 'ship', 'shop', 'wish'],
+  wordPacks: [[0, 1], 0, [0, 1], 1, 0],
+  ngrams: {
+    fis: [0],
+    hip: [2],
+    hop: [3],
+    ish: [0, 4], // fish, wish
+    shi: [2],
+    sho: [3],
+    wis: [4],
+  },
+};
+
+describe('WordSearchIndex', () => {
+  const index = new WordSearchIndex(data);
+
+  it('should find words by prefix in order', () => {
+    expect(index.search('sh').map((r) => r.word)).toEqual(['ship', 'shop']);
+  });
+
+  it('should match case-insensitively', () => {
+    expect(index.search('i').map((r) => r.word)).toEqual(['I']);
+  });
+
+  it('should add substring matches after prefix matches', () => {
+    expect(index.search('ish').map((r) => r.word)).toEqual(['fish', 'wish']);
+  });
+
+  it('should return every pack a word is in', () => {
+    const [ship] = index.search('ship');
+    expect(ship.packs).toEqual([
+      { id: 21, category: 'P21: Short Vowel I - Pack 2', subPack: 'Short Vowels' },
+      { id: 39, category: 'P39: SH Digraph - Pack 1', subPack: 'Digraphs' },
+    ]);
+  });
+
+  it('should respect the limit', () => {
+    expect(index.search('s', 1)).toHaveLength(1);
+  });
+
+  it('should return nothing for unknown or empty queries', () => {
+    expect(index.search('xyz')).toEqual([]);
+    expect(index.search('  ')).toEqual([]);
+  });
+});
@@ -1,7 +1,11 @@
 import { defineConfig } from 'vite';
 import { resolve } from 'path';
 
-export default defineConfig({
+// `vite --mode watch` (npm run dev:watch) serves the packs that `python -m phonics watch`
+// rebuilds from the workbook instead of the curated src/data/wordPacks.ts
+const watchPacks = resolve(__dirname, process.env.PHONICS_WATCH_PACKS_TS || 'wordPacks.watch.ts');
+
+export default defineConfig(({ mode }) => ({
   base: '/reading-phonics-app/',
   root: '.',
   publicDir: 'public',
@@ -15,12 +19,13 @@ export default defineConfig({
     }
   },
   resolve: {
-    alias: {
-      '@': resolve(__dirname, './src')
-    }
+    alias: [
+      ...(mode === 'watch' ? [{ find: /^@\/data\/wordPacks$/, replacement: watchPacks }] : []),
+      { find: '@', replacement: resolve(__dirname, './src') }
+    ]
   },
   server: {
     port: 3000,
     open: true
   }
-});
+}));